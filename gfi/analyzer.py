@@ -1,12 +1,43 @@
 """Profile analyzer to understand user interests."""
 
 from collections import Counter
-from typing import List, Union
-from .github import GitHubClient, UserProfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Union
+from pydantic import BaseModel, field_validator
+from .github import GitHubClient, UserProfile, parse_timestamp
+
+
+class ProfileSnapshot(BaseModel):
+    """Starred-repo counts a profile refresh builds on."""
+    username: str
+    language_counts: Dict[str, int] = {}
+    topic_counts: Dict[str, int] = {}
+    starred_count: int = 0
+    newest_starred_at: Optional[datetime] = None
+    own_languages: List[str] = []
+    contributed_count: int = 0
+    taken_at: datetime
+    refreshed_at: Optional[datetime] = None
+
+    @field_validator("taken_at", "refreshed_at")
+    @classmethod
+    def _assume_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Older snapshots were saved with naive UTC times."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
 
 
 class ProfileAnalyzer:
-    """Analyzes a user's GitHub activity to build interest profile."""
+    """Analyzes a user's GitHub activity to build interest profile.
+
+    Counts from starred repos are kept in a snapshot (in the client's cache),
+    so a refresh only fetches the stars added since the last build. Within
+    the cache's PROFILE_TTL_MINUTES of a refresh the snapshot is used as is.
+    """
+
+    SNAPSHOT_MAX_AGE_DAYS = 7  # Rebuild from scratch to pick up unstars and repo changes
 
     def __init__(self, client: Union[GitHubClient, 'GitHubGraphQLClient']):
         self.client = client
@@ -16,46 +47,130 @@ class ProfileAnalyzer:
 
         # Check if using GraphQL client
         from .graphql import GitHubGraphQLClient
-        if isinstance(self.client, GitHubGraphQLClient):
-            if username is None:
+        use_graphql = isinstance(self.client, GitHubGraphQLClient)
+        if username is None:
+            if use_graphql:
                 # For GraphQL, we need username upfront
-                # Fall back to getting from REST
                 raise ValueError("Username required for GraphQL profile analysis")
-            return self.client.get_user_profile(username)
+            username = self.client.get_user()["login"]
 
-        # REST API path (original implementation)
-        if username is None:
-            user = self.client.get_user()
-            username = user["login"]
+        snapshot = self.load_snapshot(username)
+        if snapshot is None or not self._reuse_snapshot(snapshot, use_graphql):
+            snapshot = self.refresh_snapshot(username, snapshot, use_graphql)
 
-        # Get starred repos
-        starred = self.client.get_user_starred(username)
+        # Languages come from starred and own repos, topics from starred repos
+        lang_counts = Counter(snapshot.language_counts)
+        lang_counts.update(snapshot.own_languages)
+        topic_counts = Counter(snapshot.topic_counts)
 
-        # Get user's own repos
-        own_repos = self.client.get_user_repos(username)
+        return UserProfile(
+            username=snapshot.username,
+            languages=[lang for lang, _ in lang_counts.most_common(10)],
+            topics=[topic for topic, _ in topic_counts.most_common(20)],
+            starred_count=snapshot.starred_count,
+            contributed_count=snapshot.contributed_count,
+        )
 
-        # Extract languages
-        languages = []
-        for repo in starred + own_repos:
-            if repo.get("language"):
-                languages.append(repo["language"])
+    def _reuse_snapshot(self, snapshot: ProfileSnapshot, use_graphql: bool) -> bool:
+        """Check if a snapshot can be used without fetching new stars."""
+        if use_graphql and self.client.budget_low():
+            # Low priority: keep the old counts while the point budget is low
+            self.client.record_deferred()
+            return True
+        if snapshot.refreshed_at is None:
+            return False
+        fresh_for = timedelta(minutes=self.client.cache.PROFILE_TTL_MINUTES)
+        return datetime.now(timezone.utc) - snapshot.refreshed_at < fresh_for
 
-        # Count language frequency
-        lang_counts = Counter(languages)
-        top_languages = [lang for lang, _ in lang_counts.most_common(10)]
+    def refresh_snapshot(
+        self, username: str, snapshot: Optional[ProfileSnapshot], use_graphql: bool
+    ) -> ProfileSnapshot:
+        """Fold the stars added since a snapshot (or all stars) into a saved snapshot."""
+        since = snapshot.newest_starred_at if snapshot else None
 
-        # Extract topics from starred repos
-        topics = []
-        for repo in starred:
-            topics.extend(repo.get("topics", []))
+        if use_graphql:
+            activity = self.client.get_user_activity(username, since=since)
+        else:
+            activity = self._get_rest_activity(username, since)
 
-        topic_counts = Counter(topics)
-        top_topics = [topic for topic, _ in topic_counts.most_common(20)]
+        now = datetime.now(timezone.utc)
+        if snapshot is None:
+            snapshot = ProfileSnapshot(username=username, taken_at=now)
+        snapshot = self.fold_stars(snapshot, activity["stars"])
 
-        return UserProfile(
-            username=username,
-            languages=top_languages,
-            topics=top_topics,
-            starred_count=len(starred),
-            contributed_count=len(own_repos),
+        update = {
+            "own_languages": [language for language in activity["own_languages"] if language],
+            "contributed_count": activity["contributed_count"],
+            "refreshed_at": now,
+        }
+        if activity.get("starred_count") is not None:
+            update["starred_count"] = activity["starred_count"]
+        snapshot = snapshot.model_copy(update=update)
+
+        self.save_snapshot(snapshot)
+        return snapshot
+
+    def _get_rest_activity(self, username: str, since: Optional[datetime]) -> dict:
+        """Fetch new stars and own repos at the same time over REST."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            stars_future = pool.submit(self.client.get_user_stars, username, since)
+            own_repos_future = pool.submit(self.client.get_user_repos, username)
+            stars = stars_future.result()
+            own_repos = own_repos_future.result()
+
+        return {
+            "own_languages": [repo.get("language") for repo in own_repos],
+            "contributed_count": len(own_repos),
+            "starred_count": None,  # REST has no total - counted from the stars seen
+            "stars": stars,
+        }
+
+    @staticmethod
+    def fold_stars(snapshot: ProfileSnapshot, stars: List[dict]) -> ProfileSnapshot:
+        """Add new stars to a snapshot's counts.
+
+        Args:
+            snapshot: Snapshot to build on
+            stars: {"starred_at", "language", "topics"} dicts, any order
+
+        Returns:
+            Updated copy of the snapshot
+        """
+        language_counts = Counter(snapshot.language_counts)
+        topic_counts = Counter(snapshot.topic_counts)
+        newest = snapshot.newest_starred_at
+
+        for star in stars:
+            if star.get("language"):
+                language_counts[star["language"]] += 1
+            topic_counts.update(star.get("topics") or [])
+            starred_at = parse_timestamp(star["starred_at"])
+            if newest is None or starred_at > newest:
+                newest = starred_at
+
+        return snapshot.model_copy(update={
+            "language_counts": dict(language_counts),
+            "topic_counts": dict(topic_counts),
+            "starred_count": snapshot.starred_count + len(stars),
+            "newest_starred_at": newest,
+        })
+
+    def _snapshot_key(self, username: str) -> str:
+        return f"profile_snapshot:{username}"
+
+    def load_snapshot(self, username: str) -> Optional[ProfileSnapshot]:
+        """Load the user's snapshot, or None if missing or due for a full rebuild."""
+        data = self.client.cache.get_stale(self._snapshot_key(username))
+        if data is None:
+            return None
+        snapshot = ProfileSnapshot(**data)
+        age = datetime.now(timezone.utc) - snapshot.taken_at
+        if age > timedelta(days=self.SNAPSHOT_MAX_AGE_DAYS):
+            return None
+        return snapshot
+
+    def save_snapshot(self, snapshot: ProfileSnapshot):
+        """Persist a snapshot in the client's cache."""
+        self.client.cache.set(
+            self._snapshot_key(snapshot.username), snapshot.model_dump(mode="json")
         )
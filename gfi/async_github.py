@@ -0,0 +1,454 @@
+"""Asyncio GitHub API client for concurrent searches."""
+
+import asyncio
+import queue
+import threading
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+import httpx
+
+from . import singleflight
+from .cache import create_cache
+from .github import GitHubClient, Issue, issue_from_item, next_page_url, parse_repo_url
+from .planner import MAX_RESULTS_PER_QUERY, cap_per_pair, plan_queries
+from .ratelimit import get_scheduler
+from .tokens import TokenPool
+from .transport import create_async_client
+
+
+class AsyncGitHubClient:
+    """Async GitHub API client - same API as GitHubClient, but every call is awaitable.
+
+    All language/label searches are issued at once, followed by one batch of
+    repository lookups, so a search costs about two round trips instead of one
+    per query and item.
+    """
+
+    BASE_URL = GitHubClient.BASE_URL
+    DEFAULT_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        token: Union[str, List[str], TokenPool],
+        use_cache: bool = True,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """Initialize async client.
+
+        Args:
+            token: GitHub token, list of tokens, or TokenPool to rotate through
+            use_cache: Whether to use disk cache
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        if isinstance(token, TokenPool):
+            self.tokens = token
+        else:
+            self.tokens = TokenPool([token] if isinstance(token, str) else token)
+        self.token = self.tokens.tokens[0]
+        self.client = create_async_client(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+        )
+        self.cache = create_cache(enabled=use_cache)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _send(self, resource: str, url: str, **kwargs) -> httpx.Response:
+        """GET a URL once rate limit budget and a concurrency slot are available."""
+        token = self.tokens.checkout(resource)
+        if len(self.tokens) > 1:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Authorization": f"Bearer {token}",
+            }
+
+        async def request():
+            async with self._semaphore:
+                return await self.client.get(url, **kwargs)
+
+        return await get_scheduler(token).send_async(resource, request, host=httpx.URL(url).host)
+
+    async def _get(
+        self, url: str, params: Optional[dict] = None, resource: str = "core"
+    ) -> httpx.Response:
+        """GET a URL and raise on HTTP errors."""
+        response = await self._send(resource, url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def _fetch(
+        self, cache_key: str, url: str, params: Optional[dict] = None, resource: str = "core"
+    ):
+        """GET a URL and cache the JSON body, revalidating expired entries with a 304.
+
+        Concurrent fetches of the same key share one request.
+        """
+        return await singleflight.do_async(
+            cache_key, lambda: self._fetch_uncoalesced(cache_key, url, params, resource)
+        )
+
+    async def _fetch_uncoalesced(
+        self, cache_key: str, url: str, params: Optional[dict], resource: str
+    ):
+        response = await self._send(
+            resource, url, params=params, headers=self.cache.get_conditional_headers(cache_key)
+        )
+
+        if response.status_code == 304:
+            data = self.cache.revalidate(cache_key)
+            if data is not None:
+                return data
+            response = await self._send(resource, url, params=params)
+
+        response.raise_for_status()
+        data = response.json()
+        self.cache.set(
+            cache_key,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return data
+
+    async def get_user(self) -> dict:
+        """Get authenticated user info."""
+        response = await self._get(f"{self.BASE_URL}/user")
+        return response.json()
+
+    async def get_user_repos(self, username: str) -> List[dict]:
+        """Get user's repositories (cached)."""
+        cache_key = f"user_repos:{username}"
+        cached_data = self.cache.get(cache_key, self.cache.PROFILE_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        response = await self._get(
+            f"{self.BASE_URL}/users/{username}/repos", params={"per_page": 100, "sort": "updated"}
+        )
+        repos = response.json()
+        self.cache.set(cache_key, repos)
+        return repos
+
+    async def _search(self, query: str, per_page: int, page: int) -> dict:
+        """Fetch one page of a search query (cached)."""
+        cache_key = f"search:{query}:{per_page}:{page}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        return await self._fetch(
+            cache_key,
+            f"{self.BASE_URL}/search/issues",
+            resource="search",
+            params={
+                "q": query,
+                "sort": "created",
+                "order": "desc",
+                "per_page": per_page,
+                "page": page,
+            },
+        )
+
+    async def _search_items(self, query: str, wanted: int) -> List[dict]:
+        """Read a search's newest `wanted` items.
+
+        The first page's total_count tells how many more pages are needed;
+        those are fetched concurrently.
+        """
+        per_page = min(100, wanted)
+        first = await self._search(query, per_page, 1)
+        available = min(wanted, first.get("total_count", 0))
+        pages = range(2, -(-available // per_page) + 1)
+        rest = await asyncio.gather(*(self._search(query, per_page, page) for page in pages))
+
+        items = list(first.get("items", []))
+        for data in rest:
+            items.extend(data.get("items", []))
+        return items[:wanted]
+
+    async def search_good_first_issues(
+        self,
+        languages: List[str],
+        min_stars: int = 50,
+        max_age_days: int = 30,
+        limit: int = 30,
+        labels: Optional[List[str]] = None,
+    ) -> List[Issue]:
+        """Search for good first issues, running every planned search concurrently.
+
+        Languages and labels are OR-ed into as few queries as possible (see
+        plan_queries), and the results are trimmed to `limit` per pair.
+
+        Args:
+            languages: List of programming languages to filter by
+            min_stars: Minimum repository star count
+            max_age_days: Maximum issue age in days
+            limit: Maximum number of results per language/label pair
+            labels: Issue labels to search for (defaults to ["good first issue"])
+        """
+        if labels is None:
+            labels = ["good first issue"]
+
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        planned_queries = plan_queries(languages, labels, min_stars, cutoff_date.date())
+
+        # Phase 1: every search at once, each read far enough to hold `limit`
+        # issues for every pair it covers
+        results = await asyncio.gather(
+            *(
+                self._search_items(
+                    planned.to_string(), min(MAX_RESULTS_PER_QUERY, limit * planned.pair_count)
+                )
+                for planned in planned_queries
+            )
+        )
+
+        # Deduplicate across searches, keeping query order
+        items = []
+        seen_urls = set()
+        for found in results:
+            for item in found:
+                if item["html_url"] in seen_urls:
+                    continue
+                seen_urls.add(item["html_url"])
+                items.append(item)
+
+        # Phase 2: every distinct repo at once
+        repo_keys = [parse_repo_url(item["repository_url"]) for item in items]
+        repos = await self.get_repos(repo_keys)
+
+        issues = []
+        for item, (owner, repo_name) in zip(items, repo_keys):
+            issues.append(issue_from_item(item, owner, repo_name, repos[(owner, repo_name)]))
+
+        return cap_per_pair(issues, languages, labels, limit)
+
+    async def iter_good_first_issues(
+        self,
+        languages: List[str],
+        min_stars: int = 50,
+        max_age_days: int = 30,
+        limit: Optional[int] = None,
+        labels: Optional[List[str]] = None,
+        per_page: int = 100,
+    ) -> AsyncIterator[Issue]:
+        """Async version of GitHubClient.iter_good_first_issues.
+
+        The first pages of all planned queries are requested together, and
+        each query's next page is requested while the current one is being
+        enriched and consumed; whatever is still pending is cancelled if the
+        caller stops iterating.
+        """
+        if labels is None:
+            labels = ["good first issue"]
+        if limit is not None:
+            per_page = min(per_page, limit)
+
+        seen_urls = set()
+        yielded = 0
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+
+        # The first page of every planned query is requested at once; later
+        # pages are read ahead one at a time
+        first_pages = [
+            asyncio.ensure_future(
+                self._search_page(
+                    f"{self.BASE_URL}/search/issues",
+                    {
+                        "q": planned.to_string(),
+                        "sort": "created",
+                        "order": "desc",
+                        "per_page": min(100, per_page),
+                    },
+                )
+            )
+            for planned in plan_queries(languages, labels, min_stars, cutoff_date.date())
+        ]
+        next_page = None
+
+        try:
+            for next_page in first_pages:
+                while next_page is not None:
+                    page = await next_page
+                    items = [item for item in page["items"] if item["html_url"] not in seen_urls]
+                    seen_urls.update(item["html_url"] for item in items)
+
+                    # Read ahead unless this page already reaches the limit
+                    next_page = None
+                    if page["next"] and (limit is None or yielded + len(items) < limit):
+                        next_page = asyncio.ensure_future(self._search_page(page["next"]))
+
+                    repo_keys = [parse_repo_url(item["repository_url"]) for item in items]
+                    repos = await self.get_repos(repo_keys)
+                    for item, (owner, repo_name) in zip(items, repo_keys):
+                        yield issue_from_item(item, owner, repo_name, repos[(owner, repo_name)])
+                        yielded += 1
+                        if limit is not None and yielded >= limit:
+                            return
+        finally:
+            for pending in [*first_pages, next_page]:
+                if pending is not None:
+                    pending.cancel()
+
+    async def _search_page(self, url: str, params: Optional[dict] = None) -> dict:
+        """Fetch (or load from cache) one page of search results and its next-page URL."""
+        cache_key = f"search-page:{httpx.URL(url, params=params)}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        response = await self._get(url, params=params, resource="search")
+        page = {
+            "items": response.json().get("items", []),
+            "next": next_page_url(response),
+        }
+        self.cache.set(cache_key, page)
+        return page
+
+    async def get_repo(self, owner: str, repo: str) -> dict:
+        """Get repository details."""
+        cache_key = f"repo:{owner}/{repo}"
+        cached_data = self.cache.get(cache_key, self.cache.REPO_TTL_MINUTES)
+
+        if cached_data is not None:
+            return cached_data
+
+        return await self._fetch(cache_key, f"{self.BASE_URL}/repos/{owner}/{repo}")
+
+    async def get_repos(self, repo_keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        """Get details for many repositories at once (deduplicated, fetched concurrently)."""
+        unique_keys = list(dict.fromkeys(repo_keys))
+        repos = await asyncio.gather(*(self.get_repo(owner, repo) for owner, repo in unique_keys))
+        return dict(zip(unique_keys, repos))
+
+    async def get_issue(self, owner: str, repo: str, issue_number: int) -> Issue:
+        """Get specific issue details."""
+        response, repo_data = await asyncio.gather(
+            self._get(f"{self.BASE_URL}/repos/{owner}/{repo}/issues/{issue_number}"),
+            self.get_repo(owner, repo),
+        )
+        return issue_from_item(response.json(), owner, repo, repo_data)
+
+    async def get_repo_issues(
+        self, owner: str, repo: str, state: str = "all", limit: int = 100
+    ) -> List[dict]:
+        """Get recent issues from a repo (for analyzing maintainer responsiveness)."""
+        response = await self._get(
+            f"{self.BASE_URL}/repos/{owner}/{repo}/issues",
+            params={"state": state, "per_page": limit, "sort": "updated", "direction": "desc"},
+        )
+        return response.json()
+
+    async def aclose(self):
+        """Close the HTTP client and the cache."""
+        await self.client.aclose()
+        self.cache.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class ConcurrentGitHubClient(GitHubClient):
+    """Blocking GitHubClient whose searches fan out through AsyncGitHubClient.
+
+    Drop-in replacement for GitHubClient in synchronous code (CLI, watch daemon).
+    """
+
+    _DONE = object()  # Marks the end of an iter_good_first_issues stream
+
+    def __init__(
+        self,
+        token: Union[str, List[str], TokenPool],
+        use_cache: bool = True,
+        max_concurrency: int = AsyncGitHubClient.DEFAULT_CONCURRENCY,
+    ):
+        super().__init__(token, use_cache=use_cache)
+        self.max_concurrency = max_concurrency
+
+    def _async_client(self) -> AsyncGitHubClient:
+        """Create an async client sharing this client's token and cache settings."""
+        return AsyncGitHubClient(
+            self.tokens,
+            use_cache=self.cache.enabled,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def search_good_first_issues(
+        self,
+        languages: List[str],
+        min_stars: int = 50,
+        max_age_days: int = 30,
+        limit: int = 30,
+        labels: Optional[List[str]] = None,
+    ) -> List[Issue]:
+        """Search for good first issues with all searches in flight at once."""
+
+        async def run():
+            async with self._async_client() as client:
+                return await client.search_good_first_issues(
+                    languages=languages,
+                    min_stars=min_stars,
+                    max_age_days=max_age_days,
+                    limit=limit,
+                    labels=labels,
+                )
+
+        return asyncio.run(run())
+
+    def iter_good_first_issues(
+        self,
+        languages: List[str],
+        min_stars: int = 50,
+        max_age_days: int = 30,
+        limit: Optional[int] = None,
+        labels: Optional[List[str]] = None,
+        per_page: int = 100,
+    ) -> Iterator[Issue]:
+        """Stream good first issues from AsyncGitHubClient.iter_good_first_issues.
+
+        The async stream runs on a background thread, so later pages and repo
+        lookups stay in flight while the caller works through earlier issues.
+        Once the caller stops iterating, the stream stops after its current page.
+        """
+        issues = queue.Queue()
+        stop = threading.Event()
+
+        async def produce():
+            async with self._async_client() as client:
+                async for issue in client.iter_good_first_issues(
+                    languages=languages,
+                    min_stars=min_stars,
+                    max_age_days=max_age_days,
+                    limit=limit,
+                    labels=labels,
+                    per_page=per_page,
+                ):
+                    if stop.is_set():
+                        return
+                    issues.put(issue)
+
+        def run():
+            try:
+                asyncio.run(produce())
+            except Exception as e:
+                issues.put(e)
+            finally:
+                issues.put(self._DONE)
+
+        threading.Thread(target=run, daemon=True).start()
+        try:
+            while True:
+                item = issues.get()
+                if item is self._DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
@@ -2,21 +2,333 @@
 
 import json
 import hashlib
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Any
+from typing import Dict, Optional, Any, Tuple
 import shutil
+import tempfile
+
+
+class MemoryTier:
+    """Bounded in-process LRU of decoded cache entries.
+
+    Shared by every DiskCache in the process, so short-lived clients (one per
+    web request) still hit it. Entries are the decoded envelopes (data,
+    timestamp, validators); the disk tier stays the source of truth. Cached
+    data is shared between readers, so treat it as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        """Initialize the tier.
+
+        Args:
+            max_entries: Maximum number of entries held
+            max_bytes: Maximum total size of the held entries (JSON-encoded)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (entry, version, size)
+        self._entries: "OrderedDict[str, Tuple[dict, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    def get(self, key: str, version: Any) -> Optional[dict]:
+        """Get an entry read at the given disk version, marking it recently used.
+
+        Entries held for another version are dropped and count as misses.
+        """
+        with self._lock:
+            held = self._entries.get(key)
+            if held is None or held[1] != version:
+                self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return held[0]
+
+    def put(self, key: str, entry: dict, version: Any, size: int) -> None:
+        """Hold an entry, evicting the least recently used ones to stay in bounds."""
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (entry, version, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def discard(self, key: str) -> None:
+        """Drop an entry if held."""
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        held = self._entries.pop(key, None)
+        if held is not None:
+            self._bytes -= held[2]
+
+    def clear(self, prefix: str = "") -> None:
+        """Drop every entry whose key starts with prefix."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._discard(key)
+
+    def record_disk(self, hit: bool) -> None:
+        """Count a lookup that fell through to the disk tier."""
+        with self._lock:
+            if hit:
+                self.disk_hits += 1
+            else:
+                self.disk_misses += 1
+
+    def get_stats(self) -> dict:
+        """Hit and miss counts per tier, plus the memory tier's fill."""
+        with self._lock:
+            return {
+                "memory": {
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "entries": len(self._entries),
+                    "bytes": self._bytes,
+                    "max_entries": self.max_entries,
+                    "max_bytes": self.max_bytes,
+                },
+                "disk": {"hits": self.disk_hits, "misses": self.disk_misses},
+            }
+
+    def reset(self) -> None:
+        """Drop every entry and zero the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.disk_hits = self.disk_misses = 0
+
+
+_memory = MemoryTier()
+
+
+def get_tier_stats() -> dict:
+    """Get hit and miss counts for the memory and disk cache tiers."""
+    return _memory.get_stats()
+
+
+def reset_memory_tier() -> None:
+    """Empty the process-wide memory tier (mainly for tests)."""
+    _memory.reset()
+
+
+class CacheManifest:
+    """Index of entry sizes and access times for a JSON cache directory.
+
+    Every write, delete and (coarse) access is appended as one line to a
+    log file in the cache directory. Each process keeps the replayed index
+    in memory and only reads lines appended since its last look, so size
+    checks and stats don't scan the directory. Eviction pops the least
+    recently used entry from a heap. The log is rewritten as a snapshot
+    once it grows to several times the number of entries.
+    """
+
+    LOG_NAME = "manifest.log"  # Not *.json, so it's never mistaken for an entry
+    COMPACT_FACTOR = 4  # Compact once the log has this many lines per entry
+
+    def __init__(self, cache_dir: Path):
+        self.path = cache_dir / self.LOG_NAME
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.entries: dict = {}  # cache key -> [size, accessed_at]
+        self.total_size = 0
+        self._heap: list = []  # (accessed_at, cache key), stale pairs skipped on pop
+        self._offset = 0
+        self._inode = None
+        self._lines = 0
+
+    def _apply(self, line: str) -> None:
+        parts = line.split()
+        if len(parts) < 2:
+            return  # Torn or blank line
+        op, key = parts[0], parts[1]
+        try:
+            if op == "S":
+                size, accessed_at = int(parts[2]), float(parts[3])
+                self._drop(key)
+                self.entries[key] = [size, accessed_at]
+                self.total_size += size
+                heapq.heappush(self._heap, (accessed_at, key))
+            elif op == "A" and key in self.entries:
+                accessed_at = float(parts[2])
+                self.entries[key][1] = accessed_at
+                heapq.heappush(self._heap, (accessed_at, key))
+            elif op == "D":
+                self._drop(key)
+        except (IndexError, ValueError):
+            return
+        self._lines += 1
+
+    def _drop(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_size -= entry[0]
+
+    def _sync(self) -> None:
+        """Replay lines appended since the last sync (lock held).
+
+        A missing or replaced log (cleared or compacted elsewhere) is read
+        again from the start; without one, the directory is scanned once.
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._rebuild()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset()
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, 'r') as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        complete = chunk[:chunk.rfind("\n") + 1]  # Leave a partly written line for next time
+        for line in complete.splitlines():
+            self._apply(line)
+        self._offset += len(complete.encode())
+
+    def _rebuild(self) -> None:
+        """Index the cache directory from scratch and write a snapshot (lock held)."""
+        self._reset()
+        if not self.cache_dir.exists():
+            return
+        for cache_file in self.cache_dir.glob('*.json'):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            self._apply(f"S {cache_file.stem} {stat.st_size} {stat.st_mtime}")
+        self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        """Replace the log with one line per live entry (lock held)."""
+        lines = "".join(
+            f"S {key} {size} {accessed_at}\n" for key, (size, accessed_at) in self.entries.items()
+        )
+        temp_path = self.path.with_suffix(".tmp")
+        try:
+            temp_path.write_text(lines)
+            os.replace(temp_path, self.path)
+            stat = self.path.stat()
+        except OSError:
+            return
+        self._inode = stat.st_ino
+        self._offset = stat.st_size
+        self._lines = len(self.entries)
+        self._heap = [(accessed_at, key) for key, (_, accessed_at) in self.entries.items()]
+        heapq.heapify(self._heap)
+
+    def _append(self, line: str) -> None:
+        """Log one change and apply it (and anything other processes logged)."""
+        with self._lock:
+            self._sync()
+            try:
+                with open(self.path, 'a') as f:
+                    f.write(line + "\n")
+            except OSError:
+                return
+            self._sync()
+            if self._lines > self.COMPACT_FACTOR * max(len(self.entries), 256):
+                self._write_snapshot()
+
+    def record_write(self, key: str, size: int) -> None:
+        """Record a written entry."""
+        self._append(f"S {key} {size} {time.time()}")
+
+    def record_delete(self, key: str) -> None:
+        """Record a deleted entry."""
+        self._append(f"D {key}")
+
+    def record_access(self, key: str, resolution_seconds: float) -> None:
+        """Record a read, at most once per resolution_seconds per entry."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or time.time() - entry[1] <= resolution_seconds:
+                return
+        self._append(f"A {key} {time.time()}")
+
+    def size(self) -> int:
+        """Total size of the indexed entries in bytes."""
+        with self._lock:
+            self._sync()
+            return self.total_size
+
+    def count(self) -> int:
+        """Number of indexed entries."""
+        with self._lock:
+            self._sync()
+            return len(self.entries)
+
+    def pop_least_recent(self) -> Optional[str]:
+        """Remove and return the least recently used entry's key, None if empty."""
+        with self._lock:
+            self._sync()
+            while self._heap:
+                accessed_at, key = heapq.heappop(self._heap)
+                entry = self.entries.get(key)
+                if entry is not None and entry[1] == accessed_at:
+                    return key
+            return None
+
+    def forget(self) -> None:
+        """Drop the in-memory index (the log was removed with the directory)."""
+        with self._lock:
+            self._reset()
+
+
+_manifests: dict = {}
+_manifests_lock = threading.Lock()
+
+
+def get_manifest(cache_dir: Path) -> CacheManifest:
+    """Get the process-wide manifest for a cache directory."""
+    with _manifests_lock:
+        manifest = _manifests.get(cache_dir)
+        if manifest is None:
+            manifest = _manifests[cache_dir] = CacheManifest(cache_dir)
+        return manifest
 
 
 class DiskCache:
-    """Simple disk-based cache with TTL and size limits."""
+    """Simple disk-based cache with TTL and size limits.
+
+    Reads go through the process-wide memory tier first; writes go to disk
+    and then to memory (write-through). TTLs are checked against the entry's
+    own timestamp, so both tiers expire entries at the same time.
+    """
 
     CACHE_DIR = Path.home() / ".gfi-cache"
     MAX_CACHE_SIZE_MB = 100
+    BACKEND = "json"
+    ACCESS_RESOLUTION_SECONDS = 60  # Reads refresh an entry's access time at most this often
 
     # Cache TTLs
     SEARCH_TTL_MINUTES = 30
     REPO_TTL_MINUTES = 60
+    PROFILE_TTL_MINUTES = 60
 
     def __init__(self, enabled: bool = True):
         """Initialize cache.
@@ -29,6 +341,11 @@ class DiskCache:
         if self.enabled:
             self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def manifest(self) -> CacheManifest:
+        """Size and access-time index of the JSON entries."""
+        return get_manifest(self.CACHE_DIR)
+
     def _get_cache_key(self, key: str) -> str:
         """Generate cache key from input string.
 
@@ -51,9 +368,134 @@ class DiskCache:
         """
         return self.CACHE_DIR / f"{cache_key}.json"
 
+    def _read_entry(self, cache_path: Path) -> Optional[dict]:
+        """Read a raw cache entry (timestamp, validators and data).
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            Cache entry if readable, None otherwise
+        """
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            cached['cached_at'] = datetime.fromisoformat(cached['timestamp'])
+            if 'data' not in cached:
+                raise KeyError('data')
+            return cached
+
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, ValueError):
+            # Corrupted cache - delete it
+            self._delete(cache_path.stem)
+            return None
+
+    def _write_entry(self, cache_path: Path, cached: dict) -> bool:
+        """Write a raw cache entry atomically (to a temp file, then renamed into place).
+
+        Returns:
+            Whether the entry was written
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cached, f, indent=2, default=str)
+            os.replace(tmp_path, cache_path)
+            return True
+        except Exception:
+            # Silently fail on cache write errors
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            return False
+
+    # Storage primitives, keyed by hashed cache key (overridden by SQLiteCache)
+
+    def _load(self, cache_key: str) -> Optional[dict]:
+        return self._read_entry(self._get_cache_path(cache_key))
+
+    def _store(self, cache_key: str, cached: dict) -> bool:
+        cache_path = self._get_cache_path(cache_key)
+        if not self._write_entry(cache_path, cached):
+            return False
+        try:
+            self.manifest.record_write(cache_key, cache_path.stat().st_size)
+        except OSError:
+            pass
+        return True
+
+    def _delete(self, cache_key: str) -> None:
+        self._get_cache_path(cache_key).unlink(missing_ok=True)
+        self.manifest.record_delete(cache_key)
+
+    def _touch(self, cache_key: str) -> None:
+        self.manifest.record_access(cache_key, self.ACCESS_RESOLUTION_SECONDS)
+
+    def _entry_count(self) -> int:
+        return self.manifest.count()
+
+    def _entry_version(self, cache_key: str) -> Optional[tuple]:
+        """Cheap fingerprint of the stored entry, None if it's gone.
+
+        Memory entries are only served while the file's mtime and size are
+        unchanged - a stat instead of a read and parse - so writes from other
+        processes and direct edits are picked up.
+        """
+        try:
+            stat = self._get_cache_path(cache_key).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    # Tiered access
+
+    def _memory_key(self, cache_key: str) -> str:
+        return f"{self.BACKEND}:{self.CACHE_DIR}:{cache_key}"
+
+    def _fetch_entry(self, cache_key: str) -> Optional[dict]:
+        """Get an entry from the memory tier, falling back to disk."""
+        entry = _memory.get(self._memory_key(cache_key), self._entry_version(cache_key))
+        if entry is not None:
+            self._touch(cache_key)
+            return dict(entry)
+
+        cached = self._load(cache_key)
+        _memory.record_disk(cached is not None)
+        if cached is not None:
+            self._touch(cache_key)
+            self._remember(cache_key, cached)
+            cached = dict(cached)
+        return cached
+
+    def _put_entry(self, cache_key: str, cached: dict) -> None:
+        """Write an entry to disk, then to the memory tier."""
+        if self._store(cache_key, cached):
+            cached_at = datetime.fromisoformat(cached['timestamp'])
+            self._remember(cache_key, {**cached, 'cached_at': cached_at})
+
+    def _drop_entry(self, cache_key: str) -> None:
+        """Delete an entry from both tiers."""
+        _memory.discard(self._memory_key(cache_key))
+        self._delete(cache_key)
+
+    def _remember(self, cache_key: str, cached: dict) -> None:
+        version = self._entry_version(cache_key)
+        if version is None:
+            return  # Already gone - nothing on disk to mirror
+        try:
+            size = len(json.dumps(cached['data'], default=str))
+        except (TypeError, ValueError):
+            return
+        _memory.put(self._memory_key(cache_key), cached, version, size)
+
     def get(self, key: str, ttl_minutes: int) -> Optional[Any]:
         """Get cached value if valid.
 
+        Expired entries that carry validators (ETag / Last-Modified) are kept on
+        disk so they can be revalidated with a conditional request.
+
         Args:
             key: Cache key
             ttl_minutes: Time-to-live in minutes
@@ -65,37 +507,53 @@ class DiskCache:
             return None
 
         cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_key)
+        cached = self._fetch_entry(cache_key)
 
-        if not cache_path.exists():
+        if cached is None:
             return None
 
-        try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
+        # Check if expired
+        age = datetime.now() - cached['cached_at']
 
-            # Check if expired
-            cached_at = datetime.fromisoformat(cached['timestamp'])
-            age = datetime.now() - cached_at
+        if age > timedelta(minutes=ttl_minutes):
+            if not (cached.get('etag') or cached.get('last_modified')):
+                # Expired and can't be revalidated - delete it
+                self._drop_entry(cache_key)
+            return None
 
-            if age > timedelta(minutes=ttl_minutes):
-                # Expired - delete it
-                cache_path.unlink()
-                return None
+        return cached['data']
 
-            return cached['data']
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Get a cached value regardless of age.
 
-        except (json.JSONDecodeError, KeyError, ValueError):
-            # Corrupted cache - delete it
-            cache_path.unlink()
+        Used to serve a stale copy when refreshing it isn't worth the API cost.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if present, None otherwise
+        """
+        if not self.enabled:
             return None
 
-    def set(self, key: str, value: Any) -> None:
+        cached = self._fetch_entry(self._get_cache_key(key))
+        return cached['data'] if cached is not None else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
         """Store value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
+            etag: ETag response header, for later revalidation
+            last_modified: Last-Modified response header, for later revalidation
         """
         if not self.enabled:
             return
@@ -103,23 +561,64 @@ class DiskCache:
         # Check cache size before writing
         self._enforce_size_limit()
 
-        cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_key)
-
         cached = {
             'timestamp': datetime.now().isoformat(),
             'data': value
         }
+        if etag:
+            cached['etag'] = etag
+        if last_modified:
+            cached['last_modified'] = last_modified
 
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump(cached, f, indent=2, default=str)
-        except Exception:
-            # Silently fail on cache write errors
-            pass
+        self._put_entry(self._get_cache_key(key), cached)
+
+    def get_conditional_headers(self, key: str) -> dict:
+        """Get conditional request headers for a (possibly expired) entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty if nothing to revalidate
+        """
+        if not self.enabled:
+            return {}
+
+        cached = self._fetch_entry(self._get_cache_key(key))
+        if cached is None:
+            return {}
+
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def revalidate(self, key: str) -> Optional[Any]:
+        """Mark an entry fresh again after a 304 Not Modified response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if the entry is gone
+        """
+        if not self.enabled:
+            return None
+
+        cache_key = self._get_cache_key(key)
+        cached = self._fetch_entry(cache_key)
+        if cached is None:
+            return None
+
+        del cached['cached_at']
+        cached['timestamp'] = datetime.now().isoformat()
+        self._put_entry(cache_key, cached)
+        return cached['data']
 
     def _get_cache_size_mb(self) -> float:
-        """Get total cache size in MB.
+        """Get total cache size in MB (from the manifest, no directory scan).
 
         Returns:
             Cache size in megabytes
@@ -127,41 +626,31 @@ class DiskCache:
         if not self.CACHE_DIR.exists():
             return 0.0
 
-        total_size = sum(
-            f.stat().st_size
-            for f in self.CACHE_DIR.glob('*.json')
-            if f.is_file()
-        )
-
-        return total_size / (1024 * 1024)
+        return self.manifest.size() / (1024 * 1024)
 
     def _enforce_size_limit(self) -> None:
-        """Enforce cache size limit by deleting oldest files."""
-        cache_size = self._get_cache_size_mb()
-
-        if cache_size <= self.MAX_CACHE_SIZE_MB:
+        """Enforce cache size limit by deleting least recently used entries."""
+        if self._get_cache_size_mb() <= self.MAX_CACHE_SIZE_MB:
             return
 
-        # Get all cache files sorted by modification time (oldest first)
-        cache_files = sorted(
-            self.CACHE_DIR.glob('*.json'),
-            key=lambda f: f.stat().st_mtime
-        )
-
-        # Delete oldest files until under limit
-        for cache_file in cache_files:
-            if cache_size <= self.MAX_CACHE_SIZE_MB * 0.8:  # 80% threshold
+        # Delete least recently used entries until under the 80% threshold
+        target = self.MAX_CACHE_SIZE_MB * 0.8 * 1024 * 1024
+        while self.manifest.size() > target:
+            cache_key = self.manifest.pop_least_recent()
+            if cache_key is None:
                 break
-
-            file_size_mb = cache_file.stat().st_size / (1024 * 1024)
-            cache_file.unlink()
-            cache_size -= file_size_mb
+            self._drop_entry(cache_key)
 
     def clear(self) -> None:
         """Clear entire cache."""
+        _memory.clear(self._memory_key(""))
         if self.CACHE_DIR.exists():
             shutil.rmtree(self.CACHE_DIR)
             self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.manifest.forget()
+
+    def close(self) -> None:
+        """Release the cache (JSON files hold nothing open)."""
 
     def get_stats(self) -> dict:
         """Get cache statistics.
@@ -172,15 +661,311 @@ class DiskCache:
         if not self.CACHE_DIR.exists():
             return {
                 'enabled': self.enabled,
+                'backend': self.BACKEND,
                 'size_mb': 0.0,
                 'file_count': 0,
             }
 
-        cache_files = list(self.CACHE_DIR.glob('*.json'))
-
         return {
             'enabled': self.enabled,
+            'backend': self.BACKEND,
             'size_mb': round(self._get_cache_size_mb(), 2),
-            'file_count': len(cache_files),
+            'file_count': self._entry_count(),
             'max_size_mb': self.MAX_CACHE_SIZE_MB,
+            'tiers': get_tier_stats(),
         }
+
+
+class SQLiteDatabase:
+    """Connection to a cache database, shared by every SQLiteCache on the file.
+
+    Reads never write: access times are queued and saved with the next write.
+    The total entry size is kept as a running count, so writes don't sum the
+    table; it is re-read from the table before evicting, which also picks up
+    other processes' writes.
+    """
+
+    def __init__(self, path: Path, schema: str):
+        self.path = path
+        self.conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(schema)
+        self.lock = threading.Lock()
+        self.users = 0
+        self.accessed: Dict[str, float] = {}
+        self.total_size = self.count_size()
+
+    def count_size(self) -> int:
+        """Sum the stored entry sizes (a full scan - lock held, or during setup)."""
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def entry_size(self, key: str) -> int:
+        """Size of one stored entry, 0 if absent (lock held)."""
+        row = self.conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        return 0 if row is None else row[0]
+
+    def save_accessed(self) -> None:
+        """Write queued access times into the current transaction (lock held)."""
+        if self.accessed:
+            self.conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self.accessed.items()],
+            )
+            self.accessed.clear()
+
+    def commit(self) -> None:
+        """Commit pending changes and queued access times (lock held)."""
+        self.save_accessed()
+        self.conn.commit()
+
+
+_databases: Dict[Path, SQLiteDatabase] = {}
+_migrated_dirs: set = set()
+_databases_lock = threading.Lock()
+
+
+def open_database(path: Path, schema: str) -> Tuple[SQLiteDatabase, bool]:
+    """Get the process-wide connection to a cache database.
+
+    Returns:
+        (database, whether the caller should import the directory's JSON entries)
+    """
+    with _databases_lock:
+        database = _databases.get(path)
+        if database is None:
+            database = _databases[path] = SQLiteDatabase(path, schema)
+        database.users += 1
+        migrate = path.parent not in _migrated_dirs
+        _migrated_dirs.add(path.parent)
+        return database, migrate
+
+
+def release_database(database: SQLiteDatabase) -> None:
+    """Drop a reference to a database, closing it after the last one."""
+    with _databases_lock:
+        database.users -= 1
+        if database.users > 0:
+            return
+        _databases.pop(database.path, None)
+    with database.lock:
+        database.commit()
+        database.conn.close()
+
+
+class SQLiteCache(DiskCache):
+    """DiskCache stored in one SQLite database (WAL mode) instead of a file per key.
+
+    Writes don't scan the cache directory: size, age and access time are
+    indexed columns, and eviction is a single DELETE. WAL lets several gfi
+    processes read while one writes. Within a process, every cache on the
+    same directory shares one connection. Existing JSON entries are imported
+    on first use.
+    """
+
+    BACKEND = "sqlite"
+    DB_NAME = "cache.db"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        data TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        accessed_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS entries_timestamp ON entries (timestamp);
+    CREATE INDEX IF NOT EXISTS entries_access ON entries (accessed_at, size);
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Initialize cache.
+
+        Args:
+            enabled: Whether caching is enabled (can be disabled via --no-cache)
+        """
+        super().__init__(enabled)
+        self._db = None
+        self._conn = None
+
+        if self.enabled:
+            self._db, migrate = open_database(self.CACHE_DIR / self.DB_NAME, self.SCHEMA)
+            self._conn = self._db.conn
+            self._lock = self._db.lock
+            if migrate:
+                self._migrate_json_entries()
+
+    def _migrate_json_entries(self) -> None:
+        """Import entries left by the JSON backend, then delete their files."""
+        for cache_path in self.CACHE_DIR.glob('*.json'):
+            cached = self._read_entry(cache_path)
+            if cached is not None:
+                del cached['cached_at']
+                self._store(cache_path.stem, cached)
+            cache_path.unlink(missing_ok=True)
+        (self.CACHE_DIR / CacheManifest.LOG_NAME).unlink(missing_ok=True)
+        get_manifest(self.CACHE_DIR).forget()
+
+    def _load(self, cache_key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT timestamp, etag, last_modified, data FROM entries WHERE key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+        timestamp, etag, last_modified, data = row
+        try:
+            cached = {'timestamp': timestamp, 'data': json.loads(data)}
+            cached['cached_at'] = datetime.fromisoformat(timestamp)
+        except ValueError:
+            # Corrupted entry - delete it
+            self._delete(cache_key)
+            return None
+
+        if etag:
+            cached['etag'] = etag
+        if last_modified:
+            cached['last_modified'] = last_modified
+        return cached
+
+    def _store(self, cache_key: str, cached: dict) -> bool:
+        try:
+            data = json.dumps(cached['data'], default=str)
+        except (TypeError, ValueError):
+            # Silently fail on cache write errors
+            return False
+
+        with self._lock:
+            self._db.total_size += len(data) - self._db.entry_size(cache_key)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, timestamp, etag, last_modified, data, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    cached['timestamp'],
+                    cached.get('etag'),
+                    cached.get('last_modified'),
+                    data,
+                    len(data),
+                    time.time(),
+                ),
+            )
+            self._db.accessed.pop(cache_key, None)
+            self._db.commit()
+        return True
+
+    def _delete(self, cache_key: str) -> None:
+        with self._lock:
+            self._db.total_size -= self._db.entry_size(cache_key)
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (cache_key,))
+            self._db.accessed.pop(cache_key, None)
+            self._db.commit()
+
+    def _touch(self, cache_key: str) -> None:
+        # Queued, so reads (including memory hits) don't write
+        with self._lock:
+            self._db.accessed[cache_key] = time.time()
+
+    def _entry_version(self, cache_key: str) -> Optional[tuple]:
+        # Reads the row's timestamp but not its data
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT timestamp FROM entries WHERE key = ?", (cache_key,)
+            ).fetchone()
+        return None if row is None else (row[0],)
+
+    def _entry_count(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _get_cache_size_mb(self) -> float:
+        """Get total cache size in MB (running total of the stored entries).
+
+        Returns:
+            Cache size in megabytes
+        """
+        if self._conn is None:
+            return 0.0
+        return self._db.total_size / (1024 * 1024)
+
+    def _enforce_size_limit(self) -> None:
+        """Enforce cache size limit by deleting the least recently used entries."""
+        if self._get_cache_size_mb() <= self.MAX_CACHE_SIZE_MB:
+            return
+
+        # Keep the most recently used entries that fit in 80% of the limit
+        limit = self.MAX_CACHE_SIZE_MB * 1024 * 1024
+        target = int(limit * 0.8)
+        with self._lock:
+            # Other processes may have evicted already
+            self._db.total_size = self._db.count_size()
+            if self._db.total_size <= limit:
+                return
+
+            self._db.save_accessed()
+            self._conn.execute(
+                """
+                DELETE FROM entries WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS kept
+                        FROM entries
+                    ) WHERE kept > ?
+                )
+                """,
+                (target,),
+            )
+            self._db.commit()
+            self._db.total_size = self._db.count_size()
+
+    def clear(self) -> None:
+        """Clear entire cache."""
+        if self._conn is None:
+            super().clear()
+            return
+        _memory.clear(self._memory_key(""))
+        with self._lock:
+            self._db.accessed.clear()
+            self._db.total_size = 0
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        """Release the shared connection (closed once no cache uses it).
+
+        The cache is disabled afterwards, so later calls are no-ops.
+        """
+        if self._db is not None:
+            release_database(self._db)
+            self._db = None
+            self._conn = None
+        self.enabled = False
+
+
+CACHE_BACKENDS = {"json": DiskCache, "sqlite": SQLiteCache}
+
+
+def create_cache(enabled: bool = True, backend: Optional[str] = None) -> DiskCache:
+    """Create the response cache for a client.
+
+    Args:
+        enabled: Whether caching is enabled (can be disabled via --no-cache)
+        backend: "sqlite" or "json" (a file per entry); defaults to the
+            GFI_CACHE_BACKEND environment variable, then "sqlite"
+
+    Returns:
+        DiskCache (or subclass) instance
+    """
+    backend = (backend or os.getenv("GFI_CACHE_BACKEND") or "sqlite").lower()
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown cache backend {backend!r} (expected one of {', '.join(CACHE_BACKENDS)})"
+        )
+    return CACHE_BACKENDS[backend](enabled=enabled)
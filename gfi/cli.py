@@ -6,28 +6,44 @@ from rich.table import Table
 from rich.panel import Panel
 from rich import box
 from pathlib import Path
+from datetime import datetime, timedelta
+from itertools import islice
 import json
 import os
+import threading
 from dotenv import load_dotenv
 
 from .github import GitHubClient
+from .async_github import AsyncGitHubClient, ConcurrentGitHubClient
 from .gitlab import GitLabClient
+from .gitlab_graphql import GitLabGraphQLClient
+from .federated import FederatedClient
 from .graphql import GitHubGraphQLClient
+from .harvest import HARVEST_PATH, HarvestStore, Harvester
+from .resilience import CircuitOpenError, get_resilience_stats
 from .analyzer import ProfileAnalyzer
 from .scorer import IssueScorer
-from .display import display_issues, display_issue_detail
+from .display import (
+    display_issues,
+    display_issue_detail,
+    display_graphql_stats,
+    display_token_stats,
+    display_resilience_stats,
+    display_cache_tier_stats,
+)
 from .card import generate_card
 from .viral import offer_share
 from . import telemetry
 from . import success
 from . import watch
 from .export import export_to_json, export_to_csv
-from .cache import DiskCache
+from .cache import DiskCache, create_cache, get_tier_stats
 
 console = Console()
 load_dotenv()
 
 CONFIG_PATH = Path.home() / ".gfi-config.json"
+SCORE_BATCH_SIZE = 10  # Issues scored per prefetch of maintainer data
 
 
 @click.group()
@@ -85,12 +101,32 @@ def init(token):
 @click.option("--max-age", type=int, default=30, help="Maximum issue age in days")
 @click.option("--limit", type=int, default=10, help="Number of issues to show")
 @click.option("--labels", multiple=True, help="Issue labels to search (defaults: 'good first issue')")
-@click.option("--platform", type=click.Choice(['github', 'gitlab']), default='github', help="Platform to search (default: github)")
+@click.option(
+    "--platform",
+    type=click.Choice(['github', 'gitlab', 'all']),
+    default='github',
+    help="Platform to search (default: github)",
+)
 @click.option("--no-card", is_flag=True, help="Skip generating shareable card")
 @click.option("--export", type=click.Choice(['json', 'csv']), help="Export results to file")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
-@click.option("--use-graphql", is_flag=True, help="Use GraphQL API for better performance (GitHub only)")
-def find(lang, min_stars, max_age, limit, labels, platform, no_card, export, no_cache, use_graphql):
+@click.option("--use-graphql", is_flag=True, help="Use GraphQL API for better performance")
+@click.option(
+    "--concurrency",
+    type=int,
+    default=AsyncGitHubClient.DEFAULT_CONCURRENCY,
+    help="Maximum concurrent API requests",
+)
+@click.option(
+    "--stats",
+    "show_api_stats",
+    is_flag=True,
+    help="Show API usage (GraphQL query cost, remaining quota)",
+)
+def find(
+    lang, min_stars, max_age, limit, labels, platform, no_card, export, no_cache, use_graphql,
+    concurrency, show_api_stats,
+):
     """Find good first issues matching your profile."""
 
     if not CONFIG_PATH.exists():
@@ -105,36 +141,49 @@ def find(lang, min_stars, max_age, limit, labels, platform, no_card, export, no_
     # Use specified labels or defaults
     search_labels = list(labels) if labels else ["good first issue", "help wanted", "beginner friendly"]
 
+    client = None
     with console.status(f"[cyan]Searching {platform} for issues in {', '.join(languages)}..."):
         try:
             # Initialize platform client
-            if platform == 'gitlab':
-                if use_graphql:
-                    console.print("[yellow]Warning:[/yellow] GraphQL is only available for GitHub. Using REST API.")
-                client = GitLabClient(config.get("gitlab_token"), use_cache=not no_cache)
-            else:  # github
-                if use_graphql:
-                    client = GitHubGraphQLClient(config["token"], use_cache=not no_cache)
-                else:
-                    client = GitHubClient(config["token"], use_cache=not no_cache)
+            if platform == 'all':
+                # Both platforms searched at once, ranked together below
+                client = FederatedClient({
+                    name: _platform_client(name, config, no_cache, use_graphql, concurrency)
+                    for name in ('github', 'gitlab')
+                })
+            else:
+                client = _platform_client(platform, config, no_cache, use_graphql, concurrency)
 
             scorer = IssueScorer(client)
 
-            # Search for issues
-            issues = client.search_good_first_issues(
-                languages=languages,
-                min_stars=min_stars,
-                max_age_days=max_age,
-                limit=limit * 3,  # Get more to filter
-                labels=search_labels,
-            )
+            # Search for issues - streamed where supported, so scoring starts
+            # before every page has been fetched
+            if hasattr(client, "iter_good_first_issues"):
+                issues = client.iter_good_first_issues(
+                    languages=languages,
+                    min_stars=min_stars,
+                    max_age_days=max_age,
+                    limit=limit * 2,  # Score subset for speed
+                    labels=search_labels,
+                )
+            else:
+                issues = client.search_good_first_issues(
+                    languages=languages,
+                    min_stars=min_stars,
+                    max_age_days=max_age,
+                    limit=limit * 3,  # Get more to filter
+                    labels=search_labels,
+                )[:limit * 2]  # Score subset for speed
 
             # Score and rank
             scored_issues = []
-            for issue in issues[:limit * 2]:  # Score subset for speed
-                score = scorer.score_issue(issue)
-                if score.total_score > 0.3:  # Minimum threshold
-                    scored_issues.append((score, issue))
+            for batch in _batched(issues, SCORE_BATCH_SIZE):
+                scorer.prefetch(batch)
+                for issue in batch:
+                    score = scorer.score_issue(issue)
+                    if score.total_score > 0.3:  # Minimum threshold
+                        scored_issues.append((score, issue))
+            _report_errors(client)
 
             # Sort by score
             scored_issues.sort(key=lambda x: x[0].total_score, reverse=True)
@@ -147,6 +196,17 @@ def find(lang, min_stars, max_age, limit, labels, platform, no_card, export, no_
             # Display top results
             display_issues(scored_issues[:limit], console)
 
+            if show_api_stats:
+                github_client = client
+                if isinstance(client, FederatedClient):
+                    github_client = client.clients['github']
+                if isinstance(github_client, GitHubGraphQLClient):
+                    display_graphql_stats(github_client.get_stats(), console)
+                elif isinstance(github_client, GitHubClient):
+                    display_token_stats(github_client.get_token_stats(), console)
+                display_resilience_stats(get_resilience_stats(), console)
+                display_cache_tier_stats(get_tier_stats(), console)
+
             # Log telemetry
             telemetry.log_event("search", {
                 "languages": languages,
@@ -169,10 +229,82 @@ def find(lang, min_stars, max_age, limit, labels, platform, no_card, export, no_
                 # Offer viral sharing
                 offer_share(scored_issues[:limit], console)
 
+        except CircuitOpenError as e:
+            console.print(f"[yellow]Upstream trouble:[/yellow] {e}. Try again shortly.")
         except Exception as e:
             console.print(f"[red]Error:[/red] {str(e)}")
             import traceback
             traceback.print_exc()
+        finally:
+            if client is not None:
+                client.close()
+
+
+@cli.command()
+@click.option("--lang", multiple=True, help="Filter by language (can use multiple times)")
+@click.option("--min-stars", type=int, default=50, help="Minimum repo stars")
+@click.option("--max-age", type=int, default=365, help="Maximum issue age in days")
+@click.option(
+    "--labels", multiple=True, help="Issue labels to search (defaults: 'good first issue')"
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=HARVEST_PATH,
+    help="SQLite store to write issues to",
+)
+@click.option(
+    "--workers", type=int, default=Harvester.DEFAULT_WORKERS, help="Slices crawled in parallel"
+)
+@click.option("--restart", is_flag=True, help="Discard saved progress and start over")
+def harvest(lang, min_stars, max_age, labels, output, workers, restart):
+    """Collect every matching issue into a local store (resumable)."""
+
+    if not CONFIG_PATH.exists():
+        console.print("[red]Error:[/red] Not initialized. Run 'gfi init' first.")
+        return
+
+    config = json.loads(CONFIG_PATH.read_text())
+    languages = list(lang) if lang else config.get("languages", [])[:3]
+    search_labels = list(labels) or ["good first issue", "help wanted", "beginner friendly"]
+    created_from = (datetime.now() - timedelta(days=max_age)).date()
+
+    store = HarvestStore(output)
+    try:
+        # Pages are checkpointed in the store, so the response cache is skipped
+        client = GitHubGraphQLClient(config["token"], use_cache=False)
+        harvester = Harvester(client, store, workers=workers)
+
+        with console.status("[cyan]Planning date-range slices..."):
+            pending = harvester.plan(
+                languages, search_labels, min_stars, created_from, restart=restart
+            )
+
+        progress = store.get_stats()
+        console.print(
+            f"Harvesting {progress['expected_issues']} issues in {progress['slices']} slices "
+            f"({pending} to go, {progress['issues']} already stored)"
+        )
+
+        with console.status("[cyan]Harvesting...") as status:
+            fetched = [progress['issues']]
+            fetched_lock = threading.Lock()  # on_page runs on the harvester's workers
+
+            def on_page(query, count):
+                with fetched_lock:
+                    fetched[0] += count
+                    status.update(f"[cyan]Harvesting... {fetched[0]} issues fetched")
+
+            result = harvester.run(on_page=on_page)
+
+        console.print(f"[green]Stored {result['issues']} issues in {output}[/green]")
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted - run the same command again to resume[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+    finally:
+        store.close()
 
 
 @cli.command()
@@ -251,7 +383,13 @@ def show(issue_url, no_cache):
 @click.option("--min-stars", type=int, default=50, help="Minimum repo stars")
 @click.option("--no-cache", is_flag=True, help="Bypass cache and fetch fresh data")
 @click.option("--use-graphql", is_flag=True, help="Use GraphQL API for better performance")
-def lucky(lang, min_stars, no_cache, use_graphql):
+@click.option(
+    "--concurrency",
+    type=int,
+    default=AsyncGitHubClient.DEFAULT_CONCURRENCY,
+    help="Maximum concurrent API requests",
+)
+def lucky(lang, min_stars, no_cache, use_graphql, concurrency):
     """Find ONE perfect issue - feeling lucky mode."""
 
     if not CONFIG_PATH.exists():
@@ -266,7 +404,9 @@ def lucky(lang, min_stars, no_cache, use_graphql):
             if use_graphql:
                 client = GitHubGraphQLClient(config["token"], use_cache=not no_cache)
             else:
-                client = GitHubClient(config["token"], use_cache=not no_cache)
+                client = ConcurrentGitHubClient(
+                    config["token"], use_cache=not no_cache, max_concurrency=concurrency
+                )
             scorer = IssueScorer(client)
 
             # Get more candidates for better lucky pick
@@ -279,10 +419,12 @@ def lucky(lang, min_stars, no_cache, use_graphql):
 
             # Score with lucky algorithm
             lucky_issues = []
+            scorer.prefetch(issues[:30])
             for issue in issues[:30]:  # Score subset
                 score = scorer.score_for_lucky(issue)
                 if score.lucky_score and score.lucky_score > 0.4:
                     lucky_issues.append((score, issue))
+            _report_errors(client)
 
             if not lucky_issues:
                 console.print("[yellow]No lucky match found. Try broadening your search.[/yellow]")
@@ -401,7 +543,7 @@ cli.add_command(watch_cmd, name="watch")
 def cache(stats, clear):
     """Manage API response cache."""
 
-    cache_manager = DiskCache()
+    cache_manager = create_cache()
 
     if clear:
         cache_manager.clear()
@@ -417,6 +559,7 @@ def cache(stats, clear):
         table.add_column("Value", style="green")
 
         table.add_row("Status", "Enabled" if cache_stats['enabled'] else "Disabled")
+        table.add_row("Backend", cache_stats['backend'])
         table.add_row("Cache Size", f"{cache_stats['size_mb']} MB")
         table.add_row("Cache Limit", f"{cache_stats['max_size_mb']} MB")
         table.add_row("Cached Files", str(cache_stats['file_count']))
@@ -427,6 +570,93 @@ def cache(stats, clear):
         console.print("[dim]Tip: Use 'gfi cache --clear' to clear cache[/dim]")
 
 
+@cli.command()
+@click.option("--host", default="127.0.0.1", help="Interface to listen on")
+@click.option("--port", type=int, default=8765, help="Port to listen on")
+@click.option(
+    "--seed", type=int, default=0, help="Seed for the synthetic corpus and fault injection"
+)
+@click.option("--repos", type=int, default=200, help="Number of synthetic GitHub repos")
+@click.option("--issues-per-repo", type=int, default=20, help="Issues per repo/project")
+@click.option("--projects", type=int, default=50, help="Number of synthetic GitLab projects")
+@click.option("--latency", type=float, default=0, help="Added latency per request (ms)")
+@click.option("--jitter", type=float, default=0, help="Random extra latency, up to this much (ms)")
+@click.option("--search-limit", type=int, default=30, help="Search requests per minute per token")
+@click.option("--throttle-rate", type=float, default=0.0, help="Share of requests answered 403/429")
+@click.option("--error-rate", type=float, default=0.0, help="Share of requests answered 502")
+def emulate(
+    host, port, seed, repos, issues_per_repo, projects, latency, jitter, search_limit,
+    throttle_rate, error_rate,
+):
+    """Serve a synthetic GitHub/GitLab API locally for offline benchmarks."""
+    import logging
+
+    from werkzeug.serving import make_server
+
+    from .emulator import EmulatorConfig, create_app, generate_corpus
+
+    corpus = generate_corpus(
+        seed=seed, repos=repos, issues_per_repo=issues_per_repo, projects=projects
+    )
+    app = create_app(corpus, EmulatorConfig(
+        latency_ms=latency,
+        jitter_ms=jitter,
+        search_limit=search_limit,
+        throttle_rate=throttle_rate,
+        error_rate=error_rate,
+        seed=seed,
+    ))
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)  # No per-request log lines
+    server = make_server(host, port, app, threaded=True)
+
+    base_url = f"http://{host}:{server.port}"
+    console.print(f"[green]Emulating GitHub and GitLab at {base_url}[/green] "
+                  f"({len(corpus.repos)} repos, {len(corpus.projects)} projects, seed {seed})")
+    console.print("\nPoint gfi at it (a separate HOME keeps your config and cache untouched):")
+    console.print("  export HOME=$(mktemp -d) GITHUB_TOKEN=bench")
+    console.print(f"  export GFI_GITHUB_API_URL={base_url} GFI_GITLAB_URL={base_url}")
+    console.print("  gfi init && gfi find --stats")
+    console.print("\nPress Ctrl+C to stop.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        stats = app.config["EMULATOR_STATS"]
+        console.print(f"\nServed {stats['requests']} requests "
+                      f"({stats['not_modified']} not modified, {stats['throttled']} throttled, "
+                      f"{stats['errors']} errors)")
+
+
+def _platform_client(platform, config, no_cache, use_graphql, concurrency):
+    """Create the search client for one platform."""
+    if platform == 'gitlab':
+        if use_graphql:
+            return GitLabGraphQLClient(config.get("gitlab_token"), use_cache=not no_cache)
+        return GitLabClient(config.get("gitlab_token"), use_cache=not no_cache)
+
+    if use_graphql:
+        return GitHubGraphQLClient(config["token"], use_cache=not no_cache)
+    return ConcurrentGitHubClient(
+        config["token"], use_cache=not no_cache, max_concurrency=concurrency
+    )
+
+
+def _report_errors(client):
+    """Print the failures a client skipped over to stderr."""
+    for message in getattr(client, "errors", []):
+        click.echo(f"Warning: {message}", err=True)
+
+
+def _batched(items, size):
+    """Yield lists of up to `size` items from any iterable."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
 def _export_results(scored_issues, format, username):
     """Export results to file."""
     from pathlib import Path
@@ -138,3 +138,94 @@ def _format_number(num: int) -> str:
         return f"{num / 1_000:.1f}k"
     else:
         return str(num)
+
+
+def display_graphql_stats(stats: dict, console: Console):
+    """Display GraphQL query cost and remaining point budget."""
+    table = Table(title="GraphQL API Usage", box=box.ROUNDED)
+    table.add_column("Operation", style="cyan")
+    table.add_column("Queries", justify="right", style="white")
+    table.add_column("Cost", justify="right", style="green")
+
+    for name, op in stats["operations"].items():
+        table.add_row(name, str(op["count"]), str(op["cost"]))
+    table.add_row("[bold]Total[/bold]", str(stats["queries"]), str(stats["total_cost"]))
+
+    console.print(table)
+
+    if stats["remaining"] is not None:
+        style = "red" if stats["budget_low"] else "dim"
+        console.print(
+            f"[{style}]Points remaining: {stats['remaining']}/{stats['limit']} "
+            f"(resets {stats['reset_at']})[/{style}]"
+        )
+    if stats["deferred"]:
+        console.print(f"[dim]Deferred low-priority queries: {stats['deferred']}[/dim]")
+
+
+def display_token_stats(stats: List[dict], console: Console):
+    """Display REST API requests and remaining quota per token."""
+    table = Table(title="GitHub API Usage", box=box.ROUNDED)
+    table.add_column("Slot", style="cyan")
+    table.add_column("Requests", justify="right", style="white")
+    table.add_column("Core left", justify="right", style="green")
+    table.add_column("Search left", justify="right", style="green")
+
+    for token_stats in stats:
+        requests = ", ".join(f"{res}: {n}" for res, n in token_stats["requests"].items()) or "0"
+        table.add_row(
+            f"#{token_stats['slot']}",
+            requests,
+            str(token_stats["remaining"]["core"]),
+            str(token_stats["remaining"]["search"]),
+        )
+
+    console.print(table)
+
+
+def display_resilience_stats(stats: List[dict], console: Console):
+    """Display retries and circuit breaker state per API host."""
+    if not stats:
+        return
+
+    table = Table(title="Upstream Health", box=box.ROUNDED)
+    table.add_column("Host", style="cyan")
+    table.add_column("Circuit", style="white")
+    table.add_column("Failures", justify="right", style="red")
+    table.add_column("Retries", justify="right", style="yellow")
+    table.add_column("Short-circuited", justify="right", style="yellow")
+
+    for host_stats in stats:
+        state = host_stats["state"]
+        color = "green" if state == "closed" else "red" if state == "open" else "yellow"
+        table.add_row(
+            host_stats["host"],
+            f"[{color}]{state}[/{color}]",
+            str(host_stats["failures"]),
+            str(host_stats["retries"]),
+            str(host_stats["short_circuits"]),
+        )
+
+    console.print(table)
+
+
+def display_cache_tier_stats(stats: dict, console: Console):
+    """Display hit and miss counts for the memory and disk cache tiers."""
+    table = Table(title="Cache Tiers", box=box.ROUNDED)
+    table.add_column("Tier", style="cyan")
+    table.add_column("Hits", justify="right", style="green")
+    table.add_column("Misses", justify="right", style="yellow")
+    table.add_column("Hit Rate", justify="right", style="white")
+
+    for tier in ("memory", "disk"):
+        hits = stats[tier]["hits"]
+        misses = stats[tier]["misses"]
+        lookups = hits + misses
+        table.add_row(
+            tier.capitalize(),
+            str(hits),
+            str(misses),
+            f"{hits / lookups:.0%}" if lookups else "-",
+        )
+
+    console.print(table)
@@ -0,0 +1,6 @@
+"""Local GitHub/GitLab API emulator for offline benchmarking (gfi emulate)."""
+
+from .corpus import Corpus, generate_corpus
+from .server import EmulatorConfig, create_app
+
+__all__ = ["Corpus", "EmulatorConfig", "create_app", "generate_corpus"]
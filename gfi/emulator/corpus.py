@@ -0,0 +1,204 @@
+"""Synthetic GitHub/GitLab data for the API emulator."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "Java", "Ruby", "C++"]
+TOPICS = [
+    "cli",
+    "web",
+    "machine-learning",
+    "devtools",
+    "database",
+    "api",
+    "testing",
+    "security",
+    "games",
+    "data-science",
+    "networking",
+    "documentation",
+]
+BEGINNER_LABELS = ["good first issue", "help wanted", "beginner friendly"]
+OTHER_LABELS = ["bug", "documentation", "enhancement", "tests", "refactor"]
+WORDS = [
+    "parser",
+    "cache",
+    "config",
+    "logging",
+    "retry",
+    "docs",
+    "export",
+    "theme",
+    "plugin",
+    "timeout",
+    "encoding",
+    "search",
+    "sidebar",
+    "release",
+    "benchmark",
+]
+
+BODY_SECTIONS = [
+    "## Steps to reproduce\n1. Run the command\n2. Open the output\n3. See the error",
+    "## Acceptance criteria\n- [ ] Behaviour is covered by a test\n- [ ] Docs updated",
+    "```python\nresult = load(path)\nassert result is not None\n```",
+    "The relevant code lives in `src/{word}.py`.",
+    "Happy to help anyone who picks this up - ask in the comments.",
+]
+
+
+def iso(moment: datetime) -> str:
+    """Format a datetime the way both APIs do (UTC, Z suffix)."""
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Corpus:
+    """Repositories, issues and users served by the emulator.
+
+    GitHub data is keyed by (owner, name) and GitLab data by project ID. Issue
+    records are platform-neutral dicts (datetimes, label names); the server
+    renders them into each API's response shape.
+    """
+
+    def __init__(self):
+        self.repos: Dict[Tuple[str, str], dict] = {}
+        self.issues: Dict[Tuple[str, str], List[dict]] = {}
+        self.users: Dict[str, dict] = {}
+        self.projects: Dict[int, dict] = {}
+        self.project_issues: Dict[int, List[dict]] = {}
+        self.default_user: Optional[str] = None
+
+    def github_issues(self) -> List[Tuple[dict, dict]]:
+        """Every GitHub issue paired with its repo, newest first."""
+        pairs = [
+            (issue, self.repos[key]) for key, issues in self.issues.items() for issue in issues
+        ]
+        pairs.sort(key=lambda pair: pair[0]["created_at"], reverse=True)
+        return pairs
+
+    def gitlab_issues(self) -> List[Tuple[dict, dict]]:
+        """Every GitLab issue paired with its project, newest first."""
+        pairs = [
+            (issue, self.projects[project_id])
+            for project_id, issues in self.project_issues.items()
+            for issue in issues
+        ]
+        pairs.sort(key=lambda pair: pair[0]["created_at"], reverse=True)
+        return pairs
+
+
+def _issue(rng: random.Random, number: int, now: datetime, max_age_days: int) -> dict:
+    """Generate one issue record."""
+    created_at = now - timedelta(minutes=rng.randint(10, max_age_days * 24 * 60))
+    closed = rng.random() < 0.4
+    closed_at = None
+    if closed:
+        closed_at = min(now, created_at + timedelta(hours=rng.randint(1, 24 * 40)))
+
+    word = rng.choice(WORDS)
+    sections = rng.sample(BODY_SECTIONS, rng.randint(0, len(BODY_SECTIONS)))
+    body = "\n\n".join(
+        [f"The {word} should handle this case properly."]
+        + [section.format(word=word) for section in sections]
+    )
+
+    labels = []
+    if rng.random() < 0.6:
+        labels.append(rng.choice(BEGINNER_LABELS))
+    labels.extend(rng.sample(OTHER_LABELS, rng.randint(0, 2)))
+
+    size = rng.choice(["small", "minor", "follow-up", "cleanup"])
+    return {
+        "number": number,
+        "title": f"Improve {word} handling ({size})",
+        "body": body,
+        "state": "closed" if closed else "open",
+        "created_at": created_at,
+        "updated_at": closed_at or min(now, created_at + timedelta(hours=rng.randint(0, 72))),
+        "closed_at": closed_at,
+        "labels": labels,
+        "comments": rng.randint(0, 8),
+        "author": f"user{rng.randint(1, 500)}",
+    }
+
+
+def generate_corpus(
+    seed: int = 0,
+    repos: int = 200,
+    issues_per_repo: int = 20,
+    users: int = 5,
+    projects: int = 50,
+    max_age_days: int = 400,
+    now: Optional[datetime] = None,
+) -> Corpus:
+    """Generate a deterministic corpus.
+
+    The same seed always yields the same data; dates are relative to `now`,
+    so the issues stay inside gfi's default age filters.
+
+    Args:
+        seed: Random seed
+        repos: Number of GitHub repositories
+        issues_per_repo: Issues per repository (open and closed)
+        users: Number of GitHub users (the first one is returned by /user)
+        projects: Number of GitLab projects
+        max_age_days: Oldest issue age
+        now: Reference time (defaults to the current UTC time)
+    """
+    rng = random.Random(seed)
+    now = (now or datetime.now(timezone.utc).replace(tzinfo=None)).replace(microsecond=0)
+    corpus = Corpus()
+
+    for index in range(repos):
+        owner = f"org{index % max(1, repos // 4)}"
+        name = f"{rng.choice(WORDS)}-{index}"
+        language = rng.choice(LANGUAGES)
+        corpus.repos[(owner, name)] = {
+            "id": index + 1,
+            "name": name,
+            "full_name": f"{owner}/{name}",
+            "owner": owner,
+            "description": f"A {language} {rng.choice(TOPICS)} project",
+            "stargazers_count": int(rng.paretovariate(0.8) * 10),
+            "language": language,
+            "topics": rng.sample(TOPICS, rng.randint(0, 3)),
+            "updated_at": now - timedelta(days=rng.randint(0, 60)),
+            "created_at": now - timedelta(days=rng.randint(60, 3000)),
+        }
+        corpus.issues[(owner, name)] = [
+            _issue(rng, number, now, max_age_days) for number in range(1, issues_per_repo + 1)
+        ]
+
+    repo_keys = list(corpus.repos)
+    for index in range(users):
+        login = f"dev{index}"
+        starred = []
+        starred_at = now
+        for key in rng.sample(repo_keys, min(len(repo_keys), rng.randint(20, 250))):
+            starred_at -= timedelta(hours=rng.randint(1, 48))
+            starred.append((key, starred_at))
+        corpus.users[login] = {
+            "login": login,
+            "starred": starred,  # Newest first, the order GitHub lists them in
+            "repos": rng.sample(repo_keys, min(len(repo_keys), rng.randint(1, 15))),
+            "contributions": rng.randint(0, 40),
+        }
+    corpus.default_user = "dev0" if users else None
+
+    for index in range(projects):
+        project_id = 1000 + index
+        language = rng.choice(LANGUAGES)
+        namespace = rng.choice(["group", "group/sub", "team"])
+        corpus.projects[project_id] = {
+            "id": project_id,
+            "path_with_namespace": f"{namespace}/{rng.choice(WORDS)}-{index}",
+            "description": f"A {language} project on GitLab",
+            "star_count": int(rng.paretovariate(0.8) * 5),
+            "languages": {language: 85.0, "Shell": 15.0},
+        }
+        corpus.project_issues[project_id] = [
+            _issue(rng, number, now, max_age_days) for number in range(1, issues_per_repo + 1)
+        ]
+
+    return corpus
@@ -0,0 +1,393 @@
+"""Minimal GraphQL handling for the API emulator.
+
+This is not a GraphQL engine. Documents are scanned for their root fields
+(with aliases and arguments), and each known root field is resolved to a
+complete object - every field gfi selects, whatever the selection set asks
+for. That is enough for the queries gfi sends, and keeps the emulator free
+of extra dependencies.
+"""
+
+import base64
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .corpus import Corpus, iso
+from .search import MAX_SEARCH_RESULTS, search
+
+FIELD_PATTERN = re.compile(r"\s*(?:(\w+)\s*:\s*)?(\w+)\s*")
+NAME_PATTERN = re.compile(r"(\w+)\s*:\s*")
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.b64encode(f"cursor:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        return int(base64.b64decode(cursor).decode().split(":", 1)[1])
+    except (ValueError, IndexError):
+        return 0
+
+
+def _matching(text: str, position: int, opening: str, closing: str) -> int:
+    """Index just past the bracket that closes the one at `position`."""
+    depth = 0
+    for index in range(position, len(text)):
+        if text[index] == opening:
+            depth += 1
+        elif text[index] == closing:
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    raise ValueError(f"Unbalanced {opening}{closing} in GraphQL document")
+
+
+def root_fields(document: str) -> List[Tuple[str, str, str, str]]:
+    """Find the root fields of a document's operation.
+
+    Returns:
+        (alias, field name, argument text, selection text) per root field
+    """
+    # Skip the operation header, e.g. query($q: String!)
+    start = document.index("{")
+    end = _matching(document, start, "{", "}")
+    body = document[start + 1 : end - 1]
+
+    fields = []
+    position = 0
+    while position < len(body):
+        match = FIELD_PATTERN.match(body, position)
+        if not match or match.end() == position:
+            position += 1
+            continue
+        alias, name = match.group(1), match.group(2)
+        position = match.end()
+
+        arguments = ""
+        if position < len(body) and body[position] == "(":
+            close = _matching(body, position, "(", ")")
+            arguments = body[position + 1 : close - 1]
+            position = close
+        while position < len(body) and body[position].isspace():
+            position += 1
+
+        selection = ""
+        if position < len(body) and body[position] == "{":
+            close = _matching(body, position, "{", "}")
+            selection = body[position + 1 : close - 1]
+            position = close
+        fields.append((alias or name, name, arguments, selection))
+    return fields
+
+
+def _read_value(text: str, position: int) -> Tuple[str, int]:
+    """Read one raw value (list, object, string or token) starting at position."""
+    char = text[position]
+    if char in "[{":
+        end = _matching(text, position, char, "]" if char == "[" else "}")
+    elif char == '"':
+        end = text.index('"', position + 1) + 1
+    else:
+        match = re.compile(r"[^\s,\])}]+").match(text, position)
+        end = match.end()
+    return text[position:end], end
+
+
+def _skip_separators(text: str, position: int) -> int:
+    # Commas are optional in GraphQL - whitespace separates just as well
+    while position < len(text) and (text[position].isspace() or text[position] == ","):
+        position += 1
+    return position
+
+
+def _value(raw: str, variables: Dict[str, Any]) -> Any:
+    raw = raw.strip()
+    if raw.startswith("$"):
+        return variables.get(raw[1:])
+    if raw.startswith('"'):
+        return raw.strip('"')
+    if raw.startswith("["):
+        items, position, inner = [], _skip_separators(raw[1:-1], 0), raw[1:-1]
+        while position < len(inner):
+            item, position = _read_value(inner, position)
+            items.append(_value(item, variables))
+            position = _skip_separators(inner, position)
+        return items
+    if raw.startswith("{"):
+        return raw  # Objects (orderBy) are accepted and ignored
+    if raw in ("true", "false"):
+        return raw == "true"
+    if raw == "null":
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        return raw  # Enum value
+
+
+def parse_arguments(text: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse `name: value` argument text, resolving $variables."""
+    arguments = {}
+    position = _skip_separators(text, 0)
+    while position < len(text):
+        match = NAME_PATTERN.match(text, position)
+        if not match:
+            raise ValueError(f"Can't parse GraphQL arguments: {text.strip()}")
+        raw, position = _read_value(text, match.end())
+        arguments[match.group(1)] = _value(raw, variables)
+        position = _skip_separators(text, position)
+    return arguments
+
+
+def nested_arguments(selection: str, field: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments of a field inside a selection set, e.g. issues(first: 10)."""
+    match = re.search(rf"\b{field}\s*\(", selection)
+    if not match:
+        return {}
+    start = match.end() - 1
+    return parse_arguments(
+        selection[start + 1 : _matching(selection, start, "(", ")") - 1], variables
+    )
+
+
+class GitHubGraphQL:
+    """Resolves GitHub GraphQL root fields: search, repository, user, rateLimit."""
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+
+    def execute(self, document: str, variables: Dict[str, Any], rate_limit: dict) -> dict:
+        """Run a document and build the {"data": ..., "errors": ...} response."""
+        data, errors = {}, []
+        for alias, name, argument_text, selection in root_fields(document):
+            arguments = parse_arguments(argument_text, variables)
+            if name == "search":
+                data[alias] = self.search(arguments)
+            elif name == "repository":
+                data[alias] = self.repository(arguments, selection, variables)
+                if data[alias] is None:
+                    errors.append(
+                        {
+                            "type": "NOT_FOUND",
+                            "path": [alias],
+                            "message": f"Could not resolve to a Repository with the name "
+                            f"'{arguments.get('owner')}/{arguments.get('name')}'.",
+                        }
+                    )
+            elif name == "user":
+                data[alias] = self.user(arguments, selection, variables)
+                if data[alias] is None:
+                    errors.append(
+                        {"type": "NOT_FOUND", "path": [alias], "message": "User not found"}
+                    )
+            elif name == "rateLimit":
+                data[alias] = rate_limit
+            else:
+                errors.append({"message": f"Field '{name}' doesn't exist on type 'Query'"})
+
+        response = {"data": data}
+        if errors:
+            response["errors"] = errors
+        return response
+
+    def search(self, arguments: Dict[str, Any]) -> dict:
+        matches = search(self.corpus.github_issues(), arguments.get("query") or "")
+        first = min(int(arguments.get("first") or 0), 100)
+        offset = decode_cursor(arguments.get("after"))
+        end = min(offset + first, len(matches), MAX_SEARCH_RESULTS)
+        page = matches[offset:end] if offset < end else []
+        return {
+            "issueCount": len(matches),
+            "pageInfo": {
+                "hasNextPage": end < min(len(matches), MAX_SEARCH_RESULTS),
+                "endCursor": encode_cursor(end) if page else None,
+            },
+            "nodes": [self.issue_node(issue, repo) for issue, repo in page],
+        }
+
+    def repository(
+        self, arguments: Dict[str, Any], selection: str, variables: Dict[str, Any]
+    ) -> Optional[dict]:
+        key = (arguments.get("owner"), arguments.get("name"))
+        repo = self.corpus.repos.get(key)
+        if repo is None:
+            return None
+
+        issue_arguments = nested_arguments(selection, "issues", variables)
+        states = issue_arguments.get("states") or ["OPEN", "CLOSED"]
+        if isinstance(states, str):
+            states = [states]
+        wanted = {state.lower() for state in states}
+        issues = [issue for issue in self.corpus.issues[key] if issue["state"] in wanted]
+        issues.sort(key=lambda issue: issue["updated_at"], reverse=True)
+        issues = issues[: min(int(issue_arguments.get("first") or 100), 100)]
+
+        return {
+            **self.repo_node(repo),
+            "issues": {
+                "totalCount": len(issues),
+                "nodes": [self.issue_node(issue, repo) for issue in issues],
+            },
+        }
+
+    def user(
+        self, arguments: Dict[str, Any], selection: str, variables: Dict[str, Any]
+    ) -> Optional[dict]:
+        user = self.corpus.users.get(arguments.get("login"))
+        if user is None:
+            return None
+
+        star_arguments = nested_arguments(selection, "starredRepositories", variables)
+        first = min(int(star_arguments.get("first") or 100), 100)
+        offset = decode_cursor(star_arguments.get("after"))
+        starred = user["starred"][offset : offset + first]
+        end = offset + len(starred)
+
+        return {
+            "login": user["login"],
+            "repositories": {
+                "totalCount": len(user["repos"]),
+                "nodes": [self.repo_node(self.corpus.repos[key]) for key in user["repos"]],
+            },
+            "starredRepositories": {
+                "totalCount": len(user["starred"]),
+                "pageInfo": {
+                    "hasNextPage": end < len(user["starred"]),
+                    "endCursor": encode_cursor(end) if starred else None,
+                },
+                "nodes": [self.repo_node(self.corpus.repos[key]) for key, _ in starred],
+                "edges": [
+                    {"starredAt": iso(starred_at), "node": self.repo_node(self.corpus.repos[key])}
+                    for key, starred_at in starred
+                ],
+            },
+            "contributionsCollection": {"totalRepositoryContributions": user["contributions"]},
+        }
+
+    @staticmethod
+    def repo_node(repo: dict) -> dict:
+        return {
+            "owner": {"login": repo["owner"]},
+            "name": repo["name"],
+            "nameWithOwner": repo["full_name"],
+            "description": repo["description"],
+            "stargazerCount": repo["stargazers_count"],
+            "primaryLanguage": {"name": repo["language"]} if repo["language"] else None,
+            "repositoryTopics": {"nodes": [{"topic": {"name": topic}} for topic in repo["topics"]]},
+        }
+
+    def issue_node(self, issue: dict, repo: dict) -> dict:
+        return {
+            "number": issue["number"],
+            "title": issue["title"],
+            "url": f"https://github.com/{repo['full_name']}/issues/{issue['number']}",
+            "body": issue["body"],
+            "state": issue["state"].upper(),
+            "createdAt": iso(issue["created_at"]),
+            "updatedAt": iso(issue["updated_at"]),
+            "closedAt": iso(issue["closed_at"]) if issue["closed_at"] else None,
+            "comments": {"totalCount": issue["comments"]},
+            "labels": {"nodes": [{"name": label} for label in issue["labels"]]},
+            "author": {"login": issue["author"]},
+            "repository": self.repo_node(repo),
+        }
+
+
+class GitLabGraphQL:
+    """Resolves GitLab GraphQL root fields: issues and projects."""
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+
+    def execute(self, document: str, variables: Dict[str, Any]) -> dict:
+        data, errors = {}, []
+        for alias, name, argument_text, _ in root_fields(document):
+            arguments = parse_arguments(argument_text, variables)
+            if name == "issues":
+                data[alias] = self.issues(arguments)
+            elif name == "projects":
+                data[alias] = self.projects(arguments)
+            else:
+                errors.append({"message": f"Field '{name}' doesn't exist on type 'Query'"})
+
+        response = {"data": data}
+        if errors:
+            response["errors"] = errors
+        return response
+
+    def issues(self, arguments: Dict[str, Any]) -> dict:
+        labels = {label.lower() for label in arguments.get("labelName") or []}
+        state = {"opened": "open", "closed": "closed"}.get(str(arguments.get("state") or ""), None)
+        created_after = _parse_time(arguments.get("createdAfter"))
+        updated_after = _parse_time(arguments.get("updatedAfter"))
+
+        matches = [
+            (issue, project)
+            for issue, project in self.corpus.gitlab_issues()
+            if labels <= {label.lower() for label in issue["labels"]}
+            and (state is None or issue["state"] == state)
+            and (created_after is None or issue["created_at"] >= created_after)
+            and (updated_after is None or issue["updated_at"] >= updated_after)
+        ]
+        if arguments.get("sort") == "CREATED_ASC":
+            matches.reverse()
+
+        first = min(int(arguments.get("first") or 20), 100)
+        offset = decode_cursor(arguments.get("after"))
+        page = matches[offset : offset + first]
+        end = offset + len(page)
+        return {
+            "count": len(matches),
+            "pageInfo": {
+                "hasNextPage": end < len(matches),
+                "endCursor": encode_cursor(end) if page else None,
+            },
+            "nodes": [
+                {
+                    "iid": str(issue["number"]),
+                    "title": issue["title"],
+                    "webUrl": f"https://gitlab.com/{project['path_with_namespace']}/-/issues/{issue['number']}",
+                    "description": issue["body"],
+                    "state": "opened" if issue["state"] == "open" else "closed",
+                    "createdAt": iso(issue["created_at"]),
+                    "updatedAt": iso(issue["updated_at"]),
+                    "projectId": project["id"],
+                    "userNotesCount": issue["comments"],
+                    "labels": {"nodes": [{"title": label} for label in issue["labels"]]},
+                    "author": {"username": issue["author"]},
+                }
+                for issue, project in page
+            ],
+        }
+
+    def projects(self, arguments: Dict[str, Any]) -> dict:
+        nodes = []
+        for gid in arguments.get("ids") or []:
+            try:
+                project = self.corpus.projects.get(int(str(gid).rsplit("/", 1)[-1]))
+            except ValueError:
+                project = None
+            if project is None:
+                continue
+            nodes.append(
+                {
+                    "id": f"gid://gitlab/Project/{project['id']}",
+                    "fullPath": project["path_with_namespace"],
+                    "description": project["description"],
+                    "starCount": project["star_count"],
+                    "languages": [
+                        {"name": name, "share": share}
+                        for name, share in project["languages"].items()
+                    ],
+                }
+            )
+        return {"nodes": nodes}
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(str(value).rstrip("Z")).replace(tzinfo=None)
@@ -0,0 +1,150 @@
+"""GitHub issue search query matching for the API emulator."""
+
+import re
+from datetime import date, datetime
+from typing import Callable, List, Optional, Tuple
+
+MAX_SEARCH_RESULTS = 1000  # GitHub only serves the first 1000 matches
+
+# qualifier:value, where value may be a quoted, comma-separated list
+TOKEN_PATTERN = re.compile(
+    r'(-?)(\w+):((?:"[^"]*"|[^\s",]+)(?:,(?:"[^"]*"|[^\s",]+))*)|"([^"]*)"|(\S+)'
+)
+
+Predicate = Callable[[dict, dict], bool]
+
+
+def _values(raw: str) -> List[str]:
+    """Split a qualifier value into its comma-separated (OR-ed) parts."""
+    return [part.strip('"') for part in re.findall(r'"[^"]*"|[^,]+', raw)]
+
+
+def _range(
+    raw: str, parse: Callable[[str], object]
+) -> Tuple[Optional[object], Optional[object], bool, bool]:
+    """Parse >=x, >x, <=x, <x, a..b or x into (low, high, low_inclusive, high_inclusive)."""
+    if ".." in raw:
+        low, _, high = raw.partition("..")
+        return (
+            parse(low) if low not in ("", "*") else None,
+            parse(high) if high not in ("", "*") else None,
+            True,
+            True,
+        )
+    for prefix, bounds in (
+        (">=", (True, None)),
+        ("<=", (None, True)),
+        (">", (False, None)),
+        ("<", (None, False)),
+    ):
+        if raw.startswith(prefix):
+            value = parse(raw[len(prefix) :])
+            if bounds[0] is not None:
+                return value, None, bounds[0], True
+            return None, value, True, bounds[1]
+    value = parse(raw)
+    return value, value, True, True
+
+
+def _in_range(value, bounds) -> bool:
+    low, high, low_inclusive, high_inclusive = bounds
+    if low is not None and (value < low or (value == low and not low_inclusive)):
+        return False
+    if high is not None and (value > high or (value == high and not high_inclusive)):
+        return False
+    return True
+
+
+def _parse_date(raw: str) -> date:
+    return datetime.fromisoformat(raw.rstrip("Z")).date() if "T" in raw else date.fromisoformat(raw)
+
+
+def compile_query(query: str) -> Tuple[Predicate, Optional[str]]:
+    """Compile a search query into a predicate over (issue, repo) records.
+
+    Supports the qualifiers gfi sends: is:/state: (open, closed, issue),
+    label: (comma-separated values are OR-ed, repeated qualifiers AND-ed),
+    language: (repeated qualifiers OR-ed), stars:, created:, repo:, user:
+    and sort:. Other qualifiers are ignored; bare words must appear in the
+    title or body.
+
+    Returns:
+        (predicate, sort qualifier value or None)
+    """
+    checks: List[Predicate] = []
+    languages: List[str] = []
+    sort = None
+
+    for negate, name, raw, quoted, word in TOKEN_PATTERN.findall(query):
+        if not name:
+            text = (quoted or word).lower()
+            checks.append(
+                lambda issue, repo, text=text: text in f"{issue['title']} {issue['body']}".lower()
+            )
+            continue
+
+        name = name.lower()
+        if name in ("is", "state"):
+            if raw in ("open", "closed"):
+                checks.append(lambda issue, repo, state=raw: issue["state"] == state)
+        elif name == "label":
+            wanted = {value.lower() for value in _values(raw)}
+
+            def check(issue, repo, wanted=wanted):
+                return bool(wanted & {label.lower() for label in issue["labels"]})
+
+            if negate:
+                checks.append(lambda issue, repo, check=check: not check(issue, repo))
+            else:
+                checks.append(check)
+        elif name == "language":
+            languages.extend(value.lower() for value in _values(raw))
+        elif name == "stars":
+            bounds = _range(raw, int)
+            checks.append(
+                lambda issue, repo, bounds=bounds: _in_range(repo["stargazers_count"], bounds)
+            )
+        elif name == "created":
+            bounds = _range(raw, _parse_date)
+            checks.append(
+                lambda issue, repo, bounds=bounds: _in_range(issue["created_at"].date(), bounds)
+            )
+        elif name == "repo":
+            checks.append(
+                lambda issue, repo, full_name=raw.lower(): repo["full_name"].lower() == full_name
+            )
+        elif name in ("user", "org"):
+            checks.append(lambda issue, repo, owner=raw.lower(): repo["owner"].lower() == owner)
+        elif name == "sort":
+            sort = raw
+
+    if languages:
+        checks.append(lambda issue, repo: (repo["language"] or "").lower() in languages)
+
+    def predicate(issue: dict, repo: dict) -> bool:
+        return all(check(issue, repo) for check in checks)
+
+    return predicate, sort
+
+
+def search(
+    pairs: List[Tuple[dict, dict]], query: str, sort: Optional[str] = None, order: str = "desc"
+) -> List[Tuple[dict, dict]]:
+    """Filter and sort (issue, repo) pairs with a search query.
+
+    Args:
+        pairs: Candidate (issue, repo) pairs
+        query: GitHub search query string
+        sort: REST sort parameter (created, updated, comments); a sort:
+            qualifier in the query takes precedence
+        order: asc or desc
+    """
+    predicate, sort_qualifier = compile_query(query)
+    if sort_qualifier:
+        sort, _, direction = sort_qualifier.partition("-")
+        order = direction or "desc"
+
+    matches = [pair for pair in pairs if predicate(*pair)]
+    field = {"updated": "updated_at", "comments": "comments"}.get(sort or "", "created_at")
+    matches.sort(key=lambda pair: pair[0][field], reverse=order != "asc")
+    return matches
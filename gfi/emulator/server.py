@@ -0,0 +1,435 @@
+"""Flask app emulating the GitHub and GitLab APIs gfi uses."""
+
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from flask import Flask, Response, g, jsonify, request
+from pydantic import BaseModel
+
+from .corpus import Corpus, iso
+from .graphql import GitHubGraphQL, GitLabGraphQL
+from .search import MAX_SEARCH_RESULTS, search
+
+
+class EmulatorConfig(BaseModel):
+    """Latency, rate limits and fault injection for the emulator."""
+
+    latency_ms: float = 0  # Added to every request
+    jitter_ms: float = 0  # Random extra latency, up to this much
+    core_limit: int = 5000  # GitHub REST requests per hour
+    search_limit: int = 30  # GitHub search requests per minute
+    graphql_limit: int = 5000  # GitHub GraphQL points per hour (1 point per query)
+    gitlab_limit: int = 2000  # GitLab requests per minute
+    throttle_rate: float = 0.0  # Share of requests answered 403 (GitHub) / 429 (GitLab)
+    error_rate: float = 0.0  # Share of requests answered 502
+    retry_after: int = 1  # Retry-After seconds on throttled responses
+    seed: int = 0  # Seeds latency jitter and fault injection
+
+
+class RateLimits:
+    """Fixed-window request counters per (token, resource)."""
+
+    WINDOWS = {"core": 3600, "search": 60, "graphql": 3600, "gitlab": 60}
+
+    def __init__(self, config: EmulatorConfig):
+        self.limits = {
+            "core": config.core_limit,
+            "search": config.search_limit,
+            "graphql": config.graphql_limit,
+            "gitlab": config.gitlab_limit,
+        }
+        self._windows: Dict[Tuple[str, str], List[float]] = {}  # -> [reset_at, used]
+        self._lock = threading.Lock()
+
+    def _window(self, token: str, resource: str) -> List[float]:
+        now = time.time()
+        window = self._windows.get((token, resource))
+        if window is None or now >= window[0]:
+            window = self._windows[(token, resource)] = [now + self.WINDOWS[resource], 0]
+        return window
+
+    def exhausted(self, token: str, resource: str) -> bool:
+        with self._lock:
+            return self._window(token, resource)[1] >= self.limits[resource]
+
+    def charge(self, token: str, resource: str, cost: int = 1):
+        with self._lock:
+            self._window(token, resource)[1] += cost
+
+    def status(self, token: str, resource: str) -> dict:
+        """Limit, remaining and reset (epoch seconds) for a token's resource."""
+        with self._lock:
+            reset_at, used = self._window(token, resource)
+            limit = self.limits[resource]
+            return {"limit": limit, "remaining": max(0, int(limit - used)), "reset": int(reset_at)}
+
+
+def _resource(path: str) -> str:
+    if path.startswith("/api/"):
+        return "gitlab"
+    if path.startswith("/search/"):
+        return "search"
+    if path == "/graphql":
+        return "graphql"
+    return "core"
+
+
+def _token() -> str:
+    auth = request.headers.get("Authorization", "")
+    token = auth.split(" ", 1)[-1] if auth else request.headers.get("PRIVATE-TOKEN", "")
+    return token or f"anonymous:{request.remote_addr}"
+
+
+def _page_args(default_per_page: int = 30) -> Tuple[int, int]:
+    page = max(1, request.args.get("page", 1, type=int))
+    per_page = min(100, max(1, request.args.get("per_page", default_per_page, type=int)))
+    return page, per_page
+
+
+def _link_header(page: int, last_page: int) -> Optional[str]:
+    """Build a GitHub/GitLab style Link header for page-numbered results."""
+
+    def url(number):
+        args = {**request.args.to_dict(), "page": number}
+        return f"{request.base_url}?{urlencode(args)}"
+
+    links = []
+    if page < last_page:
+        links.append(f'<{url(page + 1)}>; rel="next"')
+        links.append(f'<{url(last_page)}>; rel="last"')
+    if page > 1:
+        links.append(f'<{url(1)}>; rel="first"')
+        links.append(f'<{url(page - 1)}>; rel="prev"')
+    return ", ".join(links) or None
+
+
+def _paginate(items: list, page: int, per_page: int):
+    """Slice a page of items and respond with a Link header."""
+    last_page = max(1, -(-len(items) // per_page))
+    response = jsonify(items[(page - 1) * per_page : page * per_page])
+    link = _link_header(page, last_page)
+    if link:
+        response.headers["Link"] = link
+    return response
+
+
+def create_app(corpus: Corpus, config: Optional[EmulatorConfig] = None) -> Flask:
+    """Create the emulator app serving a corpus.
+
+    GitHub REST is served from the root, GitHub GraphQL at /graphql and
+    GitLab at /api/v4 and /api/graphql, so both platforms can point at the
+    same base URL (GFI_GITHUB_API_URL and GFI_GITLAB_URL).
+
+    Args:
+        corpus: Data to serve (see generate_corpus)
+        config: Latency, rate limit and fault injection settings
+    """
+    config = config or EmulatorConfig()
+    app = Flask(__name__)
+    limits = RateLimits(config)
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+    github_graphql = GitHubGraphQL(corpus)
+    gitlab_graphql = GitLabGraphQL(corpus)
+    app.config["EMULATOR_STATS"] = stats = {
+        "requests": 0,
+        "throttled": 0,
+        "errors": 0,
+        "not_modified": 0,
+    }
+
+    def api_base() -> str:
+        return request.host_url.rstrip("/")
+
+    def rest_repo(repo: dict) -> dict:
+        base = api_base()
+        return {
+            "id": repo["id"],
+            "name": repo["name"],
+            "full_name": repo["full_name"],
+            "owner": {"login": repo["owner"]},
+            "description": repo["description"],
+            "stargazers_count": repo["stargazers_count"],
+            "language": repo["language"],
+            "topics": repo["topics"],
+            "html_url": f"https://github.com/{repo['full_name']}",
+            "url": f"{base}/repos/{repo['full_name']}",
+            "created_at": iso(repo["created_at"]),
+            "updated_at": iso(repo["updated_at"]),
+        }
+
+    def rest_issue(issue: dict, repo: dict) -> dict:
+        base = api_base()
+        return {
+            "url": f"{base}/repos/{repo['full_name']}/issues/{issue['number']}",
+            "repository_url": f"{base}/repos/{repo['full_name']}",
+            "html_url": f"https://github.com/{repo['full_name']}/issues/{issue['number']}",
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "state": issue["state"],
+            "created_at": iso(issue["created_at"]),
+            "updated_at": iso(issue["updated_at"]),
+            "closed_at": iso(issue["closed_at"]) if issue["closed_at"] else None,
+            "labels": [{"name": label} for label in issue["labels"]],
+            "comments": issue["comments"],
+            "user": {"login": issue["author"]},
+        }
+
+    def gitlab_issue(issue: dict, project: dict) -> dict:
+        return {
+            "id": project["id"] * 100_000 + issue["number"],
+            "iid": issue["number"],
+            "project_id": project["id"],
+            "title": issue["title"],
+            "description": issue["body"],
+            "state": "opened" if issue["state"] == "open" else "closed",
+            "created_at": iso(issue["created_at"]),
+            "updated_at": iso(issue["updated_at"]),
+            "closed_at": iso(issue["closed_at"]) if issue["closed_at"] else None,
+            "labels": issue["labels"],
+            "user_notes_count": issue["comments"],
+            "web_url": f"https://gitlab.com/{project['path_with_namespace']}/-/issues/{issue['number']}",
+            "author": {"username": issue["author"]},
+        }
+
+    def error(status: int, message: str, retry_after: Optional[int] = None):
+        response = jsonify({"message": message})
+        response.status_code = status
+        if retry_after is not None:
+            response.headers["Retry-After"] = str(retry_after)
+        return response
+
+    @app.before_request
+    def simulate_network():
+        g.resource = _resource(request.path)
+        g.token = _token()
+        stats["requests"] += 1
+
+        with rng_lock:
+            delay = config.latency_ms + rng.uniform(0, config.jitter_ms)
+            roll = rng.random()
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if roll < config.error_rate:
+            stats["errors"] += 1
+            return error(502, "Server Error")
+        if roll < config.error_rate + config.throttle_rate:
+            stats["throttled"] += 1
+            if g.resource == "gitlab":
+                return error(429, "Retry later", retry_after=config.retry_after)
+            return error(
+                403,
+                "You have exceeded a secondary rate limit. "
+                "Please wait a few minutes before you try again.",
+                retry_after=config.retry_after,
+            )
+
+        if limits.exhausted(g.token, g.resource):
+            stats["throttled"] += 1
+            status = limits.status(g.token, g.resource)
+            if g.resource == "gitlab":
+                return error(
+                    429, "Retry later", retry_after=max(1, status["reset"] - int(time.time()))
+                )
+            return error(403, f"API rate limit exceeded for {g.resource}.")
+
+    @app.after_request
+    def finish(response: Response):
+        if request.method == "GET" and response.status_code == 200:
+            etag = '"' + hashlib.md5(response.get_data()).hexdigest() + '"'
+            response.headers["ETag"] = etag
+            if etag in request.headers.get("If-None-Match", ""):
+                stats["not_modified"] += 1
+                response.status_code = 304
+                response.set_data(b"")
+
+        if response.status_code != 304:  # Conditional hits are free, as on GitHub
+            limits.charge(g.token, g.resource)
+
+        status = limits.status(g.token, g.resource)
+        if g.resource == "gitlab":
+            response.headers["RateLimit-Limit"] = str(status["limit"])
+            response.headers["RateLimit-Remaining"] = str(status["remaining"])
+            response.headers["RateLimit-Reset"] = str(status["reset"])
+        else:
+            response.headers["X-RateLimit-Limit"] = str(status["limit"])
+            response.headers["X-RateLimit-Remaining"] = str(status["remaining"])
+            response.headers["X-RateLimit-Reset"] = str(status["reset"])
+            response.headers["X-RateLimit-Resource"] = g.resource
+        return response
+
+    # GitHub REST
+
+    @app.get("/user")
+    def get_user():
+        if corpus.default_user is None:
+            return error(401, "Bad credentials")
+        return jsonify({"login": corpus.default_user})
+
+    @app.get("/users/<login>/starred")
+    def get_starred(login):
+        user = corpus.users.get(login)
+        if user is None:
+            return error(404, "Not Found")
+        page, per_page = _page_args()
+        if "star+json" in request.headers.get("Accept", ""):
+            items = [
+                {"starred_at": iso(starred_at), "repo": rest_repo(corpus.repos[key])}
+                for key, starred_at in user["starred"]
+            ]
+        else:
+            items = [rest_repo(corpus.repos[key]) for key, _ in user["starred"]]
+        return _paginate(items, page, per_page)
+
+    @app.get("/users/<login>/repos")
+    def get_user_repos(login):
+        user = corpus.users.get(login)
+        if user is None:
+            return error(404, "Not Found")
+        page, per_page = _page_args()
+        return _paginate([rest_repo(corpus.repos[key]) for key in user["repos"]], page, per_page)
+
+    @app.get("/search/issues")
+    def search_issues():
+        page, per_page = _page_args()
+        if (page - 1) * per_page >= MAX_SEARCH_RESULTS:
+            return error(422, "Only the first 1000 search results are available")
+
+        matches = search(
+            corpus.github_issues(),
+            request.args.get("q", ""),
+            sort=request.args.get("sort"),
+            order=request.args.get("order", "desc"),
+        )
+        reachable = matches[:MAX_SEARCH_RESULTS]
+        last_page = max(1, -(-len(reachable) // per_page))
+        response = jsonify(
+            {
+                "total_count": len(matches),
+                "incomplete_results": False,
+                "items": [
+                    rest_issue(issue, repo)
+                    for issue, repo in reachable[(page - 1) * per_page : page * per_page]
+                ],
+            }
+        )
+        link = _link_header(page, last_page)
+        if link:
+            response.headers["Link"] = link
+        return response
+
+    @app.get("/repos/<owner>/<name>")
+    def get_repo(owner, name):
+        repo = corpus.repos.get((owner, name))
+        if repo is None:
+            return error(404, "Not Found")
+        return jsonify(rest_repo(repo))
+
+    @app.get("/repos/<owner>/<name>/issues")
+    def get_repo_issues(owner, name):
+        repo = corpus.repos.get((owner, name))
+        if repo is None:
+            return error(404, "Not Found")
+        state = request.args.get("state", "open")
+        issues = [
+            issue
+            for issue in corpus.issues[(owner, name)]
+            if state == "all" or issue["state"] == state
+        ]
+        field = "updated_at" if request.args.get("sort") == "updated" else "created_at"
+        issues.sort(
+            key=lambda issue: issue[field], reverse=request.args.get("direction", "desc") != "asc"
+        )
+        page, per_page = _page_args()
+        return _paginate([rest_issue(issue, repo) for issue in issues], page, per_page)
+
+    @app.get("/repos/<owner>/<name>/issues/<int:number>")
+    def get_issue(owner, name, number):
+        repo = corpus.repos.get((owner, name))
+        for issue in corpus.issues.get((owner, name), []):
+            if issue["number"] == number:
+                return jsonify(rest_issue(issue, repo))
+        return error(404, "Not Found")
+
+    # GitHub GraphQL
+
+    @app.post("/graphql")
+    def github_graphql_endpoint():
+        payload = request.get_json(silent=True) or {}
+        status = limits.status(g.token, "graphql")
+        rate_limit = {
+            "cost": 1,
+            "remaining": max(0, status["remaining"] - 1),
+            "limit": status["limit"],
+            "resetAt": iso(datetime.fromtimestamp(status["reset"], timezone.utc)),
+        }
+        try:
+            result = github_graphql.execute(
+                payload.get("query", ""), payload.get("variables") or {}, rate_limit
+            )
+        except ValueError as e:
+            return jsonify({"errors": [{"message": str(e)}]})
+        return jsonify(result)
+
+    # GitLab
+
+    @app.get("/api/v4/issues")
+    def gitlab_issues():
+        labels = {label.lower() for label in request.args.get("labels", "").split(",") if label}
+        state = {"opened": "open", "closed": "closed"}.get(request.args.get("state", "all"))
+        created_after = request.args.get("created_after")
+        updated_after = request.args.get("updated_after")
+
+        def after(moment: datetime, bound: Optional[str]) -> bool:
+            return bound is None or moment >= datetime.fromisoformat(bound.rstrip("Z"))
+
+        matches = [
+            (issue, project)
+            for issue, project in corpus.gitlab_issues()
+            if labels <= {label.lower() for label in issue["labels"]}
+            and (state is None or issue["state"] == state)
+            and after(issue["created_at"], created_after)
+            and after(issue["updated_at"], updated_after)
+        ]
+        field = "updated_at" if request.args.get("order_by") == "updated_at" else "created_at"
+        matches.sort(
+            key=lambda pair: pair[0][field], reverse=request.args.get("sort", "desc") != "asc"
+        )
+
+        page, per_page = _page_args(default_per_page=20)
+        return _paginate(
+            [gitlab_issue(issue, project) for issue, project in matches], page, per_page
+        )
+
+    @app.get("/api/v4/projects/<int:project_id>")
+    def gitlab_project(project_id):
+        project = corpus.projects.get(project_id)
+        if project is None:
+            return error(404, "404 Project Not Found")
+        return jsonify({key: value for key, value in project.items() if key != "languages"})
+
+    @app.get("/api/v4/projects/<int:project_id>/languages")
+    def gitlab_project_languages(project_id):
+        project = corpus.projects.get(project_id)
+        if project is None:
+            return error(404, "404 Project Not Found")
+        return jsonify(project["languages"])
+
+    @app.post("/api/graphql")
+    def gitlab_graphql_endpoint():
+        payload = request.get_json(silent=True) or {}
+        try:
+            return jsonify(
+                gitlab_graphql.execute(payload.get("query", ""), payload.get("variables") or {})
+            )
+        except ValueError as e:
+            return jsonify({"errors": [{"message": str(e)}]})
+
+    return app
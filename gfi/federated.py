@@ -0,0 +1,154 @@
+"""Concurrent search across several platforms (GitHub, GitLab)."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def repo_identity(issue) -> Tuple[str, str]:
+    """Platform-neutral repo key used to spot mirrors.
+
+    GitLab owners are full namespaces (group/subgroup), so only the last
+    segment is compared with the GitHub owner.
+    """
+    return issue.repo_owner.split("/")[-1].lower(), issue.repo_name.lower()
+
+
+class FederatedClient:
+    """Searches every platform at once behind the single-client interface.
+
+    Each platform client only needs search_good_first_issues; the searches
+    run in parallel, so a search takes as long as the slowest platform. The
+    results are interleaved, and issues from GitLab mirrors of GitHub repos
+    are dropped. Maintainer lookups made while scoring are routed back to the
+    platform each repo came from.
+    """
+
+    def __init__(self, clients: Dict[str, Any]):
+        """Initialize federated client.
+
+        Args:
+            clients: Platform name -> client, in order of preference for mirrors
+        """
+        self.clients = clients
+        self._repo_platforms: Dict[Tuple[str, str], str] = {}
+        self._errors: List[str] = []
+
+    @property
+    def errors(self) -> List[str]:
+        """Failures skipped over: failed platform searches and each platform client's own."""
+        errors = list(self._errors)
+        for name, client in self.clients.items():
+            errors.extend(f"{name}: {message}" for message in getattr(client, "errors", []))
+        return errors
+
+    def search_good_first_issues(
+        self,
+        languages: List[str],
+        min_stars: int = 50,
+        max_age_days: int = 30,
+        limit: int = 30,
+        labels: Optional[List[str]] = None,
+    ) -> list:
+        """Search every platform concurrently and merge the results.
+
+        A platform that fails is skipped and recorded in `errors`; the search
+        only fails if every platform does.
+
+        Args:
+            languages: List of programming languages to filter by
+            min_stars: Minimum repository star count
+            max_age_days: Maximum issue age in days
+            limit: Maximum number of results
+            labels: Issue labels to search for
+        """
+
+        def search(client):
+            return client.search_good_first_issues(
+                languages=languages,
+                min_stars=min_stars,
+                max_age_days=max_age_days,
+                limit=limit,
+                labels=labels,
+            )
+
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as pool:
+            futures = {name: pool.submit(search, client) for name, client in self.clients.items()}
+
+        results = {}
+        errors = []
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                self._errors.append(f"{name} search failed: {e}")
+                errors.append(e)
+
+        if errors and not results:
+            raise errors[0]
+
+        return self._merge(results)[:limit]
+
+    def _merge(self, results: Dict[str, list]) -> list:
+        """Interleave platform results, dropping issues from mirrored repos."""
+        # A repo belongs to the first platform (in client order) it was found on
+        owners = {}
+        for name in self.clients:
+            for issue in results.get(name, []):
+                owners.setdefault(repo_identity(issue), name)
+
+        streams = []
+        for name in self.clients:
+            issues = [
+                issue for issue in results.get(name, []) if owners[repo_identity(issue)] == name
+            ]
+            for issue in issues:
+                self._repo_platforms[(issue.repo_owner, issue.repo_name)] = name
+            streams.append(issues)
+
+        # Round-robin so every platform is represented near the top
+        merged = []
+        for position in range(max((len(stream) for stream in streams), default=0)):
+            merged.extend(stream[position] for stream in streams if position < len(stream))
+        return merged
+
+    def _client_for(self, owner: str, repo: str):
+        name = self._repo_platforms.get((owner, repo))
+        return self.clients.get(name) if name else None
+
+    def get_repo_issues(
+        self, owner: str, repo: str, state: str = "all", limit: int = 100
+    ) -> List[dict]:
+        """Get recent issues from a repo on the platform it was found on."""
+        client = self._client_for(owner, repo)
+        if client is None or not hasattr(client, "get_repo_issues"):
+            return []  # Scored as neutral
+        return client.get_repo_issues(owner, repo, state=state, limit=limit)
+
+    def get_repos_closed_issues(
+        self, repos: List[Tuple[str, str]], limit: int = 10
+    ) -> Dict[Tuple[str, str], List[dict]]:
+        """Bulk-fetch closed issues, grouped by each repo's platform."""
+        by_platform: Dict[str, List[Tuple[str, str]]] = {}
+        for key in dict.fromkeys(repos):
+            name = self._repo_platforms.get(key)
+            if name:
+                by_platform.setdefault(name, []).append(key)
+
+        results = {}
+        for name, keys in by_platform.items():
+            client = self.clients[name]
+            if hasattr(client, "get_repos_closed_issues"):
+                results.update(client.get_repos_closed_issues(keys, limit=limit))
+        return results
+
+    def close(self):
+        """Close every platform client."""
+        for client in self.clients.values():
+            if hasattr(client, "close"):
+                client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,10 +1,17 @@
 """GitHub API client."""
 
 import httpx
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from pydantic import BaseModel
-from .cache import DiskCache
+from .cache import create_cache
+from .planner import MAX_RESULTS_PER_QUERY, cap_per_pair, plan_queries
+from . import singleflight
+from .ratelimit import get_scheduler
+from .tokens import TokenPool
+from .transport import create_client
 
 
 class Issue(BaseModel):
@@ -36,56 +43,241 @@ class UserProfile(BaseModel):
     contributed_count: int
 
 
+def parse_repo_url(repository_url: str) -> Tuple[str, str]:
+    """Split an API repository URL into (owner, repo)."""
+    repo_parts = repository_url.split("/")
+    return repo_parts[-2], repo_parts[-1]
+
+
+def issue_from_item(item: dict, owner: str, repo_name: str, repo: dict) -> Issue:
+    """Build an Issue from a REST issue payload and its repository details."""
+    return Issue(
+        number=item["number"],
+        title=item["title"],
+        url=item["url"],
+        html_url=item["html_url"],
+        body=item.get("body", ""),
+        state=item["state"],
+        created_at=datetime.fromisoformat(item["created_at"].rstrip("Z")),
+        updated_at=datetime.fromisoformat(item["updated_at"].rstrip("Z")),
+        labels=[lbl["name"] for lbl in item.get("labels", [])],
+        repo_owner=owner,
+        repo_name=repo_name,
+        repo_stars=repo.get("stargazers_count", 0),
+        repo_language=repo.get("language"),
+        repo_description=repo.get("description"),
+        comments=item.get("comments", 0),
+        author=item["user"]["login"],
+    )
+
+
+def link_url(response: httpx.Response, rel: str) -> Optional[str]:
+    """Get the URL for a relation (next, last, ...) from a response's Link header, if any."""
+    try:
+        link = response.headers.get("Link")
+    except AttributeError:
+        return None
+    if not isinstance(link, str):
+        return None
+
+    for part in link.split(","):
+        url, _, params = part.partition(";")
+        if f'rel="{rel}"' in params or f"rel={rel}" in params:
+            return url.strip().strip("<>")
+    return None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an API timestamp (ISO 8601, Z suffix) into a naive UTC datetime."""
+    return datetime.fromisoformat(value.rstrip("Z"))
+
+
+def next_page_url(response: httpx.Response) -> Optional[str]:
+    """Get the rel="next" URL from a response's Link header, if any."""
+    return link_url(response, "next")
+
+
+def last_page_number(response: httpx.Response) -> int:
+    """Get the page number of the rel="last" link, or 1 if there is only one page."""
+    url = link_url(response, "last")
+    if url is None:
+        return 1
+    try:
+        return int(httpx.URL(url).params.get("page", 1))
+    except ValueError:
+        return 1
+
+
+# Overridable to point every GitHub client (REST and GraphQL) at another
+# server, e.g. the local emulator (gfi emulate)
+GITHUB_API_URL = os.getenv("GFI_GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
+# Starred listings with a starred_at timestamp per repo
+STAR_MEDIA_TYPE = "application/vnd.github.star+json"
+
+
 class GitHubClient:
     """GitHub API client with rate limiting and caching."""
 
-    BASE_URL = "https://api.github.com"
+    BASE_URL = GITHUB_API_URL
+    ENRICH_WORKERS = 8  # Parallel repo lookups per search
+    MAX_STARRED = 200  # Starred repos read for profile analysis
+
+    def __init__(
+        self,
+        token: Union[str, List[str], TokenPool],
+        use_cache: bool = True,
+        max_wait: Optional[float] = None,
+    ):
+        """Initialize client.
+
+        Args:
+            token: GitHub token, list of tokens, or TokenPool to rotate through
+            use_cache: Whether to use disk cache
+            max_wait: Longest a request may wait for rate limit budget before
+                RateLimitExceeded is raised (the scheduler's MAX_WAIT_SECONDS
+                if None)
+        """
+        if isinstance(token, TokenPool):
+            self.tokens = token
+        else:
+            self.tokens = TokenPool([token] if isinstance(token, str) else token)
+        self.token = self.tokens.tokens[0]
+        self.client = create_client(self.BASE_URL, {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github.v3+json",
+        })
+        self.cache = create_cache(enabled=use_cache)
+        self.max_wait = max_wait
+
+    def _get(self, resource: str, url: str, **kwargs) -> httpx.Response:
+        """GET a URL through the rate limit scheduler.
+
+        With several tokens, the request is sent with whichever has the most
+        headroom on `resource`.
 
-    def __init__(self, token: str, use_cache: bool = True):
-        self.token = token
-        self.client = httpx.Client(
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github.v3+json",
-            },
-            timeout=30.0,
+        Args:
+            resource: Rate limit budget to charge ("core" or "search")
+            url: URL to fetch
+            **kwargs: Passed through to httpx
+        """
+        token = self.tokens.checkout(resource)
+        if len(self.tokens) > 1:
+            headers = kwargs.get("headers") or {}
+            kwargs["headers"] = {**headers, "Authorization": f"Bearer {token}"}
+        return get_scheduler(token).send(
+            resource,
+            lambda: self.client.get(url, **kwargs),
+            host=httpx.URL(url).host,
+            max_wait=self.max_wait,
         )
-        self.cache = DiskCache(enabled=use_cache)
+
+    def get_token_stats(self) -> List[dict]:
+        """Get per-token request counts and remaining quota."""
+        return self.tokens.get_stats()
 
     def get_user(self) -> dict:
         """Get authenticated user info."""
-        response = self.client.get(f"{self.BASE_URL}/user")
+        response = self._get("core", f"{self.BASE_URL}/user")
         response.raise_for_status()
         return response.json()
 
-    def get_user_starred(self, username: str, per_page: int = 100) -> List[dict]:
-        """Get user's starred repositories."""
-        repos = []
-        page = 1
-
-        while len(repos) < 200:  # Cap at 200 for speed
-            response = self.client.get(
-                f"{self.BASE_URL}/users/{username}/starred",
-                params={"per_page": per_page, "page": page}
-            )
-            response.raise_for_status()
-            batch = response.json()
-
-            if not batch:
-                break
+    def get_user_stars(
+        self, username: str, since: Optional[datetime] = None, per_page: int = 100
+    ) -> List[dict]:
+        """Get user's stars with their timestamps, newest first.
 
-            repos.extend(batch)
-            page += 1
+        Args:
+            username: GitHub username
+            since: Only return stars added after this time; pages are read
+                until an older star shows up (usually just the first one)
+            per_page: Page size
 
-        return repos
+        Returns:
+            List of {"starred_at", "language", "topics"} dicts
+        """
+        headers = {"Accept": STAR_MEDIA_TYPE}
+        if since is None:
+            items = self._get_starred_pages(username, per_page, headers)
+        else:
+            items = []
+            page = 1
+            while True:
+                response = self._get(
+                    "core",
+                    f"{self.BASE_URL}/users/{username}/starred",
+                    params={"per_page": per_page, "page": page},
+                    headers=headers,
+                )
+                response.raise_for_status()
+                batch = response.json()
+                newer = [item for item in batch if parse_timestamp(item["starred_at"]) > since]
+                items.extend(newer)
+                if len(newer) < len(batch) or len(batch) < per_page:
+                    break
+                page += 1
+
+        return [
+            {
+                "starred_at": item["starred_at"],
+                "language": item["repo"].get("language"),
+                "topics": item["repo"].get("topics", []),
+            }
+            for item in items
+        ]
+
+    def _get_starred_pages(
+        self, username: str, per_page: int, headers: Optional[dict] = None
+    ) -> List[dict]:
+        """Fetch up to MAX_STARRED starred entries, pages after the first in parallel."""
+        url = f"{self.BASE_URL}/users/{username}/starred"
+
+        def fetch(page: int) -> httpx.Response:
+            params = {"per_page": per_page, "page": page}
+            response = self._get("core", url, params=params, headers=headers)
+            response.raise_for_status()
+            return response
+
+        first = fetch(1)
+        items = first.json()
+        max_pages = -(-self.MAX_STARRED // per_page)
+        pages = range(2, min(last_page_number(first), max_pages) + 1)
+        if items and pages:
+            with ThreadPoolExecutor(max_workers=min(self.ENRICH_WORKERS, len(pages))) as pool:
+                for response in pool.map(fetch, pages):
+                    items.extend(response.json())
+        return items
 
     def get_user_repos(self, username: str) -> List[dict]:
-        """Get user's repositories."""
-        response = self.client.get(
+        """Get user's repositories (cached)."""
+        cache_key = f"user_repos:{username}"
+        cached_data = self.cache.get(cache_key, self.cache.PROFILE_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        response = self._get(
+            "core",
             f"{self.BASE_URL}/users/{username}/repos",
             params={"per_page": 100, "sort": "updated"}
         )
         response.raise_for_status()
+        repos = response.json()
+        self.cache.set(cache_key, repos)
+        return repos
+
+    def search_issues(self, query: str, per_page: int = 30) -> dict:
+        """Run a raw issue search query, newest first (uncached).
+
+        Args:
+            query: GitHub search query string
+            per_page: Number of results to return (max 100)
+        """
+        response = self._get(
+            "search",
+            f"{self.BASE_URL}/search/issues",
+            params={"q": query, "sort": "created", "order": "desc", "per_page": per_page},
+        )
+        response.raise_for_status()
         return response.json()
 
     def search_good_first_issues(
@@ -98,89 +290,148 @@ class GitHubClient:
     ) -> List[Issue]:
         """Search for good first issues.
 
+        Languages and labels are OR-ed into as few queries as possible (see
+        plan_queries), and the results are trimmed to `limit` per pair.
+
         Args:
             languages: List of programming languages to filter by
             min_stars: Minimum repository star count
             max_age_days: Maximum issue age in days
-            limit: Maximum number of results
+            limit: Maximum number of results per language/label pair
             labels: Issue labels to search for (defaults to ["good first issue"])
         """
         if labels is None:
             labels = ["good first issue"]
 
+        items = []
+        seen_urls = set()  # Deduplicate across searches
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+
+        # Grouped queries return the newest of their whole union, so each is
+        # read far enough to hold `limit` issues for every pair it covers
+        for planned in plan_queries(languages, labels, min_stars, cutoff_date.date()):
+            wanted = min(MAX_RESULTS_PER_QUERY, limit * planned.pair_count)
+            for item in self._search_items(planned.to_string(), wanted):
+                # Skip duplicates (same issue may match several planned queries)
+                issue_url = item["html_url"]
+                if issue_url in seen_urls:
+                    continue
+                seen_urls.add(issue_url)
+                items.append(item)
+
+        # Enrich with repo details in one batch (deduplicated, cached ones skipped)
+        repo_keys = [parse_repo_url(item["repository_url"]) for item in items]
+        repos = self.get_repos(repo_keys)
+
         issues = []
-        seen_urls = set()  # Deduplicate across label searches
+        for item, (owner, repo_name) in zip(items, repo_keys):
+            issues.append(issue_from_item(item, owner, repo_name, repos[(owner, repo_name)]))
+
+        return cap_per_pair(issues, languages, labels, limit)
+
+    def _search_items(self, query: str, wanted: int) -> List[dict]:
+        """Read a search's newest `wanted` items, one cached page at a time."""
+        per_page = min(100, wanted)
+        items = []
+        page = 1
+        while True:
+            cache_key = f"search:{query}:{per_page}:{page}"
+            data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+            if data is None:
+                data = self._fetch(
+                    cache_key,
+                    f"{self.BASE_URL}/search/issues",
+                    resource="search",
+                    params={
+                        "q": query,
+                        "sort": "created",
+                        "order": "desc",
+                        "per_page": per_page,
+                        "page": page,
+                    }
+                )
+
+            batch = data.get("items", [])
+            items.extend(batch)
+            if len(items) >= min(wanted, data.get("total_count", 0)) or len(batch) < per_page:
+                return items[:wanted]
+            page += 1
+
+    def iter_good_first_issues(
+        self,
+        languages: List[str],
+        min_stars: int = 50,
+        max_age_days: int = 30,
+        limit: Optional[int] = None,
+        labels: Optional[List[str]] = None,
+        per_page: int = 100,
+    ) -> Iterator[Issue]:
+        """Stream good first issues page by page.
+
+        Each planned query is followed through its Link: rel="next" pages.
+        Issues are yielded as soon as their page (and its repos) are fetched,
+        and no more requests are made once the caller stops iterating.
+
+        Args:
+            languages: List of programming languages to filter by
+            min_stars: Minimum repository star count
+            max_age_days: Maximum issue age in days
+            limit: Stop after this many issues (all pages if None)
+            labels: Issue labels to search for (defaults to ["good first issue"])
+            per_page: Search results per page (max 100)
+
+        Yields:
+            Issues, newest first within each planned query
+        """
+        if labels is None:
+            labels = ["good first issue"]
+        if limit is not None:
+            per_page = min(per_page, limit)
+
+        seen_urls = set()
+        yielded = 0
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
 
-        for language in languages:
-            for label in labels:
-                # Build search query
-                query_parts = [
-                    "is:issue",
-                    "is:open",
-                    f'label:"{label}"',
-                    f"language:{language}",
-                    f"stars:>={min_stars}",
-                    f"created:>={cutoff_date.strftime('%Y-%m-%d')}",
-                ]
-                query = " ".join(query_parts)
-
-                # Check cache first
-                cache_key = f"search:{query}:{limit}"
-                cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
-
-                if cached_data is not None:
-                    data = cached_data
-                else:
-                    response = self.client.get(
-                        f"{self.BASE_URL}/search/issues",
-                        params={
-                            "q": query,
-                            "sort": "created",
-                            "order": "desc",
-                            "per_page": min(100, limit),
-                        }
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    self.cache.set(cache_key, data)
-
-                for item in data.get("items", []):
-                    # Skip duplicates (same issue may appear under multiple labels)
-                    issue_url = item["html_url"]
-                    if issue_url in seen_urls:
-                        continue
-                    seen_urls.add(issue_url)
-
-                    # Parse repo info from URL
-                    repo_url = item["repository_url"]
-                    repo_parts = repo_url.split("/")
-                    owner = repo_parts[-2]
-                    repo_name = repo_parts[-1]
-
-                    # Get repo details (also cached)
-                    repo = self.get_repo(owner, repo_name)
-
-                    issues.append(Issue(
-                        number=item["number"],
-                        title=item["title"],
-                        url=item["url"],
-                        html_url=item["html_url"],
-                        body=item.get("body", ""),
-                        state=item["state"],
-                        created_at=datetime.fromisoformat(item["created_at"].rstrip("Z")),
-                        updated_at=datetime.fromisoformat(item["updated_at"].rstrip("Z")),
-                        labels=[lbl["name"] for lbl in item.get("labels", [])],
-                        repo_owner=owner,
-                        repo_name=repo_name,
-                        repo_stars=repo.get("stargazers_count", 0),
-                        repo_language=repo.get("language"),
-                        repo_description=repo.get("description"),
-                        comments=item.get("comments", 0),
-                        author=item["user"]["login"],
-                    ))
-
-        return issues
+        for planned in plan_queries(languages, labels, min_stars, cutoff_date.date()):
+            url = f"{self.BASE_URL}/search/issues"
+            params = {
+                "q": planned.to_string(),
+                "sort": "created",
+                "order": "desc",
+                "per_page": min(100, per_page),
+            }
+
+            while url:
+                page = self._fetch_search_page(url, params)
+                items = [item for item in page["items"] if item["html_url"] not in seen_urls]
+                seen_urls.update(item["html_url"] for item in items)
+
+                repo_keys = [parse_repo_url(item["repository_url"]) for item in items]
+                repos = self.get_repos(repo_keys)
+                for item, (owner, repo_name) in zip(items, repo_keys):
+                    yield issue_from_item(item, owner, repo_name, repos[(owner, repo_name)])
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+
+                # The next URL carries every query parameter
+                url, params = page["next"], None
+
+    def _fetch_search_page(self, url: str, params: Optional[dict] = None) -> dict:
+        """Fetch (or load from cache) one page of search results and its next-page URL."""
+        cache_key = f"search-page:{httpx.URL(url, params=params)}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        response = self._get("search", url, params=params)
+        response.raise_for_status()
+        page = {
+            "items": response.json().get("items", []),
+            "next": next_page_url(response),
+        }
+        self.cache.set(cache_key, page)
+        return page
 
     def get_repo(self, owner: str, repo: str) -> dict:
         """Get repository details."""
@@ -191,48 +442,145 @@ class GitHubClient:
         if cached_data is not None:
             return cached_data
 
-        response = self.client.get(f"{self.BASE_URL}/repos/{owner}/{repo}")
+        return self._fetch_repo(owner, repo)
+
+    def get_repos(self, repo_keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        """Get details for many repositories at once.
+
+        Duplicates are collapsed and cached repos are served from disk; the rest
+        are fetched in parallel on a bounded thread pool.
+
+        Args:
+            repo_keys: (owner, repo) pairs, duplicates allowed
+
+        Returns:
+            Mapping of (owner, repo) to repository details
+        """
+        repos = {}
+        missing = []
+
+        for owner, repo in dict.fromkeys(repo_keys):
+            cached_data = self.cache.get(f"repo:{owner}/{repo}", self.cache.REPO_TTL_MINUTES)
+            if cached_data is not None:
+                repos[(owner, repo)] = cached_data
+            else:
+                missing.append((owner, repo))
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.ENRICH_WORKERS, len(missing))) as pool:
+                fetched = pool.map(lambda key: self._fetch_repo(*key), missing)
+                repos.update(zip(missing, fetched))
+
+        return repos
+
+    def _fetch_repo(self, owner: str, repo: str) -> dict:
+        """Fetch repository details from the API and cache them."""
+        return self._fetch(f"repo:{owner}/{repo}", f"{self.BASE_URL}/repos/{owner}/{repo}")
+
+    def _fetch(
+        self, cache_key: str, url: str, params: Optional[dict] = None, resource: str = "core"
+    ):
+        """GET a URL and cache the JSON body under cache_key.
+
+        If an expired entry with validators exists, the request is conditional
+        and a 304 just refreshes the cached copy (no body, no rate limit cost).
+        Concurrent fetches of the same key, from any client, share one request.
+        """
+        return singleflight.do(
+            cache_key, lambda: self._fetch_uncoalesced(cache_key, url, params, resource)
+        )
+
+    def _fetch_uncoalesced(self, cache_key: str, url: str, params: Optional[dict], resource: str):
+        response = self._get(
+            resource, url, params=params, headers=self.cache.get_conditional_headers(cache_key)
+        )
+
+        if response.status_code == 304:
+            data = self.cache.revalidate(cache_key)
+            if data is not None:
+                return data
+            # Entry vanished between request and response - fetch it in full
+            response = self._get(resource, url, params=params)
+
         response.raise_for_status()
         data = response.json()
-        self.cache.set(cache_key, data)
+        self.cache.set(
+            cache_key,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
         return data
 
     def get_issue(self, owner: str, repo: str, issue_number: int) -> Issue:
         """Get specific issue details."""
-        response = self.client.get(f"{self.BASE_URL}/repos/{owner}/{repo}/issues/{issue_number}")
+        response = self._get("core", f"{self.BASE_URL}/repos/{owner}/{repo}/issues/{issue_number}")
         response.raise_for_status()
         item = response.json()
 
         repo_data = self.get_repo(owner, repo)
 
-        return Issue(
-            number=item["number"],
-            title=item["title"],
-            url=item["url"],
-            html_url=item["html_url"],
-            body=item.get("body", ""),
-            state=item["state"],
-            created_at=datetime.fromisoformat(item["created_at"].rstrip("Z")),
-            updated_at=datetime.fromisoformat(item["updated_at"].rstrip("Z")),
-            labels=[label["name"] for label in item.get("labels", [])],
-            repo_owner=owner,
-            repo_name=repo,
-            repo_stars=repo_data.get("stargazers_count", 0),
-            repo_language=repo_data.get("language"),
-            repo_description=repo_data.get("description"),
-            comments=item.get("comments", 0),
-            author=item["user"]["login"],
-        )
+        return issue_from_item(item, owner, repo, repo_data)
 
     def get_repo_issues(self, owner: str, repo: str, state: str = "all", limit: int = 100) -> List[dict]:
         """Get recent issues from a repo (for analyzing maintainer responsiveness)."""
-        response = self.client.get(
+        response = self._get(
+            "core",
             f"{self.BASE_URL}/repos/{owner}/{repo}/issues",
             params={"state": state, "per_page": limit, "sort": "updated", "direction": "desc"}
         )
         response.raise_for_status()
         return response.json()
 
-    def __del__(self):
-        """Clean up HTTP client."""
+    def get_repos_closed_issues(
+        self, repos: List[Tuple[str, str]], limit: int = 10
+    ) -> Dict[Tuple[str, str], List[dict]]:
+        """Get recently closed issues for many repos at once.
+
+        REST has no batch endpoint, so uncached repos are fetched in parallel on
+        a bounded thread pool. Repos that fail are left out.
+
+        Args:
+            repos: (owner, repo) pairs, duplicates allowed
+            limit: Closed issues to fetch per repo
+
+        Returns:
+            Mapping of (owner, repo) to closed issues
+        """
+        results = {}
+        missing = []
+        for owner, repo in dict.fromkeys(repos):
+            cached_data = self.cache.get(
+                f"repo-closed-issues:{owner}/{repo}", self.cache.REPO_TTL_MINUTES
+            )
+            if cached_data is not None:
+                results[(owner, repo)] = cached_data
+            else:
+                missing.append((owner, repo))
+
+        def fetch(key):
+            try:
+                return self.get_repo_issues(*key, state="closed", limit=limit)
+            except Exception:
+                return None
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.ENRICH_WORKERS, len(missing))) as pool:
+                for (owner, repo), issues in zip(missing, pool.map(fetch, missing)):
+                    if issues is None:
+                        continue
+                    self.cache.set(f"repo-closed-issues:{owner}/{repo}", issues)
+                    results[(owner, repo)] = issues
+
+        return results
+
+    def close(self):
+        """Close the client (pooled connections stay open for other clients)."""
         self.client.close()
+        self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,10 +1,17 @@
 """GitLab API client."""
 
 import httpx
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
 from pydantic import BaseModel
-from .cache import DiskCache
+from . import singleflight
+from .cache import create_cache
+from .github import next_page_url
+from .ratelimit import get_scheduler
+from .transport import create_client
 
 
 class GitLabIssue(BaseModel):
@@ -27,10 +34,29 @@ class GitLabIssue(BaseModel):
     author: str
 
 
+# Overridable to point the GitLab clients at another server (e.g. gfi emulate)
+GITLAB_URL = os.getenv("GFI_GITLAB_URL", "https://gitlab.com").rstrip("/")
+
+# Issue fields GitLabIssue is built from; everything else is dropped on receipt
+ISSUE_FIELDS = (
+    "iid", "title", "web_url", "description", "state", "created_at",
+    "updated_at", "labels", "project_id", "user_notes_count",
+)
+
+
+def _slim_issue(item: dict) -> dict:
+    """Keep only the issue fields the client and scorer read."""
+    slim = {field: item[field] for field in ISSUE_FIELDS if field in item}
+    slim["author"] = {"username": item["author"]["username"]}
+    return slim
+
+
 class GitLabClient:
     """GitLab API client with rate limiting and caching."""
 
-    BASE_URL = "https://gitlab.com/api/v4"
+    BASE_URL = f"{GITLAB_URL}/api/v4"
+    ENRICH_WORKERS = 8  # Parallel project lookups per search
+    MAX_PAGES = 5  # Issue pages read per label before giving up on `limit`
 
     def __init__(self, token: Optional[str] = None, use_cache: bool = True):
         """Initialize GitLab client.
@@ -39,15 +65,23 @@ class GitLabClient:
             token: GitLab personal access token (optional for public data)
             use_cache: Whether to use disk cache
         """
+        self.client = self._create_client(token)
+        self.cache = create_cache(enabled=use_cache)
+        self.rate_limiter = get_scheduler(f"gitlab:{token}")
+        self.errors: List[str] = []  # Failures skipped over, for the caller to report
+
+    def _create_client(self, token: Optional[str]) -> httpx.Client:
+        """Create the HTTP client for this API."""
         headers = {"Accept": "application/json"}
         if token:
             headers["PRIVATE-TOKEN"] = token
+        return create_client(self.BASE_URL, headers)
 
-        self.client = httpx.Client(
-            headers=headers,
-            timeout=30.0,
+    def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL through the rate limit scheduler."""
+        return self.rate_limiter.send(
+            "gitlab", lambda: self.client.get(url, **kwargs), host=httpx.URL(url).host
         )
-        self.cache = DiskCache(enabled=use_cache)
 
     def search_good_first_issues(
         self,
@@ -59,6 +93,10 @@ class GitLabClient:
     ) -> List[GitLabIssue]:
         """Search for good first issues on GitLab.
 
+        Label, state and age filters run server-side, newest first, and pages
+        are followed (keyset pagination) until `limit` issues pass the
+        star/language filters or MAX_PAGES pages per label have been read.
+
         Args:
             languages: List of programming languages (note: GitLab search by language is limited)
             min_stars: Minimum project star count
@@ -72,90 +110,17 @@ class GitLabClient:
         issues = []
         seen_urls = set()
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        # Day precision keeps the query (and its cache key) stable within a day
+        created_after = cutoff_date.strftime("%Y-%m-%dT00:00:00Z")
 
         for label in labels:
-            # GitLab search query
             # Note: GitLab doesn't support language filtering in issue search like GitHub
             # We'll filter by language after fetching project details
-
-            # Check cache first
-            cache_key = f"gitlab:search:{label}:{min_stars}:{limit}"
-            cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
-
-            if cached_data is not None:
-                search_results = cached_data
-            else:
-                # Search issues with label
-                response = self.client.get(
-                    f"{self.BASE_URL}/issues",
-                    params={
-                        "labels": label,
-                        "state": "opened",
-                        "scope": "all",  # Search all GitLab
-                        "per_page": min(100, limit * 2),  # Get more to filter
-                    }
+            pages = self._iter_issue_pages(label, created_after, per_page=min(100, limit * 2))
+            for items in islice(pages, self.MAX_PAGES):
+                issues.extend(
+                    self._filter_page(items, seen_urls, cutoff_date, min_stars, languages)
                 )
-                response.raise_for_status()
-                search_results = response.json()
-                self.cache.set(cache_key, search_results)
-
-            for item in search_results:
-                # Skip duplicates
-                issue_url = item["web_url"]
-                if issue_url in seen_urls:
-                    continue
-
-                # Check age
-                created_at = datetime.fromisoformat(item["created_at"].rstrip("Z"))
-                if created_at < cutoff_date:
-                    continue
-
-                # Get project details
-                project_id = item["project_id"]
-                project = self._get_project(project_id)
-
-                if not project:
-                    continue
-
-                # Filter by stars and language
-                if project.get("star_count", 0) < min_stars:
-                    continue
-
-                # Language filtering (if languages specified)
-                project_lang = project.get("languages", {})
-                if languages and project_lang:
-                    # Get primary language (highest percentage)
-                    primary_lang = max(project_lang.items(), key=lambda x: x[1])[0] if project_lang else None
-                    if primary_lang not in languages:
-                        continue
-
-                seen_urls.add(issue_url)
-
-                # Parse project namespace and path
-                project_path_with_namespace = project["path_with_namespace"]
-                parts = project_path_with_namespace.split("/")
-                namespace = "/".join(parts[:-1]) if len(parts) > 1 else parts[0]
-                project_name = parts[-1]
-
-                issues.append(GitLabIssue(
-                    number=item["iid"],  # Internal ID (per-project)
-                    title=item["title"],
-                    url=item["web_url"],
-                    html_url=item["web_url"],
-                    body=item.get("description", ""),
-                    state=item["state"],
-                    created_at=created_at,
-                    updated_at=datetime.fromisoformat(item["updated_at"].rstrip("Z")),
-                    labels=item.get("labels", []),
-                    repo_owner=namespace,
-                    repo_name=project_name,
-                    repo_stars=project.get("star_count", 0),
-                    repo_language=max(project_lang.items(), key=lambda x: x[1])[0] if project_lang else None,
-                    repo_description=project.get("description"),
-                    comments=item.get("user_notes_count", 0),
-                    author=item["author"]["username"],
-                ))
-
                 if len(issues) >= limit:
                     break
 
@@ -164,28 +129,240 @@ class GitLabClient:
 
         return issues[:limit]
 
-    def _get_project(self, project_id: int) -> Optional[dict]:
-        """Get project details by ID."""
+    def _iter_issue_pages(
+        self, label: str, created_after: str, per_page: int
+    ) -> Iterator[List[dict]]:
+        """Yield pages of open issues with a label, newest first (keyset pagination)."""
+        url = f"{self.BASE_URL}/issues"
+        params = {
+            "labels": label,
+            "state": "opened",
+            "scope": "all",  # Search all GitLab
+            "created_after": created_after,
+            "updated_after": created_after,
+            "order_by": "created_at",
+            "sort": "desc",
+            "pagination": "keyset",
+            "per_page": per_page,
+        }
+
+        while url:
+            page = self._fetch_issues_page(url, params)
+            yield page["items"]
+            # The next link carries every query parameter
+            url, params = page["next"], None
+
+    def _filter_page(
+        self,
+        items: List[dict],
+        seen_urls: set,
+        cutoff_date: datetime,
+        min_stars: int,
+        languages: List[str],
+    ) -> List[GitLabIssue]:
+        """Enrich a page of issues with project details and apply the filters."""
+        # Keep fresh, unseen issues, then look up their projects in one batch
+        candidates = []
+        candidate_urls = set()
+        for item in items:
+            # Skip duplicates
+            if item["web_url"] in seen_urls or item["web_url"] in candidate_urls:
+                continue
+
+            # Check age (the server filters by day, this trims the rest)
+            created_at = datetime.fromisoformat(item["created_at"].rstrip("Z"))
+            if created_at < cutoff_date:
+                continue
+
+            candidate_urls.add(item["web_url"])
+            candidates.append((item, created_at))
+
+        projects = self._get_projects([item["project_id"] for item, _ in candidates])
+
+        issues = []
+        for item, created_at in candidates:
+            issue_url = item["web_url"]
+            project = projects.get(item["project_id"])
+
+            if not project:
+                continue
+
+            # Filter by stars and language
+            if project.get("star_count", 0) < min_stars:
+                continue
+
+            # Language filtering (if languages specified)
+            project_lang = project.get("languages", {})
+            # Get primary language (highest percentage)
+            primary_lang = max(project_lang, key=project_lang.get) if project_lang else None
+            if languages and project_lang and primary_lang not in languages:
+                continue
+
+            seen_urls.add(issue_url)
+
+            # Parse project namespace and path
+            project_path_with_namespace = project["path_with_namespace"]
+            parts = project_path_with_namespace.split("/")
+            namespace = "/".join(parts[:-1]) if len(parts) > 1 else parts[0]
+            project_name = parts[-1]
+
+            issues.append(GitLabIssue(
+                number=item["iid"],  # Internal ID (per-project)
+                title=item["title"],
+                url=item["web_url"],
+                html_url=item["web_url"],
+                body=item.get("description", ""),
+                state=item["state"],
+                created_at=created_at,
+                updated_at=datetime.fromisoformat(item["updated_at"].rstrip("Z")),
+                labels=item.get("labels", []),
+                repo_owner=namespace,
+                repo_name=project_name,
+                repo_stars=project.get("star_count", 0),
+                repo_language=primary_lang,
+                repo_description=project.get("description"),
+                comments=item.get("user_notes_count", 0),
+                author=item["author"]["username"],
+            ))
+
+        return issues
+
+    def _fetch_issues_page(self, url: str, params: Optional[dict] = None) -> dict:
+        """Fetch (or load from cache) one page of issues and its next-page URL.
+
+        Only the fields GitLabIssue needs are kept, so cached pages stay small.
+        Expired pages with validators are revalidated with a conditional request.
+        """
+        cache_key = f"gitlab:search:{httpx.URL(url, params=params)}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        response = self._get(
+            url, params=params, headers=self.cache.get_conditional_headers(cache_key)
+        )
+
+        if response.status_code == 304:
+            data = self.cache.revalidate(cache_key)
+            if data is not None:
+                return data
+            response = self._get(url, params=params)
+
+        response.raise_for_status()
+        page = {
+            "items": [_slim_issue(item) for item in response.json()],
+            "next": next_page_url(response),
+        }
+        self.cache.set(
+            cache_key,
+            page,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return page
+
+    def _get_projects(self, project_ids: List[int]) -> Dict[int, Optional[dict]]:
+        """Get details for many projects at once.
+
+        Duplicates are collapsed and the distinct projects are fetched in
+        parallel on a bounded thread pool, their languages on a second one.
+
+        Args:
+            project_ids: Project IDs, duplicates allowed
+
+        Returns:
+            Mapping of project ID to project details (None if unavailable)
+        """
+        unique_ids = list(dict.fromkeys(project_ids))
+        if not unique_ids:
+            return {}
+
+        workers = min(self.ENRICH_WORKERS, len(unique_ids))
+        # Languages get their own pool, as the project pool's workers wait on them
+        with (
+            ThreadPoolExecutor(max_workers=workers) as pool,
+            ThreadPoolExecutor(max_workers=workers) as languages_pool,
+        ):
+            projects = pool.map(lambda pid: self._get_project(pid, languages_pool), unique_ids)
+            return dict(zip(unique_ids, projects))
+
+    def _get_project(
+        self, project_id: int, languages_pool: Optional[ThreadPoolExecutor] = None
+    ) -> Optional[dict]:
+        """Get project details by ID.
+
+        Concurrent lookups of the same uncached project, from any client,
+        share one request.
+
+        Args:
+            project_id: GitLab project ID
+            languages_pool: Pool to request the languages on while the project
+                is fetched (None: request them afterwards)
+        """
         cache_key = f"gitlab:project:{project_id}"
         cached = self.cache.get(cache_key, 60)  # Cache for 1 hour
 
         if cached is not None:
             return cached
 
+        return singleflight.do(
+            cache_key, lambda: self._fetch_project(project_id, cache_key, languages_pool)
+        )
+
+    def _fetch_project(
+        self, project_id: int, cache_key: str, languages_pool: Optional[ThreadPoolExecutor] = None
+    ) -> Optional[dict]:
+        """Fetch a project and its languages from the API and cache them.
+
+        Without a cached copy to revalidate, the languages are requested at
+        the same time as the project (on languages_pool) instead of after it.
+        """
+        url = f"{self.BASE_URL}/projects/{project_id}"
+        conditional_headers = self.cache.get_conditional_headers(cache_key)
+        languages = None
+        if not conditional_headers and languages_pool is not None:
+            languages = languages_pool.submit(self._get_languages, project_id)
+
         try:
-            response = self.client.get(f"{self.BASE_URL}/projects/{project_id}")
+            response = self._get(url, headers=conditional_headers)
+
+            if response.status_code == 304:
+                # Project unchanged - reuse cached project (and its languages)
+                project = self.cache.revalidate(cache_key)
+                if project is not None:
+                    return project
+                response = self._get(url)
+
             response.raise_for_status()
             project = response.json()
-
-            # Get project languages
-            try:
-                lang_response = self.client.get(f"{self.BASE_URL}/projects/{project_id}/languages")
-                lang_response.raise_for_status()
-                project["languages"] = lang_response.json()
-            except:
-                project["languages"] = {}
-
-            self.cache.set(cache_key, project)
-            return project
-        except:
+        except httpx.HTTPError:
             return None
+
+        project["languages"] = languages.result() if languages else self._get_languages(project_id)
+        self.cache.set(
+            cache_key,
+            project,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return project
+
+    def _get_languages(self, project_id: int) -> dict:
+        """Get a project's language breakdown ({} if unavailable)."""
+        try:
+            response = self._get(f"{self.BASE_URL}/projects/{project_id}/languages")
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return {}
+
+    def close(self):
+        """Close the client (pooled connections stay open for other clients)."""
+        self.client.close()
+        self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,216 @@
+"""GitLab GraphQL API client."""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from .gitlab import GITLAB_URL, GitLabClient
+from .transport import create_client
+
+
+class GitLabGraphQLClient(GitLabClient):
+    """GitLab GraphQL client - same search API as GitLabClient, fewer round trips.
+
+    Issue pages come from the root `issues` query, and all projects on a page
+    are looked up with one `projects(ids: [...])` query (stars, description
+    and language breakdown together) instead of two REST calls per project.
+    Results are cached under the same keys as the REST client.
+    """
+
+    GRAPHQL_URL = f"{GITLAB_URL}/api/graphql"
+    PROJECTS_PER_QUERY = 50  # Project IDs per projects(ids: ...) query
+
+    ISSUES_QUERY = """
+    query($labels: [String!], $createdAfter: Time, $first: Int!, $after: String) {
+      issues(
+        labelName: $labels
+        state: opened
+        createdAfter: $createdAfter
+        updatedAfter: $createdAfter
+        sort: CREATED_DESC
+        first: $first
+        after: $after
+      ) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          iid
+          title
+          webUrl
+          description
+          state
+          createdAt
+          updatedAt
+          projectId
+          userNotesCount
+          labels {
+            nodes {
+              title
+            }
+          }
+          author {
+            username
+          }
+        }
+      }
+    }
+    """
+
+    PROJECTS_QUERY = """
+    query($ids: [ID!], $first: Int!) {
+      projects(ids: $ids, first: $first) {
+        nodes {
+          id
+          fullPath
+          description
+          starCount
+          languages {
+            name
+            share
+          }
+        }
+      }
+    }
+    """
+
+    def __init__(self, token: Optional[str] = None, use_cache: bool = True):
+        """Initialize GitLab GraphQL client.
+
+        Args:
+            token: GitLab personal access token (optional for public data)
+            use_cache: Whether to use disk cache
+        """
+        super().__init__(token, use_cache=use_cache)
+
+    def _create_client(self, token: Optional[str]) -> httpx.Client:
+        """Create the HTTP client for the GraphQL endpoint."""
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return create_client(self.GRAPHQL_URL, headers)
+
+    def _execute_query(self, query: str, variables: Dict[str, Any]) -> dict:
+        """Execute a GraphQL query through the rate limit scheduler."""
+        payload = {"query": query, "variables": variables}
+        response = self.rate_limiter.send(
+            "gitlab",
+            lambda: self.client.post(self.GRAPHQL_URL, json=payload),
+            host=httpx.URL(self.GRAPHQL_URL).host,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if "errors" in data:
+            raise Exception(f"GitLab GraphQL error: {data['errors']}")
+
+        return data["data"]
+
+    def _iter_issue_pages(
+        self, label: str, created_after: str, per_page: int
+    ) -> Iterator[List[dict]]:
+        """Yield pages of open issues with a label, newest first (cursor pagination)."""
+        after = None
+        while True:
+            page = self._fetch_graphql_issues_page(label, created_after, per_page, after)
+            yield page["items"]
+            if not page["next"]:
+                return
+            after = page["next"]
+
+    def _fetch_graphql_issues_page(
+        self, label: str, created_after: str, first: int, after: Optional[str]
+    ) -> dict:
+        """Fetch (or load from cache) one page of issues and its next cursor."""
+        cache_key = f"gitlab:graphql:search:{label}:{created_after}:{first}:{after or 'start'}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        data = self._execute_query(
+            self.ISSUES_QUERY,
+            {
+                "labels": [label],
+                "createdAfter": created_after,
+                "first": first,
+                "after": after,
+            },
+        )
+        issues = data["issues"]
+        page_info = issues["pageInfo"]
+        page = {
+            "items": [self._item_from_node(node) for node in issues["nodes"] if node],
+            "next": page_info["endCursor"] if page_info["hasNextPage"] else None,
+        }
+
+        self.cache.set(cache_key, page)
+        return page
+
+    def _item_from_node(self, node: dict) -> dict:
+        """Convert an issue node into the REST item shape _filter_page reads."""
+        return {
+            "iid": int(node["iid"]),
+            "title": node["title"],
+            "web_url": node["webUrl"],
+            "description": node.get("description"),
+            "state": node["state"],
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "labels": [label["title"] for label in node["labels"]["nodes"]],
+            "project_id": int(node["projectId"]),
+            "user_notes_count": node.get("userNotesCount", 0),
+            "author": {"username": (node.get("author") or {}).get("username", "ghost")},
+        }
+
+    def _get_projects(self, project_ids: List[int]) -> Dict[int, Optional[dict]]:
+        """Get details for many projects, batching uncached ones into projects(ids: ...).
+
+        Args:
+            project_ids: Project IDs, duplicates allowed
+
+        Returns:
+            Mapping of project ID to project details (None if not found)
+        """
+        projects = {}
+        missing = []
+        for project_id in dict.fromkeys(project_ids):
+            cached = self.cache.get(f"gitlab:project:{project_id}", 60)  # Cache for 1 hour
+            if cached is not None:
+                projects[project_id] = cached
+            else:
+                missing.append(project_id)
+
+        for start in range(0, len(missing), self.PROJECTS_PER_QUERY):
+            batch = missing[start : start + self.PROJECTS_PER_QUERY]
+            try:
+                data = self._execute_query(
+                    self.PROJECTS_QUERY,
+                    {
+                        "ids": [f"gid://gitlab/Project/{project_id}" for project_id in batch],
+                        "first": len(batch),
+                    },
+                )
+            except Exception as e:
+                self.errors.append(f"GitLab project lookup failed: {e}")
+                continue
+
+            for node in data["projects"]["nodes"]:
+                project_id = int(node["id"].rsplit("/", 1)[-1])
+                # Same shape (and cache key) as the REST client's project entries
+                project = {
+                    "id": project_id,
+                    "path_with_namespace": node["fullPath"],
+                    "description": node.get("description"),
+                    "star_count": node.get("starCount", 0),
+                    "languages": {
+                        language["name"]: language["share"]
+                        for language in node.get("languages") or []
+                    },
+                }
+                self.cache.set(f"gitlab:project:{project_id}", project)
+                projects[project_id] = project
+
+        for project_id in missing:
+            projects.setdefault(project_id, None)
+        return projects
@@ -1,48 +1,212 @@
 """GitHub GraphQL API client for better performance."""
 
-import httpx
+import threading
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from .github import Issue, UserProfile
-from .cache import DiskCache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from .cache import create_cache
+from .github import GITHUB_API_URL, GitHubClient, Issue, parse_timestamp
+from .planner import MAX_RESULTS_PER_QUERY, cap_per_pair, plan_queries
+from .ratelimit import get_scheduler
+from .transport import create_client
+
+
+class GraphQLError(Exception):
+    """GraphQL response with an errors list (HTTP status was fine)."""
+
+    def __init__(self, errors: List[dict]):
+        self.errors = errors
+        super().__init__(f"GraphQL error: {errors}")
 
 
 class GitHubGraphQLClient:
     """GitHub GraphQL API client - more efficient than REST API."""
 
-    GRAPHQL_URL = "https://api.github.com/graphql"
+    GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+    # Limits for combined search documents
+    MAX_NODES = 500_000  # GitHub's per-query node limit
+    MAX_SEARCHES_PER_QUERY = 10  # Keeps each document's cost modest
+    LABELS_PER_ISSUE = 10  # labels(first: 10) in ISSUE_FRAGMENT
+    # Failures a smaller document can get past: node/complexity limits and timeouts
+    SPLIT_ERROR_TYPES = {"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED"}
+    SPLIT_STATUSES = {502, 504}
+
+    # Query cost budgeting
+    RATE_LIMIT_FIELDS = "rateLimit { cost remaining resetAt limit }"
+    LOW_BUDGET_THRESHOLD = 500  # Points remaining before queries are trimmed
+    LOW_BUDGET_PAGE_SIZE = 20  # first: size used while the budget is low
+
+    BULK_REPOS_PER_QUERY = 50  # Aliased repository(...) lookups per query
+    ISSUE_STATES = {"all": ["OPEN", "CLOSED"], "open": ["OPEN"], "closed": ["CLOSED"]}
+
+    ISSUE_FRAGMENT = """
+    fragment IssueFields on Issue {
+      number
+      title
+      url
+      body
+      state
+      createdAt
+      updatedAt
+      comments {
+        totalCount
+      }
+      labels(first: 10) {
+        nodes {
+          name
+        }
+      }
+      author {
+        login
+      }
+      repository {
+        owner {
+          login
+        }
+        name
+        description
+        stargazerCount
+        primaryLanguage {
+          name
+        }
+      }
+    }
+    """
 
     def __init__(self, token: str, use_cache: bool = True):
         self.token = token
-        self.client = httpx.Client(
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
-        self.cache = DiskCache(enabled=use_cache)
+        self.client = create_client(self.GRAPHQL_URL, {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        })
+        self.cache = create_cache(enabled=use_cache)
+        self.rate_limiter = get_scheduler(token)
+        self._stats = {
+            "queries": 0,
+            "total_cost": 0,
+            "remaining": None,
+            "limit": None,
+            "reset_at": None,
+            "deferred": 0,
+            "operations": {},
+        }
+        self._stats_lock = threading.Lock()
+        self.errors: List[str] = []  # Failures skipped over, for the caller to report
 
-    def _execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> dict:
-        """Execute a GraphQL query."""
+    def _execute_query(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation: str = "query",
+        allow_partial: bool = False,
+    ) -> dict:
+        """Execute a GraphQL query.
+
+        Args:
+            query: GraphQL document (should select RATE_LIMIT_FIELDS)
+            variables: Query variables
+            operation: Label the query's cost is recorded under
+            allow_partial: Return partial data instead of raising when some fields
+                errored (e.g. one missing repository in an aliased batch)
+        """
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        response = self.client.post(self.GRAPHQL_URL, json=payload)
+        response = self.rate_limiter.send(
+            "graphql",
+            lambda: self.client.post(self.GRAPHQL_URL, json=payload),
+            host=httpx.URL(self.GRAPHQL_URL).host,
+        )
         response.raise_for_status()
         data = response.json()
 
-        if "errors" in data:
-            raise Exception(f"GraphQL error: {data['errors']}")
+        if "errors" in data and not (allow_partial and data.get("data")):
+            raise GraphQLError(data["errors"])
 
+        self._record_cost(operation, data["data"].get("rateLimit"))
         return data["data"]
 
-    def get_user_profile(self, username: str) -> UserProfile:
-        """Get user profile with starred repos using GraphQL."""
+    def _record_cost(self, operation: str, rate_limit: Optional[dict]):
+        """Record a query's cost and the remaining point budget.
+
+        The budget is also written to the token's shared graphql bucket, which
+        budget_low() reads.
+        """
+        with self._stats_lock:
+            stats = self._stats
+            stats["queries"] += 1
+            op_stats = stats["operations"].setdefault(operation, {"count": 0, "cost": 0})
+            op_stats["count"] += 1
+
+            if not rate_limit:
+                return
+
+            cost = rate_limit.get("cost") or 0
+            stats["total_cost"] += cost
+            op_stats["cost"] += cost
+            stats["remaining"] = rate_limit.get("remaining")
+            stats["limit"] = rate_limit.get("limit")
+            stats["reset_at"] = rate_limit.get("resetAt")
+
+        # The window itself is synced from the response's rate limit headers
+        self.rate_limiter.bucket("graphql").update(
+            rate_limit.get("remaining"), None, rate_limit.get("limit")
+        )
+
+    def get_stats(self) -> dict:
+        """Get GraphQL query cost statistics.
+
+        Returns:
+            Dictionary with query count, total cost, remaining points and
+            per-operation breakdown
+        """
+        with self._stats_lock:
+            stats = {
+                **self._stats,
+                "operations": {name: dict(op) for name, op in self._stats["operations"].items()},
+            }
+        stats["budget_low"] = self.budget_low()
+        return stats
+
+    def budget_low(self) -> bool:
+        """Check if the token's remaining points have dropped below LOW_BUDGET_THRESHOLD.
+
+        Read from the token's shared graphql bucket, so every client using the
+        token sees the budget reported to any of them.
+        """
+        return self.rate_limiter.bucket("graphql").headroom() < self.LOW_BUDGET_THRESHOLD
+
+    def record_deferred(self):
+        """Count a low-priority query skipped to save points."""
+        with self._stats_lock:
+            self._stats["deferred"] += 1
+
+    def _page_size(self, requested: int) -> int:
+        """Shrink first: sizes while the point budget is low."""
+        if self.budget_low():
+            return min(requested, self.LOW_BUDGET_PAGE_SIZE)
+        return requested
+
+    def get_user_activity(self, username: str, since: Optional[datetime] = None) -> dict:
+        """Get the raw inputs of a profile: own repo languages and stars, newest first.
+
+        Stars are read in STARRED_AT order, so with `since` only the stars
+        added after it are fetched - usually a single query.
 
+        Args:
+            username: GitHub username
+            since: Only return stars added after this time (None: up to MAX_STARRED)
+
+        Returns:
+            Dict with username, own_languages, contributed_count, starred_count
+            and stars ({"starred_at", "language", "topics"} dicts)
+        """
         query = """
-        query($username: String!, $starredFirst: Int!) {
+        query($username: String!, $starredFirst: Int!, $after: String) {
           user(login: $username) {
             login
             repositories(first: 100, orderBy: {field: UPDATED_AT, direction: DESC}) {
@@ -52,16 +216,27 @@ class GitHubGraphQLClient:
                 }
               }
             }
-            starredRepositories(first: $starredFirst) {
+            starredRepositories(
+              first: $starredFirst
+              after: $after
+              orderBy: {field: STARRED_AT, direction: DESC}
+            ) {
               totalCount
-              nodes {
-                primaryLanguage {
-                  name
-                }
-                repositoryTopics(first: 10) {
-                  nodes {
-                    topic {
-                      name
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              edges {
+                starredAt
+                node {
+                  primaryLanguage {
+                    name
+                  }
+                  repositoryTopics(first: 10) {
+                    nodes {
+                      topic {
+                        name
+                      }
                     }
                   }
                 }
@@ -71,51 +246,48 @@ class GitHubGraphQLClient:
               totalRepositoryContributions
             }
           }
+          %s
+        }
+        """ % self.RATE_LIMIT_FIELDS
+
+        stars = []
+        after = None
+        while True:
+            variables = {"username": username, "starredFirst": 100, "after": after}
+            data = self._execute_query(query, variables, operation="profile")
+            user = data["user"]
+            starred = user["starredRepositories"]
+            reached_known = False
+            for edge in starred["edges"]:
+                if since is not None and parse_timestamp(edge["starredAt"]) <= since:
+                    reached_known = True
+                    break
+                node = edge["node"]
+                stars.append({
+                    "starred_at": edge["starredAt"],
+                    "language": (node["primaryLanguage"] or {}).get("name"),
+                    "topics": [
+                        topic["topic"]["name"] for topic in node["repositoryTopics"]["nodes"]
+                    ],
+                })
+
+            if reached_known or not starred["pageInfo"]["hasNextPage"]:
+                break
+            if since is None and len(stars) >= GitHubClient.MAX_STARRED:
+                break
+            after = starred["pageInfo"]["endCursor"]
+
+        return {
+            "username": user["login"],
+            "own_languages": [
+                repo["primaryLanguage"]["name"]
+                for repo in user["repositories"]["nodes"]
+                if repo["primaryLanguage"]
+            ],
+            "contributed_count": user["contributionsCollection"]["totalRepositoryContributions"],
+            "starred_count": starred["totalCount"],
+            "stars": stars,
         }
-        """
-
-        # Check cache
-        cache_key = f"graphql:profile:{username}"
-        cached_data = self.cache.get(cache_key, 60)  # 60 minutes TTL
-        if cached_data is not None:
-            return UserProfile(**cached_data)
-
-        data = self._execute_query(query, {"username": username, "starredFirst": 200})
-        user = data["user"]
-
-        # Extract languages from owned repos
-        languages = {}
-        for repo in user["repositories"]["nodes"]:
-            if repo["primaryLanguage"]:
-                lang = repo["primaryLanguage"]["name"]
-                languages[lang] = languages.get(lang, 0) + 1
-
-        # Extract languages and topics from starred repos
-        topics = {}
-        for repo in user["starredRepositories"]["nodes"]:
-            if repo["primaryLanguage"]:
-                lang = repo["primaryLanguage"]["name"]
-                languages[lang] = languages.get(lang, 0) + 1
-
-            for topic_node in repo["repositoryTopics"]["nodes"]:
-                topic = topic_node["topic"]["name"]
-                topics[topic] = topics.get(topic, 0) + 1
-
-        # Sort by frequency
-        sorted_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)
-        sorted_topics = sorted(topics.items(), key=lambda x: x[1], reverse=True)
-
-        profile = UserProfile(
-            username=user["login"],
-            languages=[lang for lang, _ in sorted_languages[:10]],
-            topics=[topic for topic, _ in sorted_topics[:10]],
-            starred_count=user["starredRepositories"]["totalCount"],
-            contributed_count=user["contributionsCollection"]["totalRepositoryContributions"],
-        )
-
-        # Cache the profile
-        self.cache.set(cache_key, profile.model_dump())
-        return profile
 
     def search_good_first_issues(
         self,
@@ -127,141 +299,300 @@ class GitHubGraphQLClient:
     ) -> List[Issue]:
         """Search for good first issues using GraphQL.
 
-        More efficient than REST API - fetches issue and repo data in one query.
+        More efficient than REST API - fetches issue and repo data in one query,
+        and every uncached planned search goes out in one aliased document.
+        Languages and labels are OR-ed into as few searches as possible (see
+        plan_queries), and the results are trimmed to `limit` per pair.
         """
         if labels is None:
             labels = ["good first issue"]
 
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        low_budget = self.budget_low()
+
+        # Each search is read far enough to hold `limit` issues for every pair
+        # it covers, cached under its own key and sent together as aliases
+        searches = []
+        for planned in plan_queries(languages, labels, min_stars, cutoff_date.date()):
+            search_query = planned.to_string(sort_qualifier=True)
+            wanted = min(MAX_RESULTS_PER_QUERY, limit * planned.pair_count)
+            if low_budget:
+                # No extra pages while the point budget is low
+                wanted = min(wanted, self.LOW_BUDGET_PAGE_SIZE)
+            searches.append({
+                "language": "/".join(planned.languages),
+                "label": ",".join(planned.labels),
+                "query": search_query,
+                "wanted": wanted,
+                "cache_key": f"graphql:search:{search_query}:{wanted}",
+            })
+
+        results: Dict[str, List[Issue]] = {}
+        missing = []
+        for search in searches:
+            cached_data = self.cache.get(search["cache_key"], self.cache.SEARCH_TTL_MINUTES)
+            if cached_data is not None:
+                results[search["cache_key"]] = [Issue(**issue_data) for issue_data in cached_data]
+            else:
+                missing.append(search)
+
+        # Only the cache misses are queried
+        if missing:
+            first = self._page_size(min(100, max(search["wanted"] for search in missing)))
+            for batch in self._batch_searches(missing, first):
+                results.update(self._run_search_batch(batch, first))
+
         issues = []
         seen_urls = set()
-        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        for search in searches:
+            for issue in results.get(search["cache_key"], []):
+                # Skip duplicates
+                if issue.html_url not in seen_urls:
+                    seen_urls.add(issue.html_url)
+                    issues.append(issue)
+
+        return cap_per_pair(issues, languages, labels, limit)
+
+    def _batch_searches(self, searches: List[dict], first: int) -> List[List[dict]]:
+        """Split searches into documents that stay within GitHub's node limit."""
+        nodes_per_search = first * (1 + self.LABELS_PER_ISSUE)
+        per_batch = max(1, min(self.MAX_SEARCHES_PER_QUERY, self.MAX_NODES // nodes_per_search))
+        return [searches[i:i + per_batch] for i in range(0, len(searches), per_batch)]
+
+    def _build_search_document(self, count: int) -> str:
+        """Build one query document with `count` aliased searches (s0, s1, ...)."""
+        variables = ", ".join(f"$q{i}: String!" for i in range(count))
+        aliases = "\n".join(
+            f"  s{i}: search(query: $q{i}, type: ISSUE, first: $limit) "
+            f"{{ issueCount pageInfo {{ hasNextPage endCursor }} nodes {{ ...IssueFields }} }}"
+            for i in range(count)
+        )
+        return (
+            f"query({variables}, $limit: Int!) {{\n{aliases}\n  {self.RATE_LIMIT_FIELDS}\n}}\n"
+            f"{self.ISSUE_FRAGMENT}"
+        )
 
-        query = """
-        query($searchQuery: String!, $limit: Int!) {
-          search(query: $searchQuery, type: ISSUE, first: $limit) {
-            nodes {
-              ... on Issue {
-                number
-                title
-                url
-                body
-                state
-                createdAt
-                updatedAt
-                comments {
-                  totalCount
-                }
-                labels(first: 10) {
-                  nodes {
-                    name
-                  }
-                }
-                author {
-                  login
-                }
-                repository {
-                  owner {
-                    login
-                  }
-                  name
-                  description
-                  stargazerCount
-                  primaryLanguage {
-                    name
-                  }
-                }
-              }
-            }
-          }
-        }
+    def _run_search_batch(self, batch: List[dict], first: int) -> Dict[str, List[Issue]]:
+        """Run a batch of searches in one request, mapping aliases back to cache keys.
+
+        If GitHub rejects the document for its size (node or cost limits, a
+        timeout), the batch is split in half and retried; a single search that
+        still fails is skipped. Other failures (auth, rate limits, invalid
+        queries) would fail the same way for every half, so they are raised.
+        Searches that need more than one page continue with cursor pagination.
+        """
+        variables = {f"q{i}": search["query"] for i, search in enumerate(batch)}
+        variables["limit"] = first
+
+        try:
+            data = self._execute_query(
+                self._build_search_document(len(batch)), variables, operation="search"
+            )
+        except (httpx.HTTPError, GraphQLError) as e:
+            if not self._is_size_error(e):
+                raise
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                results = self._run_search_batch(batch[:middle], first)
+                results.update(self._run_search_batch(batch[middle:], first))
+                return results
+            # Skip the search and let the caller report it
+            search = batch[0]
+            self.errors.append(
+                f"GraphQL query failed for {search['language']}/{search['label']}: {e}"
+            )
+            return {}
+
+        results = {}
+        for i, search in enumerate(batch):
+            result = data[f"s{i}"]
+            issues = [
+                self._issue_from_node(node)
+                for node in result["nodes"]
+                if node  # Skip null nodes
+            ][:search["wanted"]]
+
+            page_info = result.get("pageInfo") or {}
+            if len(issues) < search["wanted"] and page_info.get("hasNextPage"):
+                try:
+                    for page in self.iter_search_pages(
+                        search["query"],
+                        max_results=search["wanted"] - len(issues),
+                        after=page_info["endCursor"],
+                    ):
+                        issues.extend(page)
+                except Exception as e:
+                    self.errors.append(
+                        f"GraphQL pagination failed for {search['language']}/{search['label']}: {e}"
+                    )
+
+            self.cache.set(search["cache_key"], [issue.model_dump() for issue in issues])
+            results[search["cache_key"]] = issues
+
+        return results
+
+    def _is_size_error(self, error: Exception) -> bool:
+        """Whether a query failed for its size, so a smaller one might succeed."""
+        if isinstance(error, httpx.TimeoutException):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.SPLIT_STATUSES
+        if isinstance(error, GraphQLError):
+            return any(
+                err.get("type") in self.SPLIT_ERROR_TYPES
+                or any(marker in str(err.get("message", "")) for marker in self.SPLIT_ERROR_TYPES)
+                or "timeout" in str(err.get("message", "")).lower()
+                for err in error.errors
+            )
+        return False
+
+    def iter_search_pages(
+        self,
+        search_query: str,
+        page_size: int = 100,
+        max_results: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[List[Issue]]:
+        """Yield pages of issues for a search query, following cursors.
+
+        Requests are only made as pages are consumed, so breaking out of the
+        loop stops the crawl. Each page is cached under its cursor, so a
+        resumed crawl replays cached pages and continues from the last cursor.
+
+        Args:
+            search_query: GitHub search query string
+            page_size: Issues per page (max 100)
+            max_results: Stop once this many issues have been yielded
+            after: Cursor to start after (resume point)
+
+        Yields:
+            List of issues for each page
         """
+        fetched = 0
+        while max_results is None or fetched < max_results:
+            first = self._page_size(min(page_size, 100))
+            if max_results is not None:
+                first = min(first, max_results - fetched)
 
-        for language in languages:
-            for label in labels:
-                # Build search query
-                query_parts = [
-                    "is:issue",
-                    "is:open",
-                    f'label:"{label}"',
-                    f"language:{language}",
-                    f"stars:>={min_stars}",
-                    f"created:>={cutoff_date.strftime('%Y-%m-%d')}",
-                    "sort:created-desc",
-                ]
-                search_query = " ".join(query_parts)
-
-                # Check cache
-                cache_key = f"graphql:search:{search_query}:{limit}"
-                cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
-
-                if cached_data is not None:
-                    result_issues = [Issue(**issue_data) for issue_data in cached_data]
-                    for issue in result_issues:
-                        if issue.html_url not in seen_urls:
-                            seen_urls.add(issue.html_url)
-                            issues.append(issue)
-                    continue
+            page = self.fetch_search_page(search_query, first, after)
+            yield page["issues"]
 
-                try:
-                    data = self._execute_query(query, {
-                        "searchQuery": search_query,
-                        "limit": min(100, limit)
-                    })
-
-                    cache_items = []
-                    for node in data["search"]["nodes"]:
-                        if not node:  # Skip null nodes
-                            continue
-
-                        repo = node["repository"]
-                        owner = repo["owner"]["login"]
-                        repo_name = repo["name"]
-                        html_url = f"https://github.com/{owner}/{repo_name}/issues/{node['number']}"
-
-                        # Skip duplicates
-                        if html_url in seen_urls:
-                            continue
-                        seen_urls.add(html_url)
-
-                        issue = Issue(
-                            number=node["number"],
-                            title=node["title"],
-                            url=node["url"],
-                            html_url=html_url,
-                            body=node.get("body", ""),
-                            state=node["state"].lower(),
-                            created_at=datetime.fromisoformat(node["createdAt"].rstrip("Z")),
-                            updated_at=datetime.fromisoformat(node["updatedAt"].rstrip("Z")),
-                            labels=[lbl["name"] for lbl in node["labels"]["nodes"]],
-                            repo_owner=owner,
-                            repo_name=repo_name,
-                            repo_stars=repo["stargazerCount"],
-                            repo_language=repo["primaryLanguage"]["name"] if repo["primaryLanguage"] else None,
-                            repo_description=repo.get("description"),
-                            comments=node["comments"]["totalCount"],
-                            author=node["author"]["login"] if node["author"] else "unknown",
-                        )
-
-                        issues.append(issue)
-                        cache_items.append(issue.model_dump())
-
-                    # Cache the results
-                    self.cache.set(cache_key, cache_items)
+            fetched += len(page["issues"])
+            if not page["has_next_page"] or not page["issues"]:
+                return
+            after = page["end_cursor"]
 
-                except Exception as e:
-                    # Fall back to REST API on error
-                    print(f"GraphQL query failed for {language}/{label}: {e}")
-                    continue
+    def count_search_results(self, search_query: str) -> int:
+        """Get the total number of issues matching a search (issueCount).
 
-        return issues
+        Args:
+            search_query: GitHub search query string
 
-    def get_repo_issues(self, owner: str, repo: str, limit: int = 100) -> List[dict]:
+        Returns:
+            Total match count, including results past the 1000-result cap
+        """
+        cache_key = f"graphql:search-count:{search_query}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return cached_data
+
+        query = f"""
+        query($searchQuery: String!) {{
+          search(query: $searchQuery, type: ISSUE, first: 0) {{
+            issueCount
+          }}
+          {self.RATE_LIMIT_FIELDS}
+        }}
+        """
+
+        data = self._execute_query(query, {"searchQuery": search_query}, operation="search-count")
+        count = data["search"]["issueCount"]
+        self.cache.set(cache_key, count)
+        return count
+
+    def fetch_search_page(self, search_query: str, first: int, after: Optional[str] = None) -> dict:
+        """Fetch (or load from cache) one page of search results.
+
+        Args:
+            search_query: GitHub search query string
+            first: Page size (max 100)
+            after: Cursor to start after
+
+        Returns:
+            Dictionary with issues, end_cursor and has_next_page
+        """
+        cache_key = f"graphql:search-page:{search_query}:{first}:{after or 'start'}"
+        cached_data = self.cache.get(cache_key, self.cache.SEARCH_TTL_MINUTES)
+        if cached_data is not None:
+            return {**cached_data, "issues": [Issue(**issue) for issue in cached_data["issues"]]}
+
+        query = f"""
+        query($searchQuery: String!, $first: Int!, $after: String) {{
+          search(query: $searchQuery, type: ISSUE, first: $first, after: $after) {{
+            issueCount
+            pageInfo {{
+              hasNextPage
+              endCursor
+            }}
+            nodes {{
+              ...IssueFields
+            }}
+          }}
+          {self.RATE_LIMIT_FIELDS}
+        }}
+        {self.ISSUE_FRAGMENT}
+        """
+
+        data = self._execute_query(query, {
+            "searchQuery": search_query,
+            "first": first,
+            "after": after,
+        }, operation="search-page")
+        search = data["search"]
+        issues = [self._issue_from_node(node) for node in search["nodes"] if node]
+        page = {
+            "issues": issues,
+            "end_cursor": search["pageInfo"]["endCursor"],
+            "has_next_page": search["pageInfo"]["hasNextPage"],
+        }
+
+        self.cache.set(cache_key, {**page, "issues": [issue.model_dump() for issue in issues]})
+        return page
+
+    def _issue_from_node(self, node: dict) -> Issue:
+        """Build an Issue from a search result node."""
+        repo = node["repository"]
+        owner = repo["owner"]["login"]
+        repo_name = repo["name"]
+
+        return Issue(
+            number=node["number"],
+            title=node["title"],
+            url=node["url"],
+            html_url=f"https://github.com/{owner}/{repo_name}/issues/{node['number']}",
+            body=node.get("body", ""),
+            state=node["state"].lower(),
+            created_at=datetime.fromisoformat(node["createdAt"].rstrip("Z")),
+            updated_at=datetime.fromisoformat(node["updatedAt"].rstrip("Z")),
+            labels=[lbl["name"] for lbl in node["labels"]["nodes"]],
+            repo_owner=owner,
+            repo_name=repo_name,
+            repo_stars=repo["stargazerCount"],
+            repo_language=repo["primaryLanguage"]["name"] if repo["primaryLanguage"] else None,
+            repo_description=repo.get("description"),
+            comments=node["comments"]["totalCount"],
+            author=node["author"]["login"] if node["author"] else "unknown",
+        )
+
+    def get_repo_issues(
+        self, owner: str, repo: str, state: str = "all", limit: int = 100
+    ) -> List[dict]:
         """Get recent issues from a repo using GraphQL."""
 
         query = """
-        query($owner: String!, $repo: String!, $limit: Int!) {
+        query($owner: String!, $repo: String!, $limit: Int!, $states: [IssueState!]) {
           repository(owner: $owner, name: $repo) {
-            issues(first: $limit, orderBy: {field: UPDATED_AT, direction: DESC}, states: [OPEN, CLOSED]) {
+            issues(first: $limit, orderBy: {field: UPDATED_AT, direction: DESC}, states: $states) {
               nodes {
                 number
                 title
@@ -274,11 +605,14 @@ class GitHubGraphQLClient:
               }
             }
           }
+          %s
         }
-        """
+        """ % self.RATE_LIMIT_FIELDS
 
         # Check cache
         cache_key = f"graphql:repo-issues:{owner}/{repo}"
+        if state != "all":
+            cache_key += f":{state}"
         cached_data = self.cache.get(cache_key, self.cache.REPO_TTL_MINUTES)
         if cached_data is not None:
             return cached_data
@@ -286,24 +620,105 @@ class GitHubGraphQLClient:
         data = self._execute_query(query, {
             "owner": owner,
             "repo": repo,
-            "limit": limit
-        })
+            "limit": self._page_size(limit),
+            "states": self.ISSUE_STATES[state],
+        }, operation="repo-issues")
 
-        issues = []
-        for node in data["repository"]["issues"]["nodes"]:
-            issues.append({
-                "number": node["number"],
-                "title": node["title"],
-                "state": node["state"].lower(),
-                "created_at": node["createdAt"],
-                "closed_at": node.get("closedAt"),
-                "comments": node["comments"]["totalCount"],
-            })
+        nodes = data["repository"]["issues"]["nodes"]
+        issues = [self._repo_issue_from_node(node) for node in nodes]
 
         # Cache the results
         self.cache.set(cache_key, issues)
         return issues
 
-    def __del__(self):
-        """Clean up HTTP client."""
+    def get_repos_closed_issues(
+        self, repos: List[Tuple[str, str]], limit: int = 10
+    ) -> Dict[Tuple[str, str], List[dict]]:
+        """Get recently closed issues for many repos at once.
+
+        Uncached repos are fetched with one aliased repository(...) query per
+        BULK_REPOS_PER_QUERY repos. Used to prefetch maintainer responsiveness
+        data for every candidate before scoring.
+
+        Args:
+            repos: (owner, repo) pairs, duplicates allowed
+            limit: Closed issues to fetch per repo
+
+        Returns:
+            Mapping of (owner, repo) to closed issues (with created_at/closed_at)
+        """
+        results = {}
+        missing = []
+        for owner, repo in dict.fromkeys(repos):
+            cached_data = self.cache.get(
+                f"graphql:repo-closed-issues:{owner}/{repo}", self.cache.REPO_TTL_MINUTES
+            )
+            if cached_data is not None:
+                results[(owner, repo)] = cached_data
+            else:
+                missing.append((owner, repo))
+
+        for i in range(0, len(missing), self.BULK_REPOS_PER_QUERY):
+            batch = missing[i:i + self.BULK_REPOS_PER_QUERY]
+            variables = {"limit": self._page_size(limit)}
+            variable_defs = ["$limit: Int!"]
+            aliases = []
+            for j, (owner, repo) in enumerate(batch):
+                variables[f"o{j}"] = owner
+                variables[f"n{j}"] = repo
+                variable_defs.append(f"$o{j}: String!, $n{j}: String!")
+                aliases.append(
+                    f"  r{j}: repository(owner: $o{j}, name: $n{j}) {{ "
+                    f"issues(first: $limit, states: CLOSED, "
+                    f"orderBy: {{field: UPDATED_AT, direction: DESC}}) {{ "
+                    f"nodes {{ number title state createdAt closedAt "
+                    f"comments {{ totalCount }} }} }} }}"
+                )
+            query = (
+                f"query({', '.join(variable_defs)}) {{\n" + "\n".join(aliases)
+                + f"\n  {self.RATE_LIMIT_FIELDS}\n}}"
+            )
+
+            try:
+                data = self._execute_query(
+                    query, variables, operation="repo-issues-bulk", allow_partial=True
+                )
+            except Exception as e:
+                # Left to the per-repo fallback
+                self.errors.append(f"GraphQL bulk repo issues query failed: {e}")
+                continue
+
+            for j, (owner, repo) in enumerate(batch):
+                repository = data.get(f"r{j}")
+                if repository is None:
+                    # Renamed, deleted or private - leave it to the per-repo fallback
+                    continue
+                issues = [
+                    self._repo_issue_from_node(node) for node in repository["issues"]["nodes"]
+                ]
+                self.cache.set(f"graphql:repo-closed-issues:{owner}/{repo}", issues)
+                results[(owner, repo)] = issues
+
+        return results
+
+    def _repo_issue_from_node(self, node: dict) -> dict:
+        """Convert a repository issue node to the REST-like dict the scorer reads."""
+        return {
+            "number": node["number"],
+            "title": node["title"],
+            "state": node["state"].lower(),
+            "created_at": node["createdAt"],
+            "closed_at": node.get("closedAt"),
+            "comments": node["comments"]["totalCount"],
+        }
+
+    def close(self):
+        """Close the client (pooled connections stay open for other clients)."""
         self.client.close()
+        self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,256 @@
+"""Exhaustive good-first-issue harvesting into a local store."""
+
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+from .github import Issue
+from .graphql import GitHubGraphQLClient
+from .planner import plan_queries, split_to_cap
+
+HARVEST_PATH = Path.home() / ".gfi-harvest.db"
+
+
+class HarvestStore:
+    """SQLite store for harvested issues and crawl checkpoints.
+
+    Issues are keyed by URL, so overlapping slices and replayed pages never
+    produce duplicates. Each page is written in the same transaction as its
+    slice's cursor, so an interrupted harvest resumes exactly where it stopped.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    CREATE TABLE IF NOT EXISTS slices (
+        query TEXT PRIMARY KEY,
+        expected INTEGER NOT NULL,
+        cursor TEXT,
+        fetched INTEGER NOT NULL DEFAULT 0,
+        done INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS issues (
+        html_url TEXT PRIMARY KEY,
+        language TEXT,
+        created_at TEXT,
+        data TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, path: Path = HARVEST_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    def get_params(self) -> Optional[dict]:
+        """Get the search parameters the stored plan was made for."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_plan(self, params: dict, slices: List[tuple]):
+        """Replace the crawl plan, dropping previously harvested issues.
+
+        Args:
+            params: Search parameters the plan covers
+            slices: (query string, expected result count) pairs
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM slices")
+            self._conn.execute("DELETE FROM issues")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('params', ?)",
+                (json.dumps(params, sort_keys=True),),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO slices (query, expected) VALUES (?, ?)", slices
+            )
+
+    def pending_slices(self) -> List[tuple]:
+        """Get (query, cursor) for every slice that hasn't finished."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT query, cursor FROM slices WHERE done = 0 ORDER BY rowid"
+            ).fetchall()
+
+    def save_page(self, query: str, issues: List[Issue], cursor: Optional[str], done: bool):
+        """Store a page of issues and advance its slice's checkpoint."""
+        rows = [
+            (
+                issue.html_url,
+                issue.repo_language,
+                issue.created_at.isoformat(),
+                issue.model_dump_json(),
+            )
+            for issue in issues
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO issues (html_url, language, created_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "UPDATE slices SET cursor = ?, fetched = fetched + ?, done = ? WHERE query = ?",
+                (cursor, len(issues), int(done), query),
+            )
+
+    def iter_issues(self, batch_size: int = 500) -> Iterator[Issue]:
+        """Stream stored issues without loading them all into memory."""
+        last_url = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT html_url, data FROM issues "
+                    "WHERE html_url > ? ORDER BY html_url LIMIT ?",
+                    (last_url, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for _, data in rows:
+                yield Issue.model_validate_json(data)
+            last_url = rows[-1][0]
+
+    def get_stats(self) -> dict:
+        """Get crawl progress and store size."""
+        with self._lock:
+            total, done, expected = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(done), 0), COALESCE(SUM(expected), 0) FROM slices"
+            ).fetchone()
+            issues = self._conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+        return {
+            "slices": total,
+            "slices_done": done,
+            "expected_issues": expected,
+            "issues": issues,
+        }
+
+    def close(self):
+        self._conn.close()
+
+
+class Harvester:
+    """Crawls every issue matching a search, beyond the 1000-result cap.
+
+    Each planned query is split by created: date range until every slice
+    returns at most 1000 results. Slices are then paged through concurrently
+    (requests still go through the token's rate limit scheduler) and written
+    page by page to a HarvestStore.
+    """
+
+    PAGE_SIZE = 100
+    DEFAULT_WORKERS = 4
+
+    def __init__(
+        self,
+        client: GitHubGraphQLClient,
+        store: HarvestStore,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        self.client = client
+        self.store = store
+        self.workers = workers
+
+    def plan(
+        self,
+        languages: List[str],
+        labels: List[str],
+        min_stars: int,
+        created_from: date,
+        created_to: Optional[date] = None,
+        restart: bool = False,
+    ) -> int:
+        """Plan the crawl, reusing a stored plan for the same parameters.
+
+        Args:
+            languages: Languages to harvest
+            labels: Labels to harvest
+            min_stars: Minimum repository star count
+            created_from: Earliest issue creation date
+            created_to: Latest issue creation date (defaults to today)
+            restart: Discard any stored plan and progress
+
+        Returns:
+            Number of slices left to crawl
+        """
+        created_to = created_to or date.today()
+        params = {
+            "languages": languages,
+            "labels": labels,
+            "min_stars": min_stars,
+            "created_from": created_from.isoformat(),
+            "created_to": created_to.isoformat(),
+        }
+
+        # A stored plan is resumed as is, even if the date window has moved on since
+        stored = self.store.get_params()
+        if stored is not None and not restart:
+            if any(stored.get(key) != params[key] for key in ("languages", "labels", "min_stars")):
+                raise Exception(
+                    "Store holds a harvest with different parameters - "
+                    "use a different --output or pass --restart"
+                )
+            return len(self.store.pending_slices())
+
+        slices = []
+        for query in plan_queries(languages, labels, min_stars, created_from, created_to):
+            slices.extend(
+                split_to_cap(
+                    query,
+                    lambda q: self.client.count_search_results(q.to_string(sort_qualifier=True)),
+                )
+            )
+
+        self.store.save_plan(
+            params,
+            [(query.to_string(sort_qualifier=True), count) for query, count in slices if count > 0],
+        )
+        return len(self.store.pending_slices())
+
+    def run(self, on_page: Optional[Callable[[str, int], None]] = None) -> dict:
+        """Crawl every pending slice.
+
+        Args:
+            on_page: Called with (query, issues on page) after each stored page
+
+        Returns:
+            Store statistics after the crawl
+        """
+        pending = self.store.pending_slices()
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [
+                executor.submit(self._crawl_slice, query, cursor, on_page, stop)
+                for query, cursor in pending
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            # On error or Ctrl+C, stop after the pages in flight; progress is already saved
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+        return self.store.get_stats()
+
+    def _crawl_slice(
+        self,
+        query: str,
+        cursor: Optional[str],
+        on_page: Optional[Callable],
+        stop: threading.Event,
+    ):
+        """Page through one slice, checkpointing after every page."""
+        while not stop.is_set():
+            page = self.client.fetch_search_page(query, self.PAGE_SIZE, cursor)
+            done = not page["has_next_page"] or not page["issues"]
+            cursor = page["end_cursor"] or cursor
+            self.store.save_page(query, page["issues"], cursor, done)
+            if on_page:
+                on_page(query, len(page["issues"]))
+            if done:
+                return
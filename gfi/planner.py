@@ -0,0 +1,198 @@
+"""Search query planner for GitHub issue search."""
+
+from datetime import date, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+# GitHub search limits
+MAX_RESULTS_PER_QUERY = 1000  # Search never returns more than this per query
+MAX_QUERY_LENGTH = 256  # Longer queries are rejected
+
+
+class SearchQuery(BaseModel):
+    """One planned issue search.
+
+    Labels are OR-ed (label:"a","b") and so are languages, so a single query
+    can cover many language/label combinations. Such a query is sorted as one
+    result set, though: its top N are the newest of the union, not N from
+    each combination.
+    """
+
+    languages: List[str]
+    labels: List[str]
+    min_stars: int
+    created_from: date
+    created_to: Optional[date] = None
+
+    def to_string(self, sort_qualifier: bool = False) -> str:
+        """Render the GitHub search query string.
+
+        Args:
+            sort_qualifier: Append sort:created-desc (GraphQL has no sort argument)
+        """
+        labels = ",".join(f'"{label}"' for label in self.labels)
+        query_parts = [
+            "is:issue",
+            "is:open",
+            f"label:{labels}",
+            *(f"language:{language}" for language in self.languages),
+            f"stars:>={self.min_stars}",
+        ]
+        if self.created_to is None:
+            query_parts.append(f"created:>={self.created_from.isoformat()}")
+        else:
+            query_parts.append(
+                f"created:{self.created_from.isoformat()}..{self.created_to.isoformat()}"
+            )
+        if sort_qualifier:
+            query_parts.append("sort:created-desc")
+        return " ".join(query_parts)
+
+    @property
+    def pair_count(self) -> int:
+        """Number of language/label pairs the query covers."""
+        return len(self.languages) * len(self.labels)
+
+    @property
+    def can_split(self) -> bool:
+        """Whether the created: range spans more than one day."""
+        return self._end() > self.created_from
+
+    def split(self) -> Tuple["SearchQuery", "SearchQuery"]:
+        """Split into two queries covering the older and newer halves of the date range."""
+        end = self._end()
+        middle = self.created_from + (end - self.created_from) / 2
+        older = self.model_copy(update={"created_to": middle})
+        newer = self.model_copy(
+            update={"created_from": middle + timedelta(days=1), "created_to": end}
+        )
+        return older, newer
+
+    def _end(self) -> date:
+        return self.created_to or date.today()
+
+
+def plan_queries(
+    languages: List[str],
+    labels: List[str],
+    min_stars: int,
+    created_from: date,
+    created_to: Optional[date] = None,
+) -> List[SearchQuery]:
+    """Group languages and labels into as few queries as possible.
+
+    Everything goes into one query unless it would exceed GitHub's query
+    length limit, in which case the longer predicate list is split in half
+    until each query fits.
+
+    Args:
+        languages: Languages to search (OR-ed)
+        labels: Labels to search (OR-ed)
+        min_stars: Minimum repository star count
+        created_from: Earliest creation date
+        created_to: Latest creation date (open-ended if None)
+
+    Returns:
+        Planned queries, in language/label order
+    """
+    if not languages or not labels:
+        return []
+
+    languages = list(dict.fromkeys(languages))
+    labels = list(dict.fromkeys(labels))
+    pending = [
+        SearchQuery(
+            languages=languages,
+            labels=labels,
+            min_stars=min_stars,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    ]
+    planned = []
+
+    while pending:
+        query = pending.pop(0)
+        fits = len(query.to_string(sort_qualifier=True)) <= MAX_QUERY_LENGTH
+        if fits or (len(query.languages) == 1 and len(query.labels) == 1):
+            planned.append(query)
+            continue
+
+        if len(query.labels) >= len(query.languages):
+            middle = len(query.labels) // 2
+            halves = [query.labels[:middle], query.labels[middle:]]
+            pending[:0] = [query.model_copy(update={"labels": half}) for half in halves]
+        else:
+            middle = len(query.languages) // 2
+            halves = [query.languages[:middle], query.languages[middle:]]
+            pending[:0] = [query.model_copy(update={"languages": half}) for half in halves]
+
+    return planned
+
+
+def split_to_cap(
+    query: SearchQuery,
+    count: Callable[[SearchQuery], int],
+    max_results: int = MAX_RESULTS_PER_QUERY,
+) -> List[Tuple[SearchQuery, int]]:
+    """Split a query by created: date range until every slice is under the result cap.
+
+    Args:
+        query: Query to check
+        count: Returns a query's total result count (total_count / issueCount)
+        max_results: Result cap per query
+
+    Returns:
+        (query, estimated result count) slices, oldest first, covering the
+        original range. Single-day slices over the cap are returned as is.
+    """
+    total = count(query)
+    if total <= max_results or not query.can_split:
+        return [(query, total)]
+
+    older, newer = query.split()
+    return split_to_cap(older, count, max_results) + split_to_cap(newer, count, max_results)
+
+
+def cap_per_pair(issues: list, languages: List[str], labels: List[str], limit: int) -> list:
+    """Keep up to `limit` issues per language/label pair, pair by pair.
+
+    A grouped query's results are the newest of its whole union, so a top-N
+    search reads up to N x pairs results and trims them here, which gives the
+    same shape as one query per pair. A pair crowded out by busier ones in
+    the union can come back with fewer than N issues.
+
+    Args:
+        issues: Issues (with repo_language and labels), newest first per query
+        languages: Searched languages, in priority order
+        labels: Searched labels, in priority order
+        limit: Issues to keep per pair
+
+    Returns:
+        Issues grouped by the first matching pair with room (dropped if
+        every pair they match is full); issues that match no pair (e.g. a
+        language GitHub spells differently) come last
+    """
+    pairs = [
+        (language.lower(), label.lower())
+        for language in dict.fromkeys(languages)
+        for label in dict.fromkeys(labels)
+    ]
+    groups = {pair: [] for pair in pairs}
+    unmatched = []
+
+    for issue in issues:
+        language = (issue.repo_language or "").lower()
+        issue_labels = {label.lower() for label in issue.labels}
+        matching = [pair for pair in pairs if pair[0] == language and pair[1] in issue_labels]
+        if not matching:
+            if len(unmatched) < limit:
+                unmatched.append(issue)
+            continue
+        for pair in matching:
+            if len(groups[pair]) < limit:
+                groups[pair].append(issue)
+                break
+
+    return [issue for group in groups.values() for issue in group] + unmatched
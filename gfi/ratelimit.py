@@ -0,0 +1,402 @@
+"""Rate-limit-aware request scheduling for GitHub and GitLab APIs."""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from .resilience import CircuitBreaker, RetryPolicy, get_breaker
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than the scheduler allows."""
+
+    def __init__(self, resource: str, wait_seconds: float):
+        self.resource = resource
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"{resource} rate limit exhausted - next request allowed in {int(wait_seconds)}s"
+        )
+
+
+def _header_float(headers, *names: str) -> Optional[float]:
+    """Read the first numeric header found among names."""
+    for name in names:
+        try:
+            value = headers.get(name)
+            if value is not None:
+                return float(value)
+        except (TypeError, ValueError, AttributeError):
+            continue
+    return None
+
+
+class TokenBucket:
+    """Request budget for one rate-limited resource.
+
+    Mirrors the provider's fixed window: `limit` requests per `window` seconds,
+    resetting at `reset_at`. Once a window is used up, further reservations are
+    queued into the next window instead of failing.
+    """
+
+    def __init__(self, limit: int, window: float, clock: Callable[[], float] = time.time):
+        self.limit = limit
+        self.window = window
+        self.clock = clock
+        self.remaining = limit
+        self.reset_at = clock() + window
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """Take one request slot.
+
+        Args:
+            max_wait: Leave the slot untaken if the wait would be longer
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = self.clock()
+            if now >= self.reset_at:
+                # Window rolled over
+                self.remaining = self.limit
+                self.reset_at = now + self.window
+
+            reset_at, remaining = self.reset_at, self.remaining
+            if remaining <= 0:
+                # Queue into the next window
+                reset_at += self.window
+                remaining = self.limit
+
+            wait = max(0.0, reset_at - self.window - now, self.blocked_until - now)
+            if max_wait is not None and wait > max_wait:
+                return wait
+
+            self.reset_at, self.remaining = reset_at, remaining - 1
+            return wait
+
+    def update(self, remaining: Optional[float], reset_at: Optional[float], limit: Optional[float]):
+        """Sync the bucket with the provider's rate limit headers."""
+        with self._lock:
+            now = self.clock()
+            if self.reset_at - self.window > now:
+                # Reservations already queued into a future window - keep them
+                return
+
+            if limit is not None:
+                self.limit = int(limit)
+            if reset_at is not None and reset_at > now:
+                if abs(reset_at - self.reset_at) > 1:
+                    # New window reported by the server
+                    self.reset_at = reset_at
+                    if remaining is not None:
+                        self.remaining = int(remaining)
+                    return
+            if remaining is not None:
+                self.remaining = min(self.remaining, int(remaining))
+
+    def headroom(self) -> int:
+        """Requests still available right now (zero or less if queued or blocked)."""
+        with self._lock:
+            now = self.clock()
+            if self.blocked_until > now:
+                return -1
+            if now >= self.reset_at:
+                return self.limit
+            if self.reset_at - self.window > now:
+                # Already borrowing from a future window
+                return self.remaining - self.limit
+            return self.remaining
+
+    def block(self, seconds: float):
+        """Hold back every request on this resource for `seconds`."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, self.clock() + seconds)
+
+
+class RateLimitScheduler:
+    """Schedules requests against per-resource token buckets.
+
+    Buckets are kept separately for GitHub's search, core and graphql budgets
+    and for GitLab, refreshed from X-RateLimit-* / RateLimit-* headers. Requests
+    wait for budget instead of failing, and throttled responses (429, or 403
+    secondary limits) are retried after Retry-After or an exponential backoff.
+    Transient failures (5xx, timeouts, dropped connections) are retried with
+    jittered backoff and counted against the host's circuit breaker.
+
+    A request that would wait longer than MAX_WAIT_SECONDS raises
+    RateLimitExceeded instead; callers that can't block that long (e.g. a web
+    request under a worker timeout) pass a shorter max_wait.
+    """
+
+    # resource -> (requests, window in seconds)
+    DEFAULT_BUDGETS: Dict[str, Tuple[int, float]] = {
+        "core": (5000, 3600),
+        "search": (30, 60),
+        "graphql": (5000, 3600),
+        "gitlab": (2000, 60),
+    }
+    MAX_RETRIES = 5
+    MAX_WAIT_SECONDS = 900
+    SECONDARY_BACKOFF_SECONDS = 60
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, Tuple[int, float]]] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.budgets = dict(self.DEFAULT_BUDGETS, **(budgets or {}))
+        self.clock = clock
+        self.sleep = sleep
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, resource: str) -> TokenBucket:
+        """Get (or create) the bucket for a resource."""
+        with self._lock:
+            if resource not in self._buckets:
+                limit, window = self.budgets.get(resource, self.budgets["core"])
+                self._buckets[resource] = TokenBucket(limit, window, clock=self.clock)
+            return self._buckets[resource]
+
+    def _max_wait(self, max_wait: Optional[float]) -> float:
+        return self.MAX_WAIT_SECONDS if max_wait is None else max_wait
+
+    def _reserve(self, resource: str, max_wait: Optional[float] = None) -> float:
+        """Reserve a slot, refusing (without taking it) waits longer than max_wait."""
+        max_wait = self._max_wait(max_wait)
+        wait = self.bucket(resource).reserve(max_wait)
+        if wait > max_wait:
+            raise RateLimitExceeded(resource, wait)
+        return wait
+
+    def acquire(self, resource: str, max_wait: Optional[float] = None):
+        """Block until a request on `resource` may be sent.
+
+        Raises:
+            RateLimitExceeded: If that would take longer than max_wait
+                (MAX_WAIT_SECONDS by default)
+        """
+        wait = self._reserve(resource, max_wait)
+        if wait > 0:
+            self.sleep(wait)
+
+    async def acquire_async(self, resource: str, max_wait: Optional[float] = None):
+        """Wait (without blocking the event loop) until a request may be sent."""
+        wait = self._reserve(resource, max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update(self, resource: str, response: httpx.Response):
+        """Update budgets from a response's rate limit headers."""
+        headers = response.headers
+        reported = headers.get("X-RateLimit-Resource") if hasattr(headers, "get") else None
+        if isinstance(reported, str) and reported:
+            resource = reported
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset_at = _header_float(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        limit = _header_float(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+
+        if remaining is None and reset_at is None and limit is None:
+            return
+        self.bucket(resource).update(remaining, reset_at, limit)
+
+    def throttle_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Get the backoff for a throttled response.
+
+        Returns:
+            Seconds to back off, or None if the response wasn't rate limited
+        """
+        status = response.status_code
+        if status != 429 and not (status == 403 and self._is_rate_limited(response)):
+            return None
+
+        retry_after = _header_float(response.headers, "Retry-After")
+        if retry_after is not None:
+            return max(retry_after, 1.0)
+
+        remaining = _header_float(response.headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset_at = _header_float(response.headers, "X-RateLimit-Reset", "RateLimit-Reset")
+        if remaining == 0 and reset_at is not None:
+            return max(reset_at - self.clock(), 1.0)
+
+        # Secondary limit without hints - back off exponentially
+        return self.SECONDARY_BACKOFF_SECONDS * (2**attempt)
+
+    def _is_rate_limited(self, response: httpx.Response) -> bool:
+        """Tell a rate-limit 403 apart from a permissions 403."""
+        if _header_float(response.headers, "Retry-After") is not None:
+            return True
+        if _header_float(response.headers, "X-RateLimit-Remaining", "RateLimit-Remaining") == 0:
+            return True
+        text = getattr(response, "text", "")
+        return isinstance(text, str) and "rate limit" in text.lower()
+
+    def _record(
+        self,
+        resource: str,
+        response: httpx.Response,
+        attempt: int,
+        max_wait: Optional[float] = None,
+    ) -> Optional[float]:
+        """Update budgets and, if throttled, block the resource for the backoff."""
+        self.update(resource, response)
+        delay = self.throttle_delay(response, attempt)
+        if delay is not None and attempt < self.MAX_RETRIES:
+            if delay > self._max_wait(max_wait):
+                raise RateLimitExceeded(resource, delay)
+            self.bucket(resource).block(delay)
+            return delay
+        return None
+
+    def _transient_delay(
+        self,
+        breaker: Optional[CircuitBreaker],
+        retries: int,
+        previous: Optional[float],
+        response: Optional[httpx.Response] = None,
+        max_wait: Optional[float] = None,
+    ) -> Optional[float]:
+        """Count a transient failure and get the delay before retrying it.
+
+        Returns:
+            Seconds to wait, or None once the retry policy is exhausted or the
+            delay would be longer than max_wait
+        """
+        if breaker is not None:
+            breaker.record_failure()
+        if retries >= self.retry_policy.max_retries:
+            return None
+        retry_after = (
+            _header_float(response.headers, "Retry-After") if response is not None else None
+        )
+        delay = self.retry_policy.backoff(previous, retry_after)
+        if delay > self._max_wait(max_wait):
+            return None
+        if breaker is not None:
+            breaker.record_retry()
+        return delay
+
+    def send(
+        self,
+        resource: str,
+        request: Callable[[], httpx.Response],
+        host: Optional[str] = None,
+        max_wait: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request once budget allows, retrying throttled and transient failures.
+
+        Args:
+            resource: Budget to charge ("core", "search", "graphql", "gitlab")
+            request: Callable that sends the request and returns the response
+            host: Host the request goes to, for its circuit breaker
+            max_wait: Longest wait for budget or a throttling backoff
+                (MAX_WAIT_SECONDS if None)
+
+        Returns:
+            The first response that is neither throttled nor transient (or the
+            last one once retries run out)
+
+        Raises:
+            CircuitOpenError: If the host has been failing and requests are paused
+            RateLimitExceeded: If the budget wouldn't allow the request within max_wait
+        """
+        breaker = get_breaker(host) if host else None
+        attempt = retries = 0
+        delay = None
+        while True:
+            if breaker is not None:
+                breaker.check()
+            self.acquire(resource, max_wait)
+            try:
+                response = request()
+            except httpx.TransportError:
+                delay = self._transient_delay(breaker, retries, delay, max_wait=max_wait)
+                if delay is None:
+                    raise
+                retries += 1
+                self.sleep(delay)
+                continue
+
+            if self.retry_policy.is_transient(response):
+                delay = self._transient_delay(breaker, retries, delay, response, max_wait)
+                if delay is None:
+                    return response
+                retries += 1
+                self.sleep(delay)
+                continue
+
+            if breaker is not None:
+                breaker.record_success()
+            if self._record(resource, response, attempt, max_wait) is None:
+                return response
+            attempt += 1
+
+    async def send_async(
+        self,
+        resource: str,
+        request: Callable[[], Awaitable[httpx.Response]],
+        host: Optional[str] = None,
+        max_wait: Optional[float] = None,
+    ) -> httpx.Response:
+        """Async version of send()."""
+        breaker = get_breaker(host) if host else None
+        attempt = retries = 0
+        delay = None
+        while True:
+            if breaker is not None:
+                breaker.check()
+            await self.acquire_async(resource, max_wait)
+            try:
+                response = await request()
+            except httpx.TransportError:
+                delay = self._transient_delay(breaker, retries, delay, max_wait=max_wait)
+                if delay is None:
+                    raise
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if self.retry_policy.is_transient(response):
+                delay = self._transient_delay(breaker, retries, delay, response, max_wait)
+                if delay is None:
+                    return response
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if breaker is not None:
+                breaker.record_success()
+            if self._record(resource, response, attempt, max_wait) is None:
+                return response
+            attempt += 1
+
+
+_schedulers: Dict[Optional[str], RateLimitScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(token: Optional[str] = None) -> RateLimitScheduler:
+    """Get the process-wide scheduler for a token.
+
+    Budgets belong to the token, so every client (and every web request)
+    using the same token shares one scheduler.
+    """
+    with _schedulers_lock:
+        if token not in _schedulers:
+            _schedulers[token] = RateLimitScheduler()
+        return _schedulers[token]
+
+
+def reset_schedulers():
+    """Forget all schedulers (used by tests)."""
+    with _schedulers_lock:
+        _schedulers.clear()
@@ -0,0 +1,134 @@
+"""Retry policy and per-host circuit breakers for API requests."""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host that keeps failing."""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"{host} is failing - requests paused for {int(retry_in) + 1}s")
+
+
+class RetryPolicy:
+    """Retries for transient failures (5xx responses, timeouts, connection errors).
+
+    Delays use decorrelated jitter: each one is drawn between `base_delay`
+    and three times the previous delay, capped at `max_delay`, so clients
+    hitting the same outage don't retry in lockstep. A Retry-After header
+    overrides the drawn delay.
+    """
+
+    RETRY_STATUSES = {500, 502, 503, 504}
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        uniform: Callable[[float, float], float] = random.uniform,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.uniform = uniform
+
+    def is_transient(self, response: httpx.Response) -> bool:
+        """Whether a response is worth retrying."""
+        return response.status_code in self.RETRY_STATUSES
+
+    def backoff(self, previous: Optional[float], retry_after: Optional[float] = None) -> float:
+        """Get the delay before the next attempt.
+
+        Args:
+            previous: Delay before the previous attempt (None on the first retry)
+            retry_after: Server-requested delay, if any
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        upper = max(self.base_delay, (previous or self.base_delay) * 3)
+        return min(self.max_delay, self.uniform(self.base_delay, upper))
+
+
+class CircuitBreaker:
+    """Fails fast for a host after repeated consecutive failures.
+
+    After FAILURE_THRESHOLD failures in a row the circuit opens and requests
+    raise CircuitOpenError for RESET_SECONDS. The next request is then let
+    through as a trial: success closes the circuit, failure reopens it.
+    """
+
+    FAILURE_THRESHOLD = 5
+    RESET_SECONDS = 30.0
+
+    def __init__(self, host: str, clock: Callable[[], float] = time.monotonic):
+        self.host = host
+        self.clock = clock
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.stats = {"failures": 0, "retries": 0, "short_circuits": 0, "opened": 0}
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Raise CircuitOpenError if requests to this host are paused."""
+        with self._lock:
+            if self.state != "open":
+                return
+            elapsed = self.clock() - self.opened_at
+            if elapsed >= self.RESET_SECONDS:
+                self.state = "half-open"
+                return
+            self.stats["short_circuits"] += 1
+            raise CircuitOpenError(self.host, self.RESET_SECONDS - elapsed)
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.stats["failures"] += 1
+            self.consecutive_failures += 1
+            if self.state == "half-open" or self.consecutive_failures >= self.FAILURE_THRESHOLD:
+                if self.state != "open":
+                    self.stats["opened"] += 1
+                self.state = "open"
+                self.opened_at = self.clock()
+
+    def record_retry(self):
+        with self._lock:
+            self.stats["retries"] += 1
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a host."""
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def get_resilience_stats() -> List[dict]:
+    """Get retry and circuit breaker counts for every host contacted."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return [{"host": b.host, "state": b.state, **b.stats} for b in breakers]
+
+
+def reset_breakers():
+    """Forget all circuit breakers (used by tests)."""
+    with _breakers_lock:
+        _breakers.clear()
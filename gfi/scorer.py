@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from pydantic import BaseModel
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from .github import GitHubClient, Issue
 
 
@@ -22,6 +22,26 @@ class IssueScorer:
 
     def __init__(self, client: Union[GitHubClient, 'GitHubGraphQLClient']):
         self.client = client
+        self._closed_issues: Dict[Tuple[str, str], List[dict]] = {}
+
+    def prefetch(self, issues: List[Issue]):
+        """Fetch maintainer responsiveness data for every candidate repo in bulk.
+
+        Call before scoring a batch; score_issue then reads the prefetched data
+        instead of making one request per issue.
+        """
+        if not hasattr(self.client, "get_repos_closed_issues"):
+            return
+
+        repos = [(issue.repo_owner, issue.repo_name) for issue in issues]
+        missing = [repo for repo in dict.fromkeys(repos) if repo not in self._closed_issues]
+        if not missing:
+            return
+
+        try:
+            self._closed_issues.update(self.client.get_repos_closed_issues(missing, limit=10))
+        except Exception:
+            pass  # Per-issue lookups still work
 
     def score_issue(self, issue: Issue) -> IssueScore:
         """Score an issue across multiple dimensions."""
@@ -76,13 +96,18 @@ class IssueScorer:
     def _score_maintainer_responsiveness(self, issue: Issue) -> float:
         """Score maintainer responsiveness based on recent issue activity."""
         try:
-            # Get recent issues from repo
-            recent_issues = self.client.get_repo_issues(
-                issue.repo_owner,
-                issue.repo_name,
-                state="closed",
-                limit=10
-            )
+            # Get recent issues from repo (prefetched when possible)
+            repo_key = (issue.repo_owner, issue.repo_name)
+            if repo_key in self._closed_issues:
+                recent_issues = self._closed_issues[repo_key]
+            else:
+                recent_issues = self.client.get_repo_issues(
+                    issue.repo_owner,
+                    issue.repo_name,
+                    state="closed",
+                    limit=10
+                )
+                self._closed_issues[repo_key] = recent_issues
 
             if not recent_issues:
                 return 0.5  # Neutral if no data
@@ -0,0 +1,117 @@
+"""Request coalescing: concurrent calls with the same key share one result."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Coalesces concurrent calls from threads.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for the same result (or exception) instead of repeating
+    the work. Once it finishes the key is forgotten, so later calls run again
+    (by then they are normally served from the cache the first call filled).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.shared = 0  # Calls answered by another caller's flight
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identifies the work (usually its cache key)
+            fn: Does the work
+
+        Returns:
+            fn's result
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of keys currently being worked on."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent calls from asyncio tasks.
+
+    The work runs as its own task, so a caller being cancelled doesn't cancel
+    it for the others. Flights are per event loop.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn(), or the in-flight call with the same key.
+
+        Args:
+            key: Identifies the work (usually its cache key)
+            fn: Coroutine function doing the work
+
+        Returns:
+            fn's result
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        task = self._tasks.get(flight_key)
+
+        if task is None:
+            task = loop.create_task(fn())
+            self._tasks[flight_key] = task
+            task.add_done_callback(lambda done: self._finish(flight_key, done))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)
+
+    def _finish(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task):
+        self._tasks.pop(flight_key, None)
+        if not task.cancelled():
+            task.exception()  # Retrieved here in case every caller was cancelled
+
+    def in_flight(self) -> int:
+        """Number of keys currently being worked on."""
+        return len(self._tasks)
+
+
+_flights = SingleFlight()
+_async_flights = AsyncSingleFlight()
+
+
+def do(key: Hashable, fn: Callable[[], Any]) -> Any:
+    """Run fn once across all threads currently asking for key."""
+    return _flights.do(key, fn)
+
+
+async def do_async(key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """Await fn() once across all tasks currently asking for key."""
+    return await _async_flights.do(key, fn)
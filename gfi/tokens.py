@@ -0,0 +1,86 @@
+"""Token pool for spreading API load across several GitHub tokens."""
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+from .ratelimit import get_scheduler
+
+
+class TokenPool:
+    """Pool of GitHub tokens, each with its own rate limit budgets.
+
+    Every request goes to the token with the most headroom on the resource
+    being used (search, core, graphql), as tracked from response headers by
+    that token's RateLimitScheduler. Ties go to the least used token.
+    """
+
+    def __init__(self, tokens: List[str]):
+        """Initialize pool.
+
+        Args:
+            tokens: GitHub personal access tokens (duplicates and blanks are dropped)
+        """
+        self.tokens = [token for token in dict.fromkeys(t.strip() for t in tokens) if token]
+        if not self.tokens:
+            raise ValueError("TokenPool needs at least one token")
+        self._usage: Dict[str, Dict[str, int]] = {token: {} for token in self.tokens}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["TokenPool"]:
+        """Build a pool from GITHUB_TOKENS (comma-separated) or GITHUB_TOKEN.
+
+        Returns:
+            Token pool, or None if neither variable is set
+        """
+        raw = os.getenv("GITHUB_TOKENS") or os.getenv("GITHUB_TOKEN") or ""
+        tokens = [token for token in raw.split(",") if token.strip()]
+        return cls(tokens) if tokens else None
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def checkout(self, resource: str) -> str:
+        """Pick the token with the most headroom for a resource and count the request.
+
+        Args:
+            resource: Rate limit budget the request will charge
+
+        Returns:
+            Token to send the request with
+        """
+        with self._lock:
+            token = max(
+                self.tokens,
+                key=lambda t: (
+                    get_scheduler(t).bucket(resource).headroom(),
+                    -sum(self._usage[t].values()),
+                ),
+            )
+            usage = self._usage[token]
+            usage[resource] = usage.get(resource, 0) + 1
+            return token
+
+    def get_stats(self) -> List[dict]:
+        """Get per-token usage and remaining quota.
+
+        Returns:
+            One dict per token, identified by its slot in the pool rather than
+            any part of the token itself
+        """
+        stats = []
+        with self._lock:
+            for slot, token in enumerate(self.tokens):
+                scheduler = get_scheduler(token)
+                stats.append(
+                    {
+                        "slot": slot,
+                        "requests": dict(self._usage[token]),
+                        "remaining": {
+                            resource: scheduler.bucket(resource).headroom()
+                            for resource in ("core", "search", "graphql")
+                        },
+                    }
+                )
+        return stats
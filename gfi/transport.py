@@ -0,0 +1,147 @@
+"""Shared, pooled HTTP transports for all API clients."""
+
+import atexit
+import os
+import threading
+import urllib.request
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    # HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+    HTTP2_AVAILABLE = False
+
+
+DEFAULT_TIMEOUT = 30.0
+
+# Pool settings for transports created from now on (see configure_pool)
+_pool_config = {
+    "max_connections": int(os.getenv("GFI_HTTP_MAX_CONNECTIONS", "20")),
+    "max_keepalive_connections": int(os.getenv("GFI_HTTP_MAX_KEEPALIVE", "10")),
+    "keepalive_expiry": float(os.getenv("GFI_HTTP_KEEPALIVE_EXPIRY", "60")),
+    "http2": os.getenv("GFI_HTTP2", "1") != "0",
+}
+
+
+class SharedTransport(httpx.HTTPTransport):
+    """HTTPTransport shared by every client talking to one host.
+
+    Closing a client leaves the transport open, so other clients (and later
+    web requests or watch cycles) keep reusing its pooled connections. The
+    registry shuts transports down with close_transports().
+    """
+
+    def close(self):
+        pass
+
+    def shutdown(self):
+        """Close every pooled connection."""
+        super().close()
+
+
+_transports: Dict[Tuple[str, Optional[str]], SharedTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def configure_pool(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+):
+    """Tune the connection pool.
+
+    Settings apply to transports created afterwards; call close_transports()
+    first to rebuild existing ones. Defaults come from GFI_HTTP_* env vars.
+
+    Args:
+        max_connections: Connections per host
+        max_keepalive_connections: Idle connections kept open per host
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Use HTTP/2 when the h2 package is installed
+    """
+    updates = {
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+        "keepalive_expiry": keepalive_expiry,
+        "http2": http2,
+    }
+    _pool_config.update({key: value for key, value in updates.items() if value is not None})
+
+
+def pool_limits() -> httpx.Limits:
+    """Get the configured connection pool limits."""
+    return httpx.Limits(
+        max_connections=_pool_config["max_connections"],
+        max_keepalive_connections=_pool_config["max_keepalive_connections"],
+        keepalive_expiry=_pool_config["keepalive_expiry"],
+    )
+
+
+def http2_enabled() -> bool:
+    """Whether new transports negotiate HTTP/2."""
+    return _pool_config["http2"] and HTTP2_AVAILABLE
+
+
+def env_proxy(url: str) -> Optional[str]:
+    """Get the proxy the environment sets for a URL, as httpx would read it.
+
+    HTTPS_PROXY / HTTP_PROXY / ALL_PROXY (either case) pick the proxy and
+    NO_PROXY exempts hosts. A client given an explicit transport skips this
+    lookup, so shared transports have to apply it themselves.
+    """
+    parsed = httpx.URL(url)
+    proxies = urllib.request.getproxies_environment()
+    if urllib.request.proxy_bypass_environment(parsed.host, proxies):
+        return None
+    return proxies.get(parsed.scheme) or proxies.get("all")
+
+
+def get_transport(url: str) -> SharedTransport:
+    """Get the process-wide transport for a URL's host (and the proxy it goes through)."""
+    parsed = httpx.URL(url)
+    proxy = env_proxy(url)
+    key = (f"{parsed.scheme}://{parsed.netloc.decode()}", proxy)
+    with _transports_lock:
+        if key not in _transports:
+            _transports[key] = SharedTransport(
+                http2=http2_enabled(), limits=pool_limits(), proxy=proxy
+            )
+        return _transports[key]
+
+
+def create_client(base_url: str, headers: dict, timeout: float = DEFAULT_TIMEOUT) -> httpx.Client:
+    """Create a client on the shared transport for base_url's host.
+
+    Clients are cheap; each keeps its own headers (tokens) while connections
+    are pooled per host across the whole process.
+    """
+    return httpx.Client(headers=headers, timeout=timeout, transport=get_transport(base_url))
+
+
+def create_async_client(headers: dict, timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """Create an async client with the configured pool limits and HTTP/2 setting.
+
+    Async connections belong to one event loop, so async clients get their
+    own pool rather than the shared transports.
+    """
+    return httpx.AsyncClient(
+        headers=headers, timeout=timeout, limits=pool_limits(), http2=http2_enabled()
+    )
+
+
+def close_transports():
+    """Close every shared transport (runs automatically at exit)."""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.shutdown()
+
+
+atexit.register(close_transports)
@@ -10,12 +10,12 @@ if TYPE_CHECKING:
     from .github import Issue
     from .scorer import IssueScore
 
-from .github import GitHubClient
+from .async_github import AsyncGitHubClient, ConcurrentGitHubClient
 from .scorer import IssueScorer
 
-
 WATCH_STATE_FILE = Path.home() / ".gfi-watch-state.json"
 CHECK_INTERVAL_HOURS = 6
+RETRY_INTERVAL_MINUTES = 15  # After a failed check
 
 
 def load_watch_state() -> dict:
@@ -60,34 +60,38 @@ def is_watch_enabled() -> bool:
 def check_for_new_issues(config: dict):
     """Check for new high-quality issues."""
 
-    client = GitHubClient(config["token"])
-    scorer = IssueScorer(client)
-
-    # Search for issues
-    languages = config.get("languages", [])[:3]
-    issues = client.search_good_first_issues(
-        languages=languages,
-        min_stars=50,
-        max_age_days=7,  # Only recent issues
-        limit=20
-    )
+    with ConcurrentGitHubClient(
+        config["token"],
+        max_concurrency=config.get("concurrency", AsyncGitHubClient.DEFAULT_CONCURRENCY),
+    ) as client:
+        scorer = IssueScorer(client)
+
+        # Search for issues
+        languages = config.get("languages", [])[:3]
+        issues = client.search_good_first_issues(
+            languages=languages,
+            min_stars=50,
+            max_age_days=7,  # Only recent issues
+            limit=20
+        )
 
-    # Load state to track seen issues
-    state = load_watch_state()
-    seen_urls = set(state.get("seen_issues", []))
+        # Load state to track seen issues
+        state = load_watch_state()
+        seen_urls = set(state.get("seen_issues", []))
 
-    # Score and filter new high-quality issues
-    new_good_issues = []
-    for issue in issues:
-        if issue.html_url in seen_urls:
-            continue
+        # Score and filter new high-quality issues
+        new_good_issues = []
+        scorer.prefetch([issue for issue in issues if issue.html_url not in seen_urls])
+        for issue in issues:
+            if issue.html_url in seen_urls:
+                continue
 
-        score = scorer.score_issue(issue)
+            score = scorer.score_issue(issue)
 
-        # Only notify for excellent matches (0.7+)
-        if score.total_score >= 0.7:
-            new_good_issues.append((score, issue))
-            seen_urls.add(issue.html_url)
+            # Only notify for excellent matches (0.7+)
+            if score.total_score >= 0.7:
+                new_good_issues.append((score, issue))
+                seen_urls.add(issue.html_url)
 
     # Update state
     state["seen_issues"] = list(seen_urls)[-100:]  # Keep last 100
@@ -129,7 +133,13 @@ def run_watch_daemon(config: dict):
                 print("Watch mode disabled. Exiting...")
                 break
 
-            new_issues = check_for_new_issues(config)
+            try:
+                new_issues = check_for_new_issues(config)
+            except Exception as e:
+                # Upstream trouble shouldn't kill the daemon - try again soon
+                print(f"Check failed: {e}. Retrying in {RETRY_INTERVAL_MINUTES} minutes.")
+                time.sleep(RETRY_INTERVAL_MINUTES * 60)
+                continue
 
             if new_issues:
                 # Send notification for best match
@@ -0,0 +1,27 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from gfi.cache import DiskCache, reset_memory_tier
+from gfi.ratelimit import reset_schedulers
+from gfi.resilience import reset_breakers
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    """Point every cache backend at a per-test directory instead of ~/.gfi-cache."""
+    path = tmp_path / ".gfi-cache-test"
+    monkeypatch.setattr(DiskCache, "CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limits():
+    """Give every test its own rate limit budgets, circuit breakers and memory cache."""
+    reset_schedulers()
+    reset_breakers()
+    reset_memory_tier()
+    yield
+    reset_schedulers()
+    reset_breakers()
+    reset_memory_tier()
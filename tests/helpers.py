@@ -0,0 +1,19 @@
+"""Helpers shared by test modules."""
+
+
+def make_item(number, repo="test/repo"):
+    """Build a REST search item."""
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "url": f"https://api.github.com/repos/{repo}/issues/{number}",
+        "html_url": f"https://github.com/{repo}/issues/{number}",
+        "body": "Test body",
+        "state": "open",
+        "created_at": "2026-02-15T10:00:00Z",
+        "updated_at": "2026-02-16T10:00:00Z",
+        "labels": [{"name": "good first issue"}],
+        "repository_url": f"https://api.github.com/repos/{repo}",
+        "user": {"login": "testuser"},
+        "comments": 0,
+    }
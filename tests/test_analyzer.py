@@ -0,0 +1,114 @@
+"""Tests for profile analysis."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from gfi.analyzer import ProfileAnalyzer, ProfileSnapshot
+from gfi.emulator import create_app, generate_corpus
+from gfi.github import GitHubClient
+from gfi.graphql import GitHubGraphQLClient
+
+
+@pytest.fixture
+def corpus():
+    return generate_corpus(seed=4, repos=30, issues_per_repo=1, users=1, projects=0)
+
+
+def attach(client, app, requests):
+    """Point a gfi client at the emulator, recording each request."""
+    client.client = httpx.Client(
+        transport=httpx.WSGITransport(app=app),
+        event_hooks={"request": [requests.append]},
+    )
+    return client
+
+
+def expire_snapshot(analyzer, username):
+    """Move a snapshot's last refresh out of the freshness window."""
+    snapshot = analyzer.load_snapshot(username)
+    analyzer.save_snapshot(
+        snapshot.model_copy(update={"refreshed_at": datetime(2000, 1, 1, tzinfo=timezone.utc)})
+    )
+
+
+def add_star(corpus, key):
+    """Star a repo as dev0, newest first like GitHub lists them."""
+    starred = corpus.users["dev0"]["starred"]
+    starred.insert(0, (key, starred[0][1] + timedelta(hours=1)))
+
+
+@pytest.mark.parametrize("client_class", [GitHubClient, GitHubGraphQLClient])
+def test_refresh_only_fetches_new_stars(client_class, corpus):
+    """Test that a second build folds in just the stars added since the snapshot."""
+    requests = []
+    client = attach(client_class("fake_token"), create_app(corpus), requests)
+    analyzer = ProfileAnalyzer(client)
+
+    new_repo, _ = corpus.users["dev0"]["starred"].pop(0)
+    first = analyzer.build_profile("dev0")
+    before = analyzer.load_snapshot("dev0")
+    assert first.starred_count == len(corpus.users["dev0"]["starred"])
+
+    add_star(corpus, new_repo)
+    expire_snapshot(analyzer, "dev0")
+    requests.clear()
+
+    second = analyzer.build_profile("dev0")
+
+    star_requests = [r for r in requests if "starred" in r.url.path or r.url.path == "/graphql"]
+    assert len(star_requests) == 1
+    assert second.starred_count == first.starred_count + 1
+    language = corpus.repos[new_repo]["language"]
+    assert (
+        analyzer.load_snapshot("dev0").language_counts[language]
+        == before.language_counts.get(language, 0) + 1
+    )
+
+
+def test_fresh_snapshot_skips_requests(corpus):
+    """Test that a build within the profile TTL of the last refresh makes no requests."""
+    requests = []
+    client = attach(GitHubClient("fake_token"), create_app(corpus), requests)
+    analyzer = ProfileAnalyzer(client)
+    first = analyzer.build_profile("dev0")
+    requests.clear()
+
+    second = analyzer.build_profile("dev0")
+
+    assert requests == []
+    assert second == first
+
+
+def test_fold_stars_updates_counts_and_newest():
+    """Test that new stars are added to the counts and move the high-water mark."""
+    snapshot = ProfileSnapshot(
+        username="dev",
+        language_counts={"Python": 2},
+        topic_counts={"cli": 1},
+        starred_count=2,
+        taken_at="2026-01-01T00:00:00",
+    )
+
+    folded = ProfileAnalyzer.fold_stars(
+        snapshot,
+        [
+            {"starred_at": "2026-01-03T00:00:00Z", "language": "Python", "topics": ["cli", "web"]},
+            {"starred_at": "2026-01-02T00:00:00Z", "language": None, "topics": []},
+        ],
+    )
+
+    assert folded.language_counts == {"Python": 3}
+    assert folded.topic_counts == {"cli": 2, "web": 1}
+    assert folded.starred_count == 4
+    assert folded.newest_starred_at.isoformat() == "2026-01-03T00:00:00"
+    assert snapshot.starred_count == 2
+
+
+def test_stale_snapshot_triggers_full_rebuild():
+    """Test that snapshots older than SNAPSHOT_MAX_AGE_DAYS are ignored."""
+    analyzer = ProfileAnalyzer(GitHubClient("fake_token"))
+    analyzer.save_snapshot(ProfileSnapshot(username="dev", taken_at="2020-01-01T00:00:00"))
+
+    assert analyzer.load_snapshot("dev") is None
@@ -0,0 +1,236 @@
+"""Tests for async GitHub client."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from helpers import make_item
+
+from gfi.async_github import AsyncGitHubClient, ConcurrentGitHubClient
+
+
+def make_transport(requests, max_in_flight):
+    """Mock transport that records requests and tracks peak concurrency."""
+    state = {"in_flight": 0}
+
+    async def handler(request):
+        requests.append(request)
+        state["in_flight"] += 1
+        max_in_flight.append(state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+
+        if request.url.path == "/search/issues":
+            query = request.url.params["q"]
+            if "Python" in query:
+                return httpx.Response(
+                    200, json={"items": [make_item(1), make_item(2, "other/repo")]}
+                )
+            return httpx.Response(200, json={"items": [make_item(1)]})
+
+        return httpx.Response(
+            200,
+            json={
+                "stargazers_count": 100,
+                "language": "Python",
+                "description": "Test repo",
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_async_search_runs_concurrently(monkeypatch):
+    """Test that all planned searches are in flight together."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)  # One planned query per pair
+    requests, in_flight = [], []
+
+    async def run():
+        client = AsyncGitHubClient("fake_token", use_cache=False)
+        client.client = httpx.AsyncClient(transport=make_transport(requests, in_flight))
+        async with client:
+            return await client.search_good_first_issues(
+                languages=["Python", "Go"],
+                labels=["good first issue", "help wanted"],
+            )
+
+    issues = asyncio.run(run())
+
+    search_calls = [r for r in requests if r.url.path == "/search/issues"]
+    repo_calls = [r for r in requests if r.url.path.startswith("/repos/")]
+    assert len(search_calls) == 4
+    assert len(repo_calls) == 2  # One per distinct repo
+    assert max(in_flight) == 4
+    assert [issue.number for issue in issues] == [1, 2]
+    assert issues[0].repo_stars == 100
+
+
+def test_async_search_respects_concurrency_cap(monkeypatch):
+    """Test that max_concurrency bounds requests in flight."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)
+    requests, in_flight = [], []
+
+    async def run():
+        client = AsyncGitHubClient("fake_token", use_cache=False, max_concurrency=2)
+        client.client = httpx.AsyncClient(transport=make_transport(requests, in_flight))
+        async with client:
+            return await client.search_good_first_issues(
+                languages=["Python", "Go", "Rust"],
+                labels=["good first issue", "help wanted"],
+            )
+
+    asyncio.run(run())
+
+    assert len([r for r in requests if r.url.path == "/search/issues"]) == 6
+    assert max(in_flight) == 2
+
+
+def test_async_search_raises_http_errors():
+    """Test that HTTP errors propagate like the sync client."""
+
+    async def run():
+        client = AsyncGitHubClient("fake_token", use_cache=False)
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(422, json={}))
+        )
+        async with client:
+            return await client.search_good_first_issues(languages=["Python"])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+
+def test_concurrent_client_sync_wrapper(monkeypatch):
+    """Test that the sync wrapper runs the async search to completion."""
+    requests, in_flight = [], []
+    transport = make_transport(requests, in_flight)
+
+    client = ConcurrentGitHubClient("fake_token", use_cache=False, max_concurrency=3)
+
+    def async_client():
+        async_client = AsyncGitHubClient("fake_token", use_cache=False, max_concurrency=3)
+        async_client.client = httpx.AsyncClient(transport=transport)
+        return async_client
+
+    monkeypatch.setattr(client, "_async_client", async_client)
+
+    issues = client.search_good_first_issues(languages=["Python"], labels=["good first issue"])
+
+    assert [issue.number for issue in issues] == [1, 2]
+
+
+def test_find_streams_through_concurrent_client(monkeypatch, tmp_path):
+    """Test that `gfi find` streams its search through the concurrent client."""
+    from click.testing import CliRunner
+
+    from gfi import cli
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"token": "fake_token", "username": "dev", "languages": ["Python", "Go"]}'
+    )
+    monkeypatch.setattr(cli, "CONFIG_PATH", config_path)
+    monkeypatch.setattr(cli, "IssueScorer", lambda client: MagicMock())
+    monkeypatch.setattr(cli.telemetry, "log_event", lambda *args, **kwargs: None)
+    monkeypatch.setattr(cli.telemetry, "display_stats", lambda console: None)
+
+    requests, in_flight = [], []
+    transport = make_transport(requests, in_flight)
+
+    def async_client(self):
+        async_client = AsyncGitHubClient(
+            "fake_token", use_cache=False, max_concurrency=self.max_concurrency
+        )
+        async_client.client = httpx.AsyncClient(transport=transport)
+        return async_client
+
+    monkeypatch.setattr(ConcurrentGitHubClient, "_async_client", async_client)
+    monkeypatch.setattr(
+        ConcurrentGitHubClient,
+        "search_good_first_issues",
+        lambda self, **kwargs: pytest.fail("find should stream, not wait for the full list"),
+    )
+
+    result = CliRunner().invoke(
+        cli.cli, ["find", "--no-card", "--no-cache", "--labels", "good first issue"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len([r for r in requests if r.url.path == "/search/issues"]) == 1
+    assert max(in_flight) > 1  # The repo lookups ran together
+
+
+def test_concurrent_client_streams_issues(monkeypatch):
+    """Test that the sync stream yields the async stream's issues and raises its errors."""
+    client = ConcurrentGitHubClient("fake_token", use_cache=False)
+
+    def async_client(transport):
+        async_client = AsyncGitHubClient("fake_token", use_cache=False)
+        async_client.client = httpx.AsyncClient(transport=transport)
+        return async_client
+
+    monkeypatch.setattr(client, "_async_client", lambda: async_client(make_transport([], [])))
+    assert [issue.number for issue in client.iter_good_first_issues(languages=["Python"])] == [1, 2]
+
+    failing = httpx.MockTransport(lambda request: httpx.Response(422, json={}))
+    monkeypatch.setattr(client, "_async_client", lambda: async_client(failing))
+    with pytest.raises(httpx.HTTPStatusError):
+        list(client.iter_good_first_issues(languages=["Python"]))
+
+
+def test_async_iter_issues_starts_every_query_at_once(monkeypatch):
+    """Test that the first pages of all planned queries are requested together."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)  # One planned query per pair
+    requests, in_flight = [], []
+
+    async def run():
+        client = AsyncGitHubClient("fake_token", use_cache=False)
+        client.client = httpx.AsyncClient(transport=make_transport(requests, in_flight))
+        async with client:
+            return [
+                issue.number
+                async for issue in client.iter_good_first_issues(
+                    languages=["Python", "Go"], labels=["good first issue", "help wanted"]
+                )
+            ]
+
+    assert asyncio.run(run()) == [1, 2]
+    assert len([r for r in requests if r.url.path == "/search/issues"]) == 4
+    assert max(in_flight) >= 4
+
+
+def test_async_iter_issues_follows_link_header():
+    """Test that the async stream follows rel="next" and stops when the consumer does."""
+    requests = []
+    next_url = "https://api.github.com/search/issues?q=x&page=2"
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/search/issues" and "page" not in request.url.params:
+            return httpx.Response(
+                200,
+                json={"items": [make_item(1), make_item(2)]},
+                headers={
+                    "Link": f'<{next_url}>; rel="next"',
+                },
+            )
+        if request.url.path == "/search/issues":
+            return httpx.Response(200, json={"items": [make_item(3, "other/repo")]})
+        return httpx.Response(200, json={"stargazers_count": 100})
+
+    async def collect(limit=None):
+        client = AsyncGitHubClient("fake_token", use_cache=False)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            return [
+                issue.number
+                async for issue in client.iter_good_first_issues(languages=["Python"], limit=limit)
+            ]
+
+    assert asyncio.run(collect()) == [1, 2, 3]
+
+    requests.clear()
+    assert asyncio.run(collect(limit=2)) == [1, 2]
+    # The first page already reached the limit, so page 2 was never requested
+    assert len([r for r in requests if r.url.path == "/search/issues"]) == 1
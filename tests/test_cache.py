@@ -1,17 +1,24 @@
 """Tests for cache module."""
 
 import pytest
+import sqlite3
 import json
 import time
 from pathlib import Path
-from gfi.cache import DiskCache
+from unittest.mock import patch
+from gfi.cache import (
+    CacheManifest,
+    DiskCache,
+    MemoryTier,
+    SQLiteCache,
+    create_cache,
+    get_tier_stats,
+)
 
 
 @pytest.fixture
-def cache(tmp_path):
+def cache():
     """Create cache instance with temp directory."""
-    # Override cache directory for testing
-    DiskCache.CACHE_DIR = tmp_path / ".gfi-cache-test"
     return DiskCache(enabled=True)
 
 
@@ -110,6 +117,28 @@ def test_corrupted_cache_file(cache):
     assert result is None
 
 
+def test_corrupted_cache_file_is_dropped_from_manifest(cache):
+    """Test that deleting a corrupted entry is recorded in the manifest."""
+    cache.set("good_key", "good_value")
+    cache.set("bad_key", "value")
+    cache._get_cache_path(cache._get_cache_key("bad_key")).write_text("corrupted json{{{")
+
+    assert cache.get("bad_key", 60) is None
+    assert cache.get_stats()["file_count"] == 1
+    assert not cache._get_cache_path(cache._get_cache_key("bad_key")).exists()
+
+
+def test_failed_write_keeps_previous_entry(cache):
+    """Test that an interrupted write leaves the old entry and no partial files."""
+    cache.set("key", "old")
+
+    with patch("gfi.cache.json.dump", side_effect=OSError("disk full")):
+        cache.set("key", "new")
+
+    assert cache.get("key", 60) == "old"
+    assert [path.suffix for path in cache.CACHE_DIR.iterdir() if path.suffix != ".log"] == [".json"]
+
+
 def test_cache_with_complex_data(cache):
     """Test caching complex nested data structures."""
     complex_data = {
@@ -129,3 +158,304 @@ def test_cache_with_complex_data(cache):
     assert result == complex_data
     assert len(result['issues']) == 2
     assert result['metadata']['total'] == 2
+
+
+def test_expired_entry_with_validators_is_kept(cache):
+    """Test that expired entries with an ETag survive for revalidation."""
+    cache.set(
+        "etag_key", {"data": 1}, etag='"abc123"', last_modified="Tue, 01 Oct 2026 00:00:00 GMT"
+    )
+
+    assert cache.get("etag_key", 0) is None
+    assert cache.get_conditional_headers("etag_key") == {
+        "If-None-Match": '"abc123"',
+        "If-Modified-Since": "Tue, 01 Oct 2026 00:00:00 GMT",
+    }
+
+
+def test_expired_entry_without_validators_is_deleted(cache):
+    """Test that expired entries without validators are still deleted."""
+    cache.set("plain_key", "value")
+
+    assert cache.get("plain_key", 0) is None
+    assert cache.get_conditional_headers("plain_key") == {}
+
+
+def test_revalidate_refreshes_timestamp(cache):
+    """Test that revalidating an expired entry makes it fresh again."""
+    cache.set("etag_key", {"data": 1}, etag='"abc123"')
+    cache_file = next(cache.CACHE_DIR.glob("*.json"))
+    entry = json.loads(cache_file.read_text())
+    entry["timestamp"] = "2020-01-01T00:00:00"
+    cache_file.write_text(json.dumps(entry))
+
+    assert cache.get("etag_key", 60) is None
+    assert cache.revalidate("etag_key") == {"data": 1}
+    assert cache.get("etag_key", 60) == {"data": 1}
+    assert cache.get_conditional_headers("etag_key") == {"If-None-Match": '"abc123"'}
+
+
+def test_revalidate_missing_entry(cache):
+    """Test that revalidating a missing entry returns None."""
+    assert cache.revalidate("missing_key") is None
+
+
+@pytest.fixture
+def sqlite_cache():
+    """Create SQLite cache instance with temp directory."""
+    cache = SQLiteCache(enabled=True)
+    yield cache
+    cache.close()
+
+
+def test_sqlite_cache_set_get_and_expiry(sqlite_cache):
+    """Test that the SQLite backend behaves like the JSON one."""
+    sqlite_cache.set("key", {"nested": [1, 2]}, etag='"v1"')
+    sqlite_cache.set("plain", "value")
+
+    assert sqlite_cache.get("key", 60) == {"nested": [1, 2]}
+    assert sqlite_cache.get("key", 0) is None
+    assert sqlite_cache.get_conditional_headers("key") == {"If-None-Match": '"v1"'}
+    assert sqlite_cache.revalidate("key") == {"nested": [1, 2]}
+
+    assert sqlite_cache.get("plain", 0) is None
+    assert sqlite_cache.get_stale("plain") is None
+    assert sqlite_cache.get_stats()["file_count"] == 1
+    assert sqlite_cache.get_stats()["backend"] == "sqlite"
+    assert list(sqlite_cache.CACHE_DIR.glob("*.json")) == []
+
+
+def test_sqlite_cache_migrates_json_entries(cache):
+    """Test that entries written by the JSON backend are imported on first use."""
+    cache.set("old_key", {"data": 1}, etag='"abc"')
+
+    sqlite_cache = SQLiteCache(enabled=True)
+    try:
+        assert sqlite_cache.get("old_key", 60) == {"data": 1}
+        assert sqlite_cache.get_conditional_headers("old_key") == {"If-None-Match": '"abc"'}
+        assert list(sqlite_cache.CACHE_DIR.glob("*.json")) == []
+    finally:
+        sqlite_cache.close()
+
+
+def test_sqlite_cache_evicts_least_recently_used(sqlite_cache):
+    """Test that eviction drops the least recently used entries in one pass."""
+    sqlite_cache.MAX_CACHE_SIZE_MB = 0.01  # ~10 KB
+
+    for i in range(8):
+        sqlite_cache.set(f"key_{i}", "x" * 1000)
+        time.sleep(0.01)
+    sqlite_cache.get("key_0", 60)
+    for i in range(8, 12):
+        sqlite_cache.set(f"key_{i}", "x" * 1000)
+
+    assert sqlite_cache.get_stats()["size_mb"] <= sqlite_cache.MAX_CACHE_SIZE_MB
+    assert sqlite_cache.get("key_0", 60) is not None
+    assert sqlite_cache.get("key_1", 60) is None
+
+
+def test_sqlite_cache_shared_between_instances(sqlite_cache, monkeypatch):
+    """Test that caches on one directory share a connection, set up and migrated once."""
+    migrations = []
+    monkeypatch.setattr(SQLiteCache, "_migrate_json_entries", lambda self: migrations.append(self))
+    other = SQLiteCache(enabled=True)
+    try:
+        assert other._conn is sqlite_cache._conn
+        assert migrations == []
+
+        sqlite_cache.set("shared", "value")
+        assert other.get("shared", 60) == "value"
+
+        other.clear()
+        assert sqlite_cache.get("shared", 60) is None
+    finally:
+        other.close()
+
+    # Still open for the remaining cache
+    sqlite_cache.set("after", "value")
+    assert sqlite_cache.get("after", 60) == "value"
+
+
+def test_sqlite_cache_memory_hits_do_not_write(sqlite_cache):
+    """Test that entries served from memory are checked without writing to the database."""
+    sqlite_cache.set("key", "value")
+    changes = sqlite_cache._conn.total_changes
+
+    for _ in range(3):
+        assert sqlite_cache.get("key", 60) == "value"
+
+    assert sqlite_cache._conn.total_changes == changes
+    assert get_tier_stats()["memory"]["hits"] == 3
+
+
+def test_sqlite_cache_writes_do_not_sum_the_table(sqlite_cache):
+    """Test that the size check on set() uses a running total instead of a scan."""
+    statements = []
+    sqlite_cache._conn.set_trace_callback(statements.append)
+
+    sqlite_cache.set("a", "x" * 100)
+    sqlite_cache.set("a", "x" * 10)
+    sqlite_cache.set("b", "x" * 50)
+    sqlite_cache._delete(sqlite_cache._get_cache_key("b"))
+
+    assert not any("SUM(" in statement for statement in statements)
+    sqlite_cache._conn.set_trace_callback(None)
+    assert sqlite_cache._db.total_size == sqlite_cache._db.count_size() == len(json.dumps("x" * 10))
+
+
+def test_sqlite_cache_calls_after_close_are_noops(sqlite_cache):
+    """Test that a closed cache stops caching instead of failing."""
+    sqlite_cache.set("key", "value")
+    sqlite_cache.close()
+
+    sqlite_cache.set("key", "other")
+    assert sqlite_cache.get("key", 60) is None
+    assert sqlite_cache.get_stats()["enabled"] is False
+
+
+def test_closing_client_closes_sqlite_cache(monkeypatch):
+    """Test that a client's close() releases its cache connection."""
+    from gfi.github import GitHubClient
+
+    monkeypatch.setenv("GFI_CACHE_BACKEND", "sqlite")
+    client = GitHubClient("fake_token")
+    connection = client.cache._conn
+
+    client.close()
+
+    assert client.cache._conn is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+
+
+def test_create_cache_backend_selection(monkeypatch):
+    """Test that the backend comes from the argument, then GFI_CACHE_BACKEND."""
+    monkeypatch.delenv("GFI_CACHE_BACKEND", raising=False)
+
+    sqlite_cache = create_cache()
+    assert isinstance(sqlite_cache, SQLiteCache)
+    sqlite_cache.close()
+
+    monkeypatch.setenv("GFI_CACHE_BACKEND", "json")
+    assert type(create_cache()) is DiskCache
+
+    assert type(create_cache(backend="json")) is DiskCache
+    with pytest.raises(ValueError):
+        create_cache(backend="redis")
+
+
+def test_memory_tier_serves_repeat_reads(cache):
+    """Test that repeat reads come from memory without reading the file again."""
+    cache.set("repo:test/repo", {"stars": 1})
+
+    with patch.object(DiskCache, "_read_entry") as read_entry:
+        assert cache.get("repo:test/repo", 60) == {"stars": 1}
+        assert DiskCache(enabled=True).get("repo:test/repo", 60) == {"stars": 1}
+        read_entry.assert_not_called()
+
+    stats = get_tier_stats()
+    assert stats["memory"]["hits"] == 2
+    assert stats["disk"] == {"hits": 0, "misses": 0}
+
+
+def test_memory_tier_falls_back_to_disk(cache):
+    """Test that entries rewritten on disk are re-read, and misses reach the disk tier."""
+    cache.set("key", "v1")
+    other_process = DiskCache(enabled=True)
+    cache_file = next(cache.CACHE_DIR.glob("*.json"))
+    entry = json.loads(cache_file.read_text())
+    entry["data"] = "v2 from elsewhere"
+    cache_file.write_text(json.dumps(entry))
+
+    assert other_process.get("key", 60) == "v2 from elsewhere"
+    assert cache.get("missing", 60) is None
+
+    stats = get_tier_stats()
+    assert stats["disk"] == {"hits": 1, "misses": 1}
+    assert stats["memory"]["misses"] == 2
+
+
+def test_memory_tier_expires_with_disk_ttl(cache):
+    """Test that memory entries honor the same TTL as disk entries."""
+    cache.set("key", "value")
+
+    assert cache.get("key", 60) == "value"
+    assert cache.get("key", 0) is None
+    assert cache.get_stale("key") is None
+
+
+def test_memory_tier_is_bounded():
+    """Test that the LRU drops the least recently used entries by count and by bytes."""
+    tier = MemoryTier(max_entries=2, max_bytes=100)
+    tier.put("a", {"data": 1}, "v1", 10)
+    tier.put("b", {"data": 2}, "v1", 10)
+    tier.get("a", "v1")
+    tier.put("c", {"data": 3}, "v1", 10)
+
+    assert tier.get("b", "v1") is None
+    assert tier.get("a", "v1") is not None
+    assert tier.get("a", "v2") is None  # Changed on disk since
+
+    tier.put("big", {"data": 4}, "v1", 95)
+    assert tier.get_stats()["memory"]["entries"] == 1
+    assert tier.get_stats()["memory"]["bytes"] == 95
+
+    tier.put("huge", {"data": 5}, "v1", 1000)
+    assert tier.get("huge", "v1") is None
+
+
+def test_manifest_tracks_size_without_scanning(cache):
+    """Test that writes, size checks and stats don't glob the cache directory."""
+    cache.set("warm_up", "value")  # First use may index an existing directory
+
+    with patch.object(Path, "glob", side_effect=AssertionError("directory scanned")):
+        for i in range(5):
+            cache.set(f"key_{i}", {"data": "x" * 100})
+        cache.get("key_0", 0)  # Expired without validators - deleted
+        stats = cache.get_stats()
+
+    sizes = sum(f.stat().st_size for f in cache.CACHE_DIR.glob("*.json"))
+    assert stats["file_count"] == 5
+    assert cache.manifest.size() == sizes
+
+
+def test_manifest_evicts_least_recently_used(cache):
+    """Test that eviction pops the least recently read entries first."""
+    cache.ACCESS_RESOLUTION_SECONDS = -1  # Every read counts as an access
+    cache.MAX_CACHE_SIZE_MB = 0.01  # ~10 KB
+
+    for i in range(8):
+        cache.set(f"key_{i}", "x" * 1000)
+    cache.get("key_0", 60)
+    for i in range(8, 12):
+        cache.set(f"key_{i}", "x" * 1000)
+
+    assert cache.get_stats()["size_mb"] <= cache.MAX_CACHE_SIZE_MB
+    assert cache.get("key_0", 60) is not None
+    assert cache.get("key_1", 60) is None
+
+
+def test_manifest_sees_other_processes_and_rebuilds(cache):
+    """Test that a second index of the same directory replays the shared log."""
+    cache.set("key1", "value1")
+    other_process = CacheManifest(cache.CACHE_DIR)
+    assert other_process.count() == 1
+
+    cache.set("key2", "value2")
+    assert other_process.count() == 2
+    assert other_process.size() == cache.manifest.size()
+
+    # Without a log (e.g. a cache written by an older version), the directory is indexed once
+    (cache.CACHE_DIR / CacheManifest.LOG_NAME).unlink()
+    assert CacheManifest(cache.CACHE_DIR).count() == 2
+
+
+def test_manifest_log_is_compacted(cache):
+    """Test that rewriting the same keys doesn't grow the log without bound."""
+    cache.manifest.COMPACT_FACTOR = 1
+    for i in range(600):
+        cache.set(f"key_{i % 3}", i)
+
+    log_lines = (cache.CACHE_DIR / CacheManifest.LOG_NAME).read_text().splitlines()
+    assert len(log_lines) <= 256 + 3
+    assert CacheManifest(cache.CACHE_DIR).count() == 3
@@ -0,0 +1,200 @@
+"""Tests for the local GitHub/GitLab API emulator."""
+
+import httpx
+import pytest
+
+from gfi.analyzer import ProfileAnalyzer
+from gfi.emulator import EmulatorConfig, create_app, generate_corpus
+from gfi.emulator.graphql import parse_arguments
+from gfi.emulator.search import compile_query
+from gfi.github import GitHubClient
+from gfi.gitlab import GitLabClient
+from gfi.gitlab_graphql import GitLabGraphQLClient
+from gfi.graphql import GitHubGraphQLClient
+from gfi.ratelimit import get_scheduler
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return generate_corpus(seed=1, repos=40, issues_per_repo=10, users=2, projects=20)
+
+
+def make_http(app, token="test_token"):
+    """An httpx client talking to the emulator in-process."""
+    return httpx.Client(
+        transport=httpx.WSGITransport(app=app),
+        base_url="http://emulator",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def attach(client, app):
+    """Point a gfi client at the emulator."""
+    client.client = httpx.Client(transport=httpx.WSGITransport(app=app))
+    return client
+
+
+def test_search_filters_by_label_and_state(corpus):
+    http = make_http(create_app(corpus))
+
+    data = http.get(
+        "/search/issues", params={"q": 'is:open label:"good first issue"', "per_page": 100}
+    ).json()
+
+    assert data["total_count"] > 0
+    for item in data["items"]:
+        assert item["state"] == "open"
+        assert "good first issue" in [label["name"] for label in item["labels"]]
+
+
+def test_search_paginates_with_link_header(corpus):
+    http = make_http(create_app(corpus))
+
+    first = http.get("/search/issues", params={"q": "is:issue", "per_page": 10})
+    second = http.get(httpx.URL(first.links["next"]["url"]))
+
+    assert first.json()["total_count"] == 40 * 10
+    assert 'rel="last"' in first.headers["Link"]
+    urls = {item["url"] for item in first.json()["items"]}
+    assert urls.isdisjoint(item["url"] for item in second.json()["items"])
+
+
+def test_search_stops_at_1000_results():
+    corpus = generate_corpus(seed=2, repos=60, issues_per_repo=20, users=0, projects=0)
+    http = make_http(create_app(corpus))
+
+    response = http.get("/search/issues", params={"q": "is:issue", "per_page": 100, "page": 11})
+
+    assert response.status_code == 422
+
+
+def test_etag_returns_304_without_charging_rate_limit(corpus):
+    http = make_http(create_app(corpus))
+
+    first = http.get("/repos/org0/" + next(name for owner, name in corpus.repos if owner == "org0"))
+    second = http.get(first.url, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 304
+    assert second.headers["X-RateLimit-Remaining"] == first.headers["X-RateLimit-Remaining"]
+
+
+def test_search_rate_limit_exhaustion(corpus):
+    http = make_http(create_app(corpus, EmulatorConfig(search_limit=2)))
+
+    statuses = [http.get("/search/issues", params={"q": "is:open"}).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 403]
+    assert (
+        http.get("/search/issues", params={"q": "is:open"}).headers["X-RateLimit-Remaining"] == "0"
+    )
+    # Other resources have their own budget
+    assert http.get("/user").status_code == 200
+
+
+def test_throttle_rate_answers_with_retry_after(corpus):
+    http = make_http(create_app(corpus, EmulatorConfig(throttle_rate=1.0, retry_after=7)))
+
+    github = http.get("/user")
+    gitlab = http.get("/api/v4/issues")
+
+    assert github.status_code == 403
+    assert gitlab.status_code == 429
+    assert github.headers["Retry-After"] == gitlab.headers["Retry-After"] == "7"
+
+
+def test_rest_and_graphql_search_agree(corpus):
+    app = create_app(corpus)
+    results = {}
+    for client in (
+        GitHubClient("test_token", use_cache=False),
+        GitHubGraphQLClient("test_token", use_cache=False),
+    ):
+        attach(client, app)
+        issues = client.search_good_first_issues(
+            languages=["Python", "Go"], min_stars=0, max_age_days=400, limit=500
+        )
+        results[type(client).__name__] = sorted(
+            (issue.repo_owner, issue.repo_name, issue.number) for issue in issues
+        )
+
+    assert results["GitHubClient"]
+    assert results["GitHubClient"] == results["GitHubGraphQLClient"]
+
+
+def test_gitlab_rest_and_graphql_agree(corpus):
+    app = create_app(corpus)
+    results = {}
+    for client in (GitLabClient(use_cache=False), GitLabGraphQLClient(use_cache=False)):
+        attach(client, app)
+        issues = client.search_good_first_issues(
+            languages=["Python", "Go"], min_stars=0, max_age_days=400, limit=500
+        )
+        results[type(client).__name__] = sorted(issue.html_url for issue in issues)
+
+    assert results["GitLabClient"]
+    assert results["GitLabClient"] == results["GitLabGraphQLClient"]
+
+
+def test_profile_analysis_matches_between_backends(corpus):
+    app = create_app(corpus)
+    rest = attach(GitHubClient("test_token", use_cache=False), app)
+    graphql = attach(GitHubGraphQLClient("test_token", use_cache=False), app)
+
+    rest_profile = ProfileAnalyzer(rest).build_profile()
+    graphql_profile = ProfileAnalyzer(graphql).build_profile("dev0")
+
+    assert rest_profile.username == "dev0"
+    assert (
+        rest_profile.starred_count
+        == graphql_profile.starred_count
+        == len(corpus.users["dev0"]["starred"])
+    )
+
+
+def test_client_survives_injected_errors(corpus):
+    app = create_app(corpus, EmulatorConfig(error_rate=0.5, seed=3))
+    client = attach(GitHubClient("test_token", use_cache=False), app)
+    get_scheduler("test_token").sleep = lambda seconds: None
+
+    assert client.get_user()["login"] == "dev0"
+    assert app.config["EMULATOR_STATS"]["requests"] >= 1
+
+
+def test_graphql_missing_repository_reports_not_found(corpus):
+    http = make_http(create_app(corpus))
+
+    query = (
+        'query { r0: repository(owner: "nobody", name: "nothing") '
+        "{ issues(first: 5) { nodes { number } } } }"
+    )
+    data = http.post("/graphql", json={"query": query}).json()
+
+    assert data["data"]["r0"] is None
+    assert data["errors"][0]["type"] == "NOT_FOUND"
+
+
+def test_compile_query_qualifiers():
+    repo = {
+        "stargazers_count": 120,
+        "language": "Python",
+        "full_name": "acme/tool",
+        "owner": "acme",
+    }
+    issue = {"state": "open", "labels": ["help wanted"], "title": "Fix parser", "body": ""}
+
+    def matches(query):
+        return compile_query(query)[0](issue, repo)
+
+    assert matches('is:open label:"good first issue","help wanted" language:python stars:>=100')
+    assert not matches('-label:"help wanted"')
+    assert not matches("stars:<100")
+    assert matches("language:go language:python user:acme parser")
+    assert compile_query("is:open sort:created-asc")[1] == "created-asc"
+
+
+def test_parse_arguments_accepts_newline_separators():
+    arguments = parse_arguments(
+        'labelName: $labels\n state: opened\n first: 50, after: "abc"', {"labels": ["x"]}
+    )
+
+    assert arguments == {"labelName": ["x"], "state": "opened", "first": 50, "after": "abc"}
@@ -0,0 +1,112 @@
+"""Tests for federated multi-platform search."""
+
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from gfi.federated import FederatedClient
+from gfi.github import Issue
+from gfi.gitlab import GitLabIssue
+
+
+def make_issue(cls, owner, repo, number):
+    return cls(
+        number=number,
+        title=f"Issue {number}",
+        url=f"https://example.com/{owner}/{repo}/issues/{number}",
+        html_url=f"https://example.com/{owner}/{repo}/issues/{number}",
+        body="",
+        state="open",
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 1),
+        labels=["good first issue"],
+        repo_owner=owner,
+        repo_name=repo,
+        repo_stars=100,
+        repo_language="Python",
+        repo_description=None,
+        comments=0,
+        author="testuser",
+    )
+
+
+def make_platform(issues, delay=0.0, started=None):
+    client = Mock(spec=["search_good_first_issues", "get_repos_closed_issues", "get_repo_issues"])
+
+    def search(**kwargs):
+        if started is not None:
+            started.append(time.monotonic())
+        time.sleep(delay)
+        return issues
+
+    client.search_good_first_issues.side_effect = search
+    return client
+
+
+def test_federated_search_runs_platforms_concurrently():
+    """Test that total time follows the slowest platform, not the sum."""
+    started = []
+    github = make_platform([make_issue(Issue, "a", "one", 1)], delay=0.2, started=started)
+    gitlab = make_platform(
+        [make_issue(GitLabIssue, "group/b", "two", 2)], delay=0.2, started=started
+    )
+
+    begin = time.monotonic()
+    issues = FederatedClient({"github": github, "gitlab": gitlab}).search_good_first_issues(
+        ["Python"]
+    )
+
+    assert time.monotonic() - begin < 0.35
+    assert [issue.number for issue in issues] == [1, 2]
+
+
+def test_federated_search_interleaves_and_drops_mirrors():
+    """Test that platforms alternate and GitLab mirrors of GitHub repos are dropped."""
+    github = make_platform([make_issue(Issue, "Owner", "Tool", 1), make_issue(Issue, "x", "y", 2)])
+    gitlab = make_platform(
+        [
+            make_issue(GitLabIssue, "mirrors/owner", "tool", 10),  # Mirror of Owner/Tool
+            make_issue(GitLabIssue, "group/native", "project", 11),
+        ]
+    )
+
+    issues = FederatedClient({"github": github, "gitlab": gitlab}).search_good_first_issues(
+        ["Python"]
+    )
+
+    assert [issue.number for issue in issues] == [1, 11, 2]
+
+
+def test_federated_search_survives_one_platform_failing():
+    """Test that one platform's outage doesn't lose the other's results."""
+    github = make_platform([make_issue(Issue, "a", "one", 1)])
+    gitlab = Mock(spec=["search_good_first_issues"])
+    gitlab.search_good_first_issues.side_effect = Exception("502 Bad Gateway")
+
+    client = FederatedClient({"github": github, "gitlab": gitlab})
+    issues = client.search_good_first_issues(["Python"])
+    assert [issue.number for issue in issues] == [1]
+    assert client.errors == ["gitlab search failed: 502 Bad Gateway"]
+
+    github.search_good_first_issues.side_effect = Exception("timeout")
+    with pytest.raises(Exception):
+        FederatedClient({"github": github, "gitlab": gitlab}).search_good_first_issues(["Python"])
+
+
+def test_federated_routes_maintainer_lookups():
+    """Test that scorer lookups go to the platform each repo came from."""
+    github = make_platform([make_issue(Issue, "a", "one", 1)])
+    github.get_repos_closed_issues.return_value = {("a", "one"): [{"closed_at": None}]}
+    gitlab = Mock(spec=["search_good_first_issues"])
+    gitlab.search_good_first_issues.return_value = [make_issue(GitLabIssue, "group/b", "two", 2)]
+
+    client = FederatedClient({"github": github, "gitlab": gitlab})
+    client.search_good_first_issues(["Python"])
+
+    closed = client.get_repos_closed_issues([("a", "one"), ("group/b", "two")])
+
+    github.get_repos_closed_issues.assert_called_once_with([("a", "one")], limit=10)
+    assert list(closed) == [("a", "one")]
+    assert client.get_repo_issues("group/b", "two") == []  # No GitLab maintainer data
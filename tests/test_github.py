@@ -0,0 +1,166 @@
+"""Tests for GitHub REST client."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from helpers import make_item
+
+from gfi.github import GitHubClient
+
+
+@pytest.fixture
+def client():
+    """Create client with a mocked HTTP client (conftest gives it a temp cache directory)."""
+    client = GitHubClient("fake_token")
+    client.client = MagicMock()
+    return client
+
+
+def make_response(status_code=200, json_data=None, headers=None):
+    """Build a mock httpx response."""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    return response
+
+
+def test_expired_repo_is_revalidated_with_etag(client):
+    """Test that an expired repo entry is refreshed by a 304 without a new body."""
+    repo = {"stargazers_count": 100, "language": "Python"}
+    client.client.get.side_effect = [
+        make_response(200, repo, {"ETag": '"v1"'}),
+        make_response(304),
+    ]
+
+    assert client.get_repo("test", "repo") == repo
+
+    # Expire the entry
+    client.cache.REPO_TTL_MINUTES = -1
+    assert client.get_repo("test", "repo") == repo
+
+    conditional_call = client.client.get.call_args_list[1]
+    assert conditional_call[1]["headers"] == {"If-None-Match": '"v1"'}
+
+    # 304 refreshed the timestamp
+    assert client.cache.get("repo:test/repo", 60) == repo
+
+
+def test_changed_repo_replaces_cached_copy(client):
+    """Test that a 200 on revalidation stores the new body and ETag."""
+    client.client.get.side_effect = [
+        make_response(200, {"stargazers_count": 1}, {"ETag": '"v1"'}),
+        make_response(200, {"stargazers_count": 2}, {"ETag": '"v2"'}),
+    ]
+
+    client.get_repo("test", "repo")
+    client.cache.REPO_TTL_MINUTES = -1
+
+    assert client.get_repo("test", "repo") == {"stargazers_count": 2}
+    assert client.cache.get_conditional_headers("repo:test/repo") == {"If-None-Match": '"v2"'}
+
+
+def test_search_reads_grouped_query_for_every_pair(client):
+    """Test that a grouped search pages until it could fill every pair, then caps each pair."""
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        if url.endswith("/search/issues"):
+            calls.append(params)
+            start = (params["page"] - 1) * params["per_page"]
+            count = min(params["per_page"], 130 - start)
+            items = [make_item(start + n, f"owner{start + n}/repo") for n in range(count)]
+            return make_response(200, {"total_count": 130, "items": items})
+        return make_response(200, {"stargazers_count": 100, "language": "Python"})
+
+    client.client.get.side_effect = fake_get
+
+    issues = client.search_good_first_issues(
+        languages=["Python"], labels=["good first issue", "help wanted"], limit=60
+    )
+
+    # 60 for each of the 2 pairs is 120 results: two pages of one query
+    assert [(call["page"], call["per_page"]) for call in calls] == [(1, 100), (2, 100)]
+    assert 'label:"good first issue","help wanted"' in calls[0]["q"]
+    # Every result is labelled "good first issue", so only that pair fills up
+    assert len(issues) == 60
+
+
+def paged_search(calls):
+    """Fake GET serving two search pages linked by a Link header, plus repos."""
+    next_url = "https://api.github.com/search/issues?q=x&page=2"
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(url)
+        if url.endswith("/search/issues"):
+            return make_response(
+                200,
+                {"items": [make_item(1), make_item(2)]},
+                {
+                    "Link": f'<{next_url}>; rel="next", <{next_url}>; rel="last"',
+                },
+            )
+        if url == next_url:
+            return make_response(200, {"items": [make_item(3, "other/repo")]})
+        return make_response(200, {"stargazers_count": 100, "language": "Python"})
+
+    return fake_get
+
+
+def test_iter_issues_follows_link_header(client):
+    """Test that the stream follows rel="next" until the last page."""
+    calls = []
+    client.client.get.side_effect = paged_search(calls)
+
+    issues = list(client.iter_good_first_issues(languages=["Python"]))
+
+    assert [issue.number for issue in issues] == [1, 2, 3]
+    assert issues[2].repo_owner == "other"
+    assert len([c for c in calls if "search/issues" in c]) == 2
+
+
+def test_iter_issues_is_lazy(client):
+    """Test that later pages aren't requested until the consumer gets there."""
+    calls = []
+    client.client.get.side_effect = paged_search(calls)
+
+    stream = client.iter_good_first_issues(languages=["Python"])
+    first = next(stream)
+    stream.close()
+
+    assert first.number == 1
+    assert len([c for c in calls if "search/issues" in c]) == 1
+
+
+def test_iter_issues_stops_at_limit(client):
+    """Test that limit caps both the results and the page size."""
+    calls = []
+    fake_get = paged_search(calls)
+    client.client.get.side_effect = fake_get
+
+    issues = list(client.iter_good_first_issues(languages=["Python"], limit=2))
+
+    assert len(issues) == 2
+    assert client.client.get.call_args_list[0][1]["params"]["per_page"] == 2
+    assert len([c for c in calls if "search/issues" in c]) == 1
+
+
+def test_starred_pages_are_fetched_from_last_link(client):
+    """Test that starred pages after the first are read up to the rel="last" page."""
+    last_url = "https://api.github.com/users/dev/starred?per_page=100&page=5"
+    pages = []
+
+    def fake_get(url, params=None, **kwargs):
+        pages.append(params["page"])
+        headers = {"Link": f'<{last_url}>; rel="last"'} if params["page"] == 1 else {}
+        star = {"starred_at": "2026-01-01T00:00:00Z", "repo": {"language": f"page{params['page']}"}}
+        return make_response(200, [star] * 100, headers)
+
+    client.client.get.side_effect = fake_get
+
+    stars = client.get_user_stars("dev")
+
+    # Page count comes from the Link header, capped at MAX_STARRED repos
+    assert sorted(pages) == [1, 2]
+    assert [star["language"] for star in stars[::100]] == ["page1", "page2"]
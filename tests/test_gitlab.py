@@ -2,10 +2,22 @@
 
 import pytest
 from datetime import datetime, timedelta
+from gfi import singleflight
 from gfi.gitlab import GitLabClient, GitLabIssue
 from unittest.mock import Mock, MagicMock
 
 
+def route_gets(issues_response, project_response, lang_response):
+    """Answer mocked GETs by URL (a project and its languages are requested concurrently)."""
+    def get(url, **kwargs):
+        if url.endswith("/languages"):
+            return lang_response
+        if "/projects/" in url:
+            return project_response
+        return issues_response
+    return get
+
+
 def test_gitlab_search_basic():
     """Test basic GitLab search functionality."""
     mock_client = MagicMock()
@@ -43,11 +55,9 @@ def test_gitlab_search_basic():
     mock_lang_response.raise_for_status = Mock()
 
     # Set up side effects
-    mock_client.get.side_effect = [
-        mock_issues_response,  # Issues search
-        mock_project_response,  # Project details
-        mock_lang_response,  # Project languages
-    ]
+    mock_client.get.side_effect = route_gets(
+        mock_issues_response, mock_project_response, mock_lang_response
+    )
 
     client = GitLabClient(use_cache=False)
     client.client = mock_client
@@ -104,11 +114,9 @@ def test_gitlab_filters_by_stars():
     mock_lang_response.json.return_value = {"Python": 100.0}
     mock_lang_response.raise_for_status = Mock()
 
-    mock_client.get.side_effect = [
-        mock_issues_response,
-        mock_project_response,
-        mock_lang_response,
-    ]
+    mock_client.get.side_effect = route_gets(
+        mock_issues_response, mock_project_response, mock_lang_response
+    )
 
     client = GitLabClient(use_cache=False)
     client.client = mock_client
@@ -204,11 +212,9 @@ def test_gitlab_deduplicates_issues():
     mock_lang_response.json.return_value = {"Python": 100.0}
     mock_lang_response.raise_for_status = Mock()
 
-    mock_client.get.side_effect = [
-        mock_issues_response,
-        mock_project_response,
-        mock_lang_response,
-    ]
+    mock_client.get.side_effect = route_gets(
+        mock_issues_response, mock_project_response, mock_lang_response
+    )
 
     client = GitLabClient(use_cache=False)
     client.client = mock_client
@@ -225,3 +231,173 @@ def test_gitlab_deduplicates_issues():
 
     # Should deduplicate
     assert len(issues) == 1
+
+
+def make_gitlab_issue(iid, project_id):
+    """Build a GitLab issue payload created today."""
+    now = datetime.now().isoformat() + "Z"
+    return {
+        "iid": iid,
+        "title": f"Issue {iid}",
+        "web_url": f"https://gitlab.com/group/project-{project_id}/-/issues/{iid}",
+        "description": "Test",
+        "state": "opened",
+        "created_at": now,
+        "updated_at": now,
+        "labels": ["good first issue"],
+        "project_id": project_id,
+        "author": {"username": "testuser"},
+        "user_notes_count": 0,
+    }
+
+
+def gitlab_router(calls, delay=0.0):
+    """Fake GET answering issue, project and language requests by URL."""
+    import time
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        response = Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.raise_for_status = Mock()
+        if url.endswith("/issues"):
+            response.json.return_value = [
+                make_gitlab_issue(1, 10), make_gitlab_issue(2, 20),
+                make_gitlab_issue(3, 10), make_gitlab_issue(4, 30),
+            ]
+        elif url.endswith("/languages"):
+            response.json.return_value = {"Python": 100.0}
+        else:
+            time.sleep(delay)
+            project_id = int(url.rsplit("/", 1)[-1])
+            response.json.return_value = {
+                "id": project_id,
+                "path_with_namespace": f"group/project-{project_id}",
+                "star_count": 100,
+                "description": "Test",
+            }
+        return response
+
+    return fake_get
+
+
+def test_gitlab_enriches_each_project_once():
+    """Test that issues from the same project share one project lookup."""
+    calls = []
+    client = GitLabClient(use_cache=False)
+    client.client = MagicMock()
+    client.client.get.side_effect = gitlab_router(calls)
+
+    issues = client.search_good_first_issues(
+        languages=["Python"], min_stars=10, limit=10, labels=["good first issue"]
+    )
+
+    assert [issue.number for issue in issues] == [1, 2, 3, 4]
+    project_calls = [c for c in calls if "/projects/" in c and not c.endswith("/languages")]
+    assert sorted(project_calls) == [
+        f"{GitLabClient.BASE_URL}/projects/{project_id}" for project_id in (10, 20, 30)
+    ]
+
+
+def test_gitlab_concurrent_lookups_share_request():
+    """Test that concurrent lookups of one project wait on a single request."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+    client = GitLabClient(use_cache=False)
+    client.client = MagicMock()
+    client.client.get.side_effect = gitlab_router(calls, delay=0.05)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        projects = list(pool.map(client._get_project, [10, 10, 10, 10]))
+
+    assert all(project["id"] == 10 for project in projects)
+    assert calls.count(f"{GitLabClient.BASE_URL}/projects/10") == 1
+    assert singleflight._flights.in_flight() == 0
+
+
+def test_gitlab_project_and_languages_fetched_together():
+    """Test that an uncached project's languages are requested alongside it."""
+    import threading
+
+    languages_requested = threading.Event()
+    overlapped = []
+
+    def fake_get(url, **kwargs):
+        response = Mock()
+        response.status_code = 200
+        response.raise_for_status = Mock()
+        response.headers = {}
+        if url.endswith("/languages"):
+            languages_requested.set()
+            response.json.return_value = {"Python": 100.0}
+        else:
+            overlapped.append(languages_requested.wait(timeout=1))
+            response.json.return_value = {
+                "id": 10, "path_with_namespace": "group/project-10", "star_count": 5
+            }
+        return response
+
+    client = GitLabClient(use_cache=False)
+    client.client = MagicMock()
+    client.client.get.side_effect = fake_get
+
+    project = client._get_projects([10])[10]
+
+    assert overlapped == [True]
+    assert project["languages"] == {"Python": 100.0}
+
+
+def test_gitlab_filters_server_side_and_paginates():
+    """Test that filters go to the API and pages are followed until limit."""
+    calls = []
+    next_url = f"{GitLabClient.BASE_URL}/issues?page_token=abc"
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append((url, params))
+        response = Mock()
+        response.status_code = 200
+        response.raise_for_status = Mock()
+        response.headers = {}
+        if url == next_url:
+            response.json.return_value = [make_gitlab_issue(2, 20)]
+            response.headers = {"Link": f'<{next_url}&page=3>; rel="next"'}
+        elif url.endswith("/issues"):
+            issue = {**make_gitlab_issue(1, 10), "assignees": [{}], "_links": {}}
+            response.json.return_value = [issue]
+            response.headers = {"Link": f'<{next_url}>; rel="next"'}
+        elif url.endswith("/languages"):
+            response.json.return_value = {"Python": 100.0}
+        else:
+            project_id = int(url.rsplit("/", 1)[-1])
+            response.json.return_value = {
+                "path_with_namespace": f"group/project-{project_id}",
+                "star_count": 100,
+            }
+        return response
+
+    client = GitLabClient(use_cache=False)
+    client.client = MagicMock()
+    client.client.get.side_effect = fake_get
+    client.cache.set = Mock()
+
+    issues = client.search_good_first_issues(
+        languages=["Python"], min_stars=10, max_age_days=7, limit=2, labels=["good first issue"]
+    )
+
+    assert [issue.number for issue in issues] == [1, 2]
+    issue_calls = [(url, params) for url, params in calls if "/issues" in url]
+    # Page 3 isn't requested - limit was reached on page 2
+    assert [url for url, _ in issue_calls] == [f"{GitLabClient.BASE_URL}/issues", next_url]
+
+    params = issue_calls[0][1]
+    cutoff = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
+    assert params["created_after"] == params["updated_after"] == cutoff
+    ordering = (params["order_by"], params["sort"], params["pagination"])
+    assert ordering == ("created_at", "desc", "keyset")
+
+    # Unused fields are dropped before caching
+    cached_page = client.cache.set.call_args_list[0][0][1]
+    assert "assignees" not in cached_page["items"][0]
+    assert cached_page["next"] == next_url
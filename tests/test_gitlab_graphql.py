@@ -0,0 +1,165 @@
+"""Tests for GitLab GraphQL client."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+from gfi.gitlab_graphql import GitLabGraphQLClient
+
+
+def make_node(iid, project_id):
+    now = datetime.now().isoformat() + "Z"
+    return {
+        "iid": str(iid),
+        "title": f"Issue {iid}",
+        "webUrl": f"https://gitlab.com/group/project-{project_id}/-/issues/{iid}",
+        "description": "Test",
+        "state": "opened",
+        "createdAt": now,
+        "updatedAt": now,
+        "projectId": project_id,
+        "userNotesCount": 2,
+        "labels": {"nodes": [{"title": "good first issue"}]},
+        "author": {"username": "testuser"},
+    }
+
+
+def make_project(project_id, stars=100, language="Python"):
+    return {
+        "id": f"gid://gitlab/Project/{project_id}",
+        "fullPath": f"group/project-{project_id}",
+        "description": "Test project",
+        "starCount": stars,
+        "languages": [{"name": language, "share": 90.0}, {"name": "Shell", "share": 10.0}],
+    }
+
+
+def graphql_router(calls, issue_pages, projects):
+    """Fake POST serving issue pages in order and projects by ID."""
+    pages = iter(issue_pages)
+
+    def fake_post(url, json=None, **kwargs):
+        calls.append(json)
+        response = Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.raise_for_status = Mock()
+        if "issues(" in json["query"]:
+            nodes, cursor = next(pages)
+            response.json.return_value = {
+                "data": {
+                    "issues": {
+                        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+                        "nodes": nodes,
+                    }
+                }
+            }
+        else:
+            wanted = json["variables"]["ids"]
+            response.json.return_value = {
+                "data": {
+                    "projects": {
+                        "nodes": [p for p in projects if p["id"] in wanted],
+                    }
+                }
+            }
+        return response
+
+    return fake_post
+
+
+def make_client(calls, issue_pages, projects):
+    client = GitLabGraphQLClient(use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = graphql_router(calls, issue_pages, projects)
+    return client
+
+
+def test_graphql_search_batches_project_lookups():
+    """Test that a page costs one issues query plus one projects query."""
+    calls = []
+    client = make_client(
+        calls,
+        [([make_node(1, 10), make_node(2, 20), make_node(3, 10)], None)],
+        [make_project(10), make_project(20, stars=5)],
+    )
+
+    issues = client.search_good_first_issues(
+        languages=["Python"], min_stars=10, limit=10, labels=["good first issue"]
+    )
+
+    assert [issue.number for issue in issues] == [1, 3]  # Project 20 is below min_stars
+    assert issues[0].repo_owner == "group"
+    assert issues[0].repo_name == "project-10"
+    assert issues[0].repo_language == "Python"
+    assert issues[0].comments == 2
+    assert len(calls) == 2
+    assert calls[1]["variables"]["ids"] == ["gid://gitlab/Project/10", "gid://gitlab/Project/20"]
+
+
+def test_graphql_search_follows_cursor_until_limit():
+    """Test that later pages are only requested while more issues are needed."""
+    calls = []
+    client = make_client(
+        calls,
+        [
+            ([make_node(1, 10)], "cursor-1"),
+            ([make_node(2, 10)], "cursor-2"),
+            ([make_node(3, 10)], None),
+        ],
+        [make_project(10)],
+    )
+
+    issues = client.search_good_first_issues(
+        languages=["Python"], min_stars=10, limit=2, labels=["good first issue"]
+    )
+
+    issue_calls = [c for c in calls if "issues(" in c["query"]]
+    assert [issue.number for issue in issues] == [1, 2]
+    assert [c["variables"]["after"] for c in issue_calls] == [None, "cursor-1"]
+
+
+def test_graphql_projects_share_rest_cache_entries():
+    """Test that cached projects (from either client) aren't queried again."""
+    calls = []
+    client = make_client(calls, [([make_node(1, 10)], None)], [])
+    client.cache.get = Mock(
+        side_effect=lambda key, ttl: (
+            {
+                "path_with_namespace": "group/project-10",
+                "star_count": 100,
+                "languages": {"Python": 100.0},
+            }
+            if key == "gitlab:project:10"
+            else None
+        )
+    )
+
+    issues = client.search_good_first_issues(
+        languages=["Python"], min_stars=10, limit=10, labels=["good first issue"]
+    )
+
+    assert [issue.number for issue in issues] == [1]
+    assert len(calls) == 1  # Issues query only
+
+
+def test_graphql_failed_project_lookup_is_reported_in_errors(capsys):
+    """Test that a failed project batch is recorded for the caller instead of printed."""
+    client = GitLabGraphQLClient(use_cache=False)
+    client.client = Mock()
+    client.client.post.return_value.json.return_value = {"errors": [{"message": "timeout"}]}
+
+    projects = client._get_projects([10, 20])
+
+    assert projects == {10: None, 20: None}
+    assert len(client.errors) == 1
+    assert "GitLab project lookup failed" in client.errors[0]
+    assert capsys.readouterr().out == ""
+
+
+def test_graphql_client_only_opens_the_graphql_endpoint():
+    """Test that the GraphQL client doesn't build (and leak) a REST client."""
+    client = GitLabGraphQLClient(token="secret")
+
+    assert client.client.headers["Authorization"] == "Bearer secret"
+    assert "PRIVATE-TOKEN" not in client.client.headers
+    client.close()
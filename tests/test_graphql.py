@@ -3,7 +3,8 @@
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
-from gfi.graphql import GitHubGraphQLClient
+import httpx
+from gfi.graphql import GitHubGraphQLClient, GraphQLError
 from gfi.github import Issue, UserProfile
 
 
@@ -12,7 +13,7 @@ def mock_graphql_response():
     """Mock GraphQL API response."""
     return {
         "data": {
-            "search": {
+            "s0": {
                 "nodes": [
                     {
                         "number": 123,
@@ -54,7 +55,7 @@ def mock_graphql_response():
 
 @pytest.fixture
 def mock_profile_response():
-    """Mock user profile GraphQL response."""
+    """Mock user activity GraphQL response."""
     return {
         "data": {
             "user": {
@@ -68,22 +69,29 @@ def mock_profile_response():
                 },
                 "starredRepositories": {
                     "totalCount": 50,
-                    "nodes": [
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "edges": [
                         {
-                            "primaryLanguage": {"name": "Python"},
-                            "repositoryTopics": {
-                                "nodes": [
-                                    {"topic": {"name": "web"}},
-                                    {"topic": {"name": "cli"}}
-                                ]
+                            "starredAt": "2026-01-02T00:00:00Z",
+                            "node": {
+                                "primaryLanguage": {"name": "Python"},
+                                "repositoryTopics": {
+                                    "nodes": [
+                                        {"topic": {"name": "web"}},
+                                        {"topic": {"name": "cli"}}
+                                    ]
+                                }
                             }
                         },
                         {
-                            "primaryLanguage": {"name": "Rust"},
-                            "repositoryTopics": {
-                                "nodes": [
-                                    {"topic": {"name": "cli"}},
-                                ]
+                            "starredAt": "2026-01-01T00:00:00Z",
+                            "node": {
+                                "primaryLanguage": {"name": "Rust"},
+                                "repositoryTopics": {
+                                    "nodes": [
+                                        {"topic": {"name": "cli"}},
+                                    ]
+                                }
                             }
                         }
                     ]
@@ -131,8 +139,8 @@ def test_graphql_search_issues(mock_graphql_response):
         assert "good first issue" in issue.labels
 
 
-def test_graphql_user_profile(mock_profile_response):
-    """Test fetching user profile with GraphQL."""
+def test_graphql_user_activity(mock_profile_response):
+    """Test fetching profile activity with GraphQL."""
 
     with patch('httpx.Client') as mock_client_class:
         mock_client = Mock()
@@ -145,13 +153,16 @@ def test_graphql_user_profile(mock_profile_response):
         client = GitHubGraphQLClient("fake_token", use_cache=False)
         client.client = mock_client
 
-        profile = client.get_user_profile("testuser")
+        activity = client.get_user_activity("testuser", since=datetime(2026, 1, 1, 12))
 
-        assert profile.username == "testuser"
-        assert "Python" in profile.languages
-        assert "cli" in profile.topics
-        assert profile.starred_count == 50
-        assert profile.contributed_count == 25
+        assert activity["username"] == "testuser"
+        assert activity["own_languages"] == ["Python", "JavaScript", "Python"]
+        assert activity["starred_count"] == 50
+        assert activity["contributed_count"] == 25
+        # Only the star added after `since`
+        assert activity["stars"] == [
+            {"starred_at": "2026-01-02T00:00:00Z", "language": "Python", "topics": ["web", "cli"]},
+        ]
 
 
 def test_graphql_repo_issues():
@@ -209,7 +220,7 @@ def test_graphql_repo_issues():
 
 
 def test_graphql_error_handling():
-    """Test GraphQL error handling - errors are caught and logged."""
+    """Test GraphQL error handling - auth errors are raised, not skipped."""
 
     error_response = {
         "errors": [
@@ -228,17 +239,16 @@ def test_graphql_error_handling():
         client = GitHubGraphQLClient("fake_token", use_cache=False)
         client.client = mock_client
 
-        # search_good_first_issues catches GraphQL errors and continues
-        # This is intentional fallback behavior
-        issues = client.search_good_first_issues(
-            languages=["Python"],
-            min_stars=50,
-            max_age_days=30,
-            limit=10
-        )
+        # Retrying with a smaller document would fail the same way
+        with pytest.raises(GraphQLError, match="Bad credentials"):
+            client.search_good_first_issues(
+                languages=["Python"],
+                min_stars=50,
+                max_age_days=30,
+                limit=10
+            )
 
-        # Should return empty list on error
-        assert issues == []
+        assert mock_client.post.call_count == 1
 
 
 def test_graphql_direct_error():
@@ -264,3 +274,390 @@ def test_graphql_direct_error():
         # _execute_query should raise on GraphQL errors
         with pytest.raises(Exception, match="GraphQL error"):
             client._execute_query("query { test }")
+
+
+def make_search_node(number, owner="testowner"):
+    """Build a minimal search result node."""
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "url": f"https://api.github.com/repos/{owner}/testrepo/issues/{number}",
+        "body": "",
+        "state": "OPEN",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "comments": {"totalCount": 0},
+        "labels": {"nodes": []},
+        "author": {"login": "testuser"},
+        "repository": {
+            "owner": {"login": owner},
+            "name": "testrepo",
+            "description": None,
+            "stargazerCount": 100,
+            "primaryLanguage": None,
+        },
+    }
+
+
+def multi_search_responder(calls):
+    """Answer aliased search documents with one node per alias."""
+    def post(url, json):
+        calls.append(json)
+        data = {}
+        for name, value in json["variables"].items():
+            if name.startswith("q"):
+                number = 100 + len(data) + 10 * len(calls)
+                data[f"s{name[1:]}"] = {"nodes": [make_search_node(number)]}
+        response = Mock()
+        response.json.return_value = {"data": data}
+        response.raise_for_status.return_value = None
+        return response
+    return post
+
+
+def test_graphql_search_groups_pairs():
+    """Test that languages and labels are OR-ed into one search, read for every pair."""
+    calls = []
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = multi_search_responder(calls)
+
+    client.search_good_first_issues(
+        languages=["Python", "Go"],
+        labels=["good first issue", "help wanted"],
+        limit=20,
+    )
+
+    assert len(calls) == 1
+    assert list(calls[0]["variables"]) == ["q0", "limit"]
+    query = calls[0]["variables"]["q0"]
+    assert 'label:"good first issue","help wanted" language:Python language:Go' in query
+    assert calls[0]["variables"]["limit"] == 80  # 20 for each of the 4 pairs
+
+
+def test_graphql_search_sends_one_document(monkeypatch):
+    """Test that all planned searches go out in a single POST."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)  # One planned search per pair
+    calls = []
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = multi_search_responder(calls)
+
+    issues = client.search_good_first_issues(
+        languages=["Python", "Go"],
+        labels=["good first issue", "help wanted"],
+    )
+
+    assert len(calls) == 1
+    assert "s3: search(query: $q3" in calls[0]["query"]
+    assert 'label:"help wanted" language:Go' in calls[0]["variables"]["q3"]
+    assert len(issues) == 4
+
+
+def test_graphql_search_queries_only_cache_misses(monkeypatch):
+    """Test that cached permutations are left out of the combined document."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)
+    calls = []
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = multi_search_responder(calls)
+
+    cached_issue = client._issue_from_node(make_search_node(1, owner="cached")).model_dump()
+    client.cache.get = Mock(
+        side_effect=lambda key, ttl: [cached_issue] if "language:Python" in key else None
+    )
+    client.cache.set = Mock()
+
+    issues = client.search_good_first_issues(languages=["Python", "Go"])
+
+    assert len(calls) == 1
+    assert list(calls[0]["variables"]) == ["q0", "limit"]
+    assert "language:Go" in calls[0]["variables"]["q0"]
+    assert [issue.repo_owner for issue in issues] == ["cached", "testowner"]
+    # Fetched permutation is cached under its own per-query key
+    cache_key = client.cache.set.call_args[0][0]
+    assert cache_key.startswith("graphql:search:") and "language:Go" in cache_key
+
+
+def test_graphql_search_splits_rejected_documents(monkeypatch):
+    """Test that a rejected combined document is split and retried."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)
+    calls = []
+    responder = multi_search_responder(calls)
+
+    def post(url, json):
+        if len([k for k in json["variables"] if k.startswith("q")]) > 1:
+            calls.append(json)
+            response = Mock()
+            response.json.return_value = {"errors": [{"message": "MAX_NODE_LIMIT_EXCEEDED"}]}
+            response.raise_for_status.return_value = None
+            return response
+        return responder(url, json)
+
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = post
+
+    issues = client.search_good_first_issues(
+        languages=["Python"],
+        labels=["good first issue", "help wanted", "beginner friendly"],
+    )
+
+    assert len(issues) == 3
+
+
+def test_graphql_search_does_not_split_on_auth_errors(monkeypatch):
+    """Test that a 401 fails the search straight away instead of splitting."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(401, json={"message": "Bad credentials"})
+
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.search_good_first_issues(
+            languages=["Python", "Go"],
+            labels=["good first issue", "help wanted"],
+        )
+
+    assert len(requests) == 1
+
+
+def test_graphql_batches_respect_limits():
+    """Test that searches are chunked by MAX_SEARCHES_PER_QUERY."""
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    searches = [{"query": str(i)} for i in range(25)]
+
+    batches = client._batch_searches(searches, first=100)
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+
+def paginated_responder(calls, total_pages=3, page_size=2):
+    """Answer single-search documents page by page, using page numbers as cursors."""
+    def post(url, json):
+        calls.append(json["variables"])
+        variables = json["variables"]
+        page = int(variables["after"] or 0) if "after" in variables else 0
+        first = variables.get("first") or variables.get("limit")
+        nodes = [make_search_node(page * 100 + n) for n in range(min(first, page_size))]
+        result = {
+            "pageInfo": {"hasNextPage": page + 1 < total_pages, "endCursor": str(page + 1)},
+            "nodes": nodes,
+        }
+        key = "search" if "searchQuery" in variables else "s0"
+        response = Mock()
+        response.json.return_value = {"data": {key: result}}
+        response.raise_for_status.return_value = None
+        return response
+    return post
+
+
+def test_iter_search_pages_follows_cursors():
+    """Test that pages are yielded one by one until hasNextPage is false."""
+    calls = []
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = paginated_responder(calls)
+
+    pages = list(client.iter_search_pages("is:issue", page_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 2]
+    assert [call["after"] for call in calls] == [None, "1", "2"]
+
+
+def test_iter_search_pages_stops_early():
+    """Test that no further requests are made once the consumer stops."""
+    calls = []
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = paginated_responder(calls)
+
+    for page in client.iter_search_pages("is:issue", page_size=2):
+        break
+
+    assert len(calls) == 1
+
+    # max_results also stops the crawl (and trims the last page request)
+    calls.clear()
+    pages = list(client.iter_search_pages("is:issue", page_size=2, max_results=3))
+    assert sum(len(page) for page in pages) == 3
+    assert [call["first"] for call in calls] == [2, 1]
+
+
+def test_iter_search_pages_resumes_from_cache():
+    """Test that each page is cached under its cursor so a crawl can resume."""
+    calls = []
+    client = GitHubGraphQLClient("fake_token")
+    client.client = Mock()
+    client.client.post.side_effect = paginated_responder(calls)
+
+    # Interrupted crawl: only the first two pages
+    pages = client.iter_search_pages("is:issue", page_size=2)
+    next(pages)
+    next(pages)
+    assert len(calls) == 2
+
+    # Resumed crawl replays cached pages and only fetches the rest
+    calls.clear()
+    pages = list(client.iter_search_pages("is:issue", page_size=2))
+    assert len(pages) == 3
+    assert [call["after"] for call in calls] == ["2"]
+
+
+def test_search_limit_above_100_paginates():
+    """Test that search_good_first_issues no longer caps at 100 results."""
+    calls = []
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = paginated_responder(calls, total_pages=5, page_size=100)
+
+    issues = client.search_good_first_issues(languages=["Python"], limit=250)
+
+    assert len(issues) == 250
+    assert len(calls) == 3
+
+
+def test_graphql_records_query_cost(mock_graphql_response):
+    """Test that rateLimit cost and remaining points are recorded per operation."""
+    mock_graphql_response["data"]["rateLimit"] = {
+        "cost": 3, "remaining": 4990, "resetAt": "2026-10-17T12:00:00Z", "limit": 5000,
+    }
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.return_value.json.return_value = mock_graphql_response
+
+    client.search_good_first_issues(languages=["Python"])
+
+    query = client.client.post.call_args[1]["json"]["query"]
+    assert "rateLimit { cost remaining resetAt limit }" in query
+    stats = client.get_stats()
+    assert stats["queries"] == 1
+    assert stats["total_cost"] == 3
+    assert stats["remaining"] == 4990
+    assert stats["operations"]["search"] == {"count": 1, "cost": 3}
+    assert stats["budget_low"] is False
+
+
+def test_low_budget_shrinks_page_size(mock_graphql_response):
+    """Test that first: sizes shrink once remaining points are low."""
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.return_value.json.return_value = mock_graphql_response
+    client.rate_limiter.bucket("graphql").update(100, None, None)
+
+    client.search_good_first_issues(languages=["Python"], limit=300)
+
+    variables = client.client.post.call_args[1]["json"]["variables"]
+    assert variables["limit"] == GitHubGraphQLClient.LOW_BUDGET_PAGE_SIZE
+    assert client.client.post.call_count == 1  # No pagination either
+
+
+def test_low_budget_is_shared_per_token(mock_graphql_response):
+    """Test that a budget reported to one client applies to every client on the token."""
+    mock_graphql_response["data"]["rateLimit"] = {
+        "cost": 1, "remaining": 100, "resetAt": None, "limit": 5000
+    }
+    first = GitHubGraphQLClient("fake_token", use_cache=False)
+    first.client = Mock()
+    first.client.post.return_value.json.return_value = mock_graphql_response
+
+    first.search_good_first_issues(languages=["Python"])
+
+    assert GitHubGraphQLClient("fake_token", use_cache=False).budget_low()
+    assert not GitHubGraphQLClient("other_token", use_cache=False).budget_low()
+
+
+def test_failed_search_is_reported_in_errors():
+    """Test that a search that fails on its own is skipped and recorded."""
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.return_value.json.return_value = {"errors": [{
+        "message": "Something went wrong while executing your query. "
+        "This may be the result of a timeout."
+    }]}
+
+    issues = client.search_good_first_issues(languages=["Python"])
+
+    assert issues == []
+    assert len(client.errors) == 1
+    assert "Python/good first issue" in client.errors[0]
+
+
+def test_low_budget_defers_profile_refresh(mock_profile_response):
+    """Test that a saved profile snapshot is used instead of refreshing on a low budget."""
+    from gfi.analyzer import ProfileAnalyzer
+
+    client = GitHubGraphQLClient("fake_token")
+    client.client = Mock()
+    client.client.post.return_value.json.return_value = mock_profile_response
+    analyzer = ProfileAnalyzer(client)
+    analyzer.build_profile("testuser")
+    assert client.client.post.call_count == 1
+
+    # Snapshot is no longer fresh and the budget is low
+    analyzer.client.cache.PROFILE_TTL_MINUTES = 0
+    client.rate_limiter.bucket("graphql").update(10, None, None)
+
+    profile = analyzer.build_profile("testuser")
+
+    assert profile.username == "testuser"
+    assert profile.starred_count == 50
+    assert client.client.post.call_count == 1
+    assert client.get_stats()["deferred"] == 1
+
+
+def test_graphql_bulk_closed_issues():
+    """Test that closed issues for many repos come back from one aliased query."""
+    def post(url, json):
+        variables = json["variables"]
+        data = {}
+        for name in variables:
+            if name.startswith("o"):
+                index = name[1:]
+                if variables[f"n{index}"] == "missing":
+                    data[f"r{index}"] = None
+                    continue
+                data[f"r{index}"] = {"issues": {"nodes": [{
+                    "number": 1,
+                    "title": "Closed",
+                    "state": "CLOSED",
+                    "createdAt": "2024-01-01T00:00:00Z",
+                    "closedAt": "2024-01-02T00:00:00Z",
+                    "comments": {"totalCount": 0},
+                }]}}
+        response = Mock()
+        response.json.return_value = {
+            "data": data,
+            "errors": [{"message": "Could not resolve to a Repository"}],
+        }
+        response.raise_for_status.return_value = None
+        return response
+
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.side_effect = post
+
+    repos = [("a", "one"), ("b", "two"), ("a", "one"), ("c", "missing")]
+    results = client.get_repos_closed_issues(repos)
+
+    assert client.client.post.call_count == 1
+    assert set(results) == {("a", "one"), ("b", "two")}
+    assert results[("a", "one")][0]["closed_at"] == "2024-01-02T00:00:00Z"
+    query = client.client.post.call_args[1]["json"]["query"]
+    assert "r2: repository(owner: $o2, name: $n2)" in query
+
+
+def test_graphql_bulk_closed_issues_chunks():
+    """Test that repos are split into BULK_REPOS_PER_QUERY sized queries."""
+    client = GitHubGraphQLClient("fake_token", use_cache=False)
+    client.client = Mock()
+    client.client.post.return_value.json.return_value = {"data": {}}
+
+    client.get_repos_closed_issues([("owner", f"repo{i}") for i in range(120)])
+
+    assert client.client.post.call_count == 3
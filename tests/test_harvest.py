@@ -0,0 +1,123 @@
+"""Tests for issue harvester."""
+
+import re
+from datetime import date, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from gfi.github import Issue
+from gfi.harvest import Harvester, HarvestStore
+
+ISSUES_PER_DAY = 300
+
+
+def make_issue(number, day):
+    return Issue(
+        number=number,
+        title=f"Issue {number}",
+        url=f"https://api.github.com/repos/test/repo/issues/{number}",
+        html_url=f"https://github.com/test/repo/issues/{number}",
+        body="",
+        state="open",
+        created_at=datetime(2026, 1, day),
+        updated_at=datetime(2026, 1, day),
+        labels=["good first issue"],
+        repo_owner="test",
+        repo_name="repo",
+        repo_stars=100,
+        repo_language="Python",
+        repo_description=None,
+        comments=0,
+        author="testuser",
+    )
+
+
+def days_in(query):
+    """Days (of January 2026) covered by a query's created: range."""
+    start, end = re.search(r"created:(\S+)\.\.(\S+)", query).groups()
+    return range(date.fromisoformat(start).day, date.fromisoformat(end).day + 1)
+
+
+def make_client():
+    """Fake GraphQL client serving ISSUES_PER_DAY issues per day, 100 per page."""
+    client = Mock()
+    client.count_search_results.side_effect = lambda q: len(days_in(q)) * ISSUES_PER_DAY
+
+    def fetch_search_page(query, first, after):
+        issues = [
+            make_issue(day * 1000 + n, day) for day in days_in(query) for n in range(ISSUES_PER_DAY)
+        ]
+        start = int(after or 0)
+        page = issues[start : start + first]
+        end = start + len(page)
+        return {"issues": page, "end_cursor": str(end), "has_next_page": end < len(issues)}
+
+    client.fetch_search_page.side_effect = fetch_search_page
+    return client
+
+
+def test_harvest_splits_and_stores_everything(tmp_path):
+    """Test that slices stay under the cap and every issue is stored once."""
+    store = HarvestStore(tmp_path / "harvest.db")
+    harvester = Harvester(make_client(), store, workers=3)
+
+    slices = harvester.plan(
+        ["Python"], ["good first issue"], 10, date(2026, 1, 1), date(2026, 1, 8)
+    )
+    pending = store.pending_slices()
+    stats = harvester.run()
+
+    assert slices == len(pending) > 1
+    assert all(len(days_in(query)) * ISSUES_PER_DAY <= 1000 for query, _ in pending)
+    assert stats["slices_done"] == stats["slices"] == slices
+    assert stats["issues"] == stats["expected_issues"] == 8 * ISSUES_PER_DAY
+    assert len({issue.number for issue in store.iter_issues(batch_size=100)}) == 8 * ISSUES_PER_DAY
+
+
+def test_harvest_resumes_from_checkpoint(tmp_path):
+    """Test that an interrupted harvest continues from the saved cursor."""
+    path = tmp_path / "harvest.db"
+    client = make_client()
+    pages = []
+
+    def interrupt_after_three(query, count):
+        pages.append(query)
+        if len(pages) == 3:
+            raise KeyboardInterrupt
+
+    store = HarvestStore(path)
+    harvester = Harvester(client, store, workers=1)
+    harvester.plan(["Python"], ["good first issue"], 10, date(2026, 1, 1), date(2026, 1, 8))
+    with pytest.raises(KeyboardInterrupt):
+        harvester.run(on_page=interrupt_after_three)
+    store.close()
+
+    fetched_before = client.fetch_search_page.call_count
+    store = HarvestStore(path)
+    harvester = Harvester(client, store, workers=1)
+    harvester.plan(["Python"], ["good first issue"], 10, date(2026, 1, 2), date(2026, 1, 9))
+    stats = harvester.run()
+
+    # 24 pages in total - pages stored before the interrupt aren't fetched again
+    assert 3 <= fetched_before < 24
+    assert client.fetch_search_page.call_count == 24
+    assert stats["issues"] == 8 * ISSUES_PER_DAY
+
+
+def test_harvest_rejects_different_search(tmp_path):
+    """Test that a store can't be resumed with different search parameters."""
+    store = HarvestStore(tmp_path / "harvest.db")
+    harvester = Harvester(make_client(), store)
+    harvester.plan(["Python"], ["good first issue"], 10, date(2026, 1, 1), date(2026, 1, 2))
+
+    with pytest.raises(Exception, match="different parameters"):
+        harvester.plan(["Go"], ["good first issue"], 10, date(2026, 1, 1), date(2026, 1, 2))
+
+    # --restart replans
+    assert (
+        harvester.plan(
+            ["Go"], ["good first issue"], 10, date(2026, 1, 1), date(2026, 1, 2), restart=True
+        )
+        == 1
+    )
@@ -3,6 +3,7 @@
 import pytest
 from datetime import datetime, timedelta
 from gfi.github import GitHubClient, Issue
+from helpers import make_item
 from unittest.mock import Mock, MagicMock
 
 
@@ -56,17 +57,15 @@ def test_search_with_custom_labels(monkeypatch):
         labels=["help wanted", "beginner friendly"]
     )
 
-    # Should make multiple queries (one per label)
-    assert mock_client.get.call_count == 2  # 1 language × 2 labels
-
-    # Check both labels were queried
-    calls = [str(call[1]["params"]["q"]) for call in mock_client.get.call_args_list]
-    assert any('label:"help wanted"' in call for call in calls)
-    assert any('label:"beginner friendly"' in call for call in calls)
+    # Both labels are OR-ed into one query
+    assert mock_client.get.call_count == 1
+    query = mock_client.get.call_args[1]["params"]["q"]
+    assert 'label:"help wanted","beginner friendly"' in query
 
 
-def test_search_deduplicates_across_labels():
+def test_search_deduplicates_across_labels(monkeypatch):
     """Test that duplicate issues across label searches are removed."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 0)  # One query per label
     # Create mock data - same issue appears under both labels
     duplicate_issue = {
         "number": 42,
@@ -107,9 +106,8 @@ def test_search_deduplicates_across_labels():
     # Return different responses based on call
     mock_client.get.side_effect = [
         mock_response1,  # First label search
-        mock_repo_response,  # Repo details
         mock_response2,  # Second label search
-        # No second repo call because it's cached/duplicate
+        mock_repo_response,  # Repo details (enriched once after all searches)
     ]
 
     client = GitHubClient("fake_token", use_cache=False)
@@ -129,6 +127,8 @@ def test_search_deduplicates_across_labels():
     # Should only return one issue (deduplicated)
     assert len(issues) == 1
     assert issues[0].number == 42
+    assert issues[0].repo_stars == 100
+    assert mock_client.get.call_count == 3
 
 
 def test_search_with_multiple_languages_and_labels():
@@ -153,8 +153,13 @@ def test_search_with_multiple_languages_and_labels():
         labels=["good first issue", "help wanted"]
     )
 
-    # Should make 4 queries (2 languages × 2 labels)
-    assert mock_client.get.call_count == 4
+    # Should make 1 query (languages and labels OR-ed), read far enough for
+    # 10 issues from each of the 4 pairs
+    assert mock_client.get.call_count == 1
+    params = mock_client.get.call_args[1]["params"]
+    assert 'label:"good first issue","help wanted"' in params["q"]
+    assert "language:Python language:JavaScript" in params["q"]
+    assert params["per_page"] == 40
 
 
 def test_labels_parameter_optional():
@@ -179,3 +184,43 @@ def test_labels_parameter_optional():
     assert mock_client.get.called
     query = mock_client.get.call_args[1]["params"]["q"]
     assert 'label:"good first issue"' in query
+
+
+def test_search_enriches_each_repo_once():
+    """Test that repo details are fetched once per distinct uncached repo."""
+    def fake_get(url, params=None, **kwargs):
+        response = Mock()
+        response.raise_for_status = Mock()
+        if url.endswith("/search/issues"):
+            response.json.return_value = {"items": [
+                make_item(1, "a/one"),
+                make_item(2, "a/one"),
+                make_item(3, "b/two"),
+                make_item(4, "c/cached"),
+            ]}
+        else:
+            response.json.return_value = {"stargazers_count": 10, "language": "Python"}
+        return response
+
+    mock_client = MagicMock()
+    mock_client.get.side_effect = fake_get
+
+    client = GitHubClient("fake_token", use_cache=False)
+    client.client = mock_client
+    cached_repo = {"stargazers_count": 999, "language": "Go"}
+    client.cache.get = Mock(
+        side_effect=lambda key, ttl: cached_repo if key == "repo:c/cached" else None
+    )
+    client.cache.set = Mock()
+
+    issues = client.search_good_first_issues(languages=["Python"], labels=["good first issue"])
+
+    repo_urls = sorted(
+        call[0][0] for call in mock_client.get.call_args_list if "/repos/" in call[0][0]
+    )
+    assert repo_urls == [
+        "https://api.github.com/repos/a/one",
+        "https://api.github.com/repos/b/two",
+    ]
+    assert [issue.number for issue in issues] == [1, 2, 3, 4]
+    assert issues[3].repo_stars == 999
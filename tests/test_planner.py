@@ -0,0 +1,112 @@
+"""Tests for search query planner."""
+
+from datetime import date
+
+from gfi.planner import SearchQuery, cap_per_pair, plan_queries, split_to_cap
+
+
+def test_plan_collapses_into_one_query():
+    """Test that languages and labels are OR-ed into a single query."""
+    queries = plan_queries(
+        ["Python", "Go"], ["good first issue", "help wanted"], 10, date(2026, 1, 1)
+    )
+
+    assert len(queries) == 1
+    assert queries[0].to_string() == (
+        'is:issue is:open label:"good first issue","help wanted" '
+        "language:Python language:Go stars:>=10 created:>=2026-01-01"
+    )
+
+
+def test_plan_splits_long_queries(monkeypatch):
+    """Test that queries over the length limit are split until they fit."""
+    monkeypatch.setattr("gfi.planner.MAX_QUERY_LENGTH", 120)
+    languages = ["Python", "JavaScript", "TypeScript", "Go"]
+    queries = plan_queries(languages, ["good first issue", "help wanted"], 10, date(2026, 1, 1))
+
+    assert len(queries) > 1
+    assert all(len(q.to_string(sort_qualifier=True)) <= 120 for q in queries)
+    # Every language/label pair is still covered
+    pairs = {(lang, label) for q in queries for lang in q.languages for label in q.labels}
+    assert len(pairs) == 8
+
+
+def test_cap_per_pair():
+    """Test that grouped results are trimmed to `limit` per language/label pair."""
+    from types import SimpleNamespace
+
+    def issue(number, language, *labels):
+        return SimpleNamespace(number=number, repo_language=language, labels=list(labels))
+
+    issues = [
+        issue(1, "Python", "good first issue"),
+        issue(2, "Python", "good first issue", "help wanted"),
+        issue(3, "Python", "good first issue"),
+        issue(4, "Go", "help wanted"),
+        issue(5, "Python", "Help Wanted"),
+        issue(6, "C++", "good first issue"),
+    ]
+
+    capped = cap_per_pair(issues, ["Python", "Go"], ["good first issue", "help wanted"], limit=2)
+
+    # Issue 3 is over Python/good first issue's limit; C++ matches no pair
+    assert [i.number for i in capped] == [1, 2, 5, 4, 6]
+
+
+def test_plan_empty_inputs():
+    """Test that nothing is planned without languages or labels."""
+    assert plan_queries([], ["good first issue"], 0, date(2026, 1, 1)) == []
+    assert plan_queries(["Python"], [], 0, date(2026, 1, 1)) == []
+
+
+def test_split_covers_date_range():
+    """Test that split() halves the created: range without gaps."""
+    query = SearchQuery(
+        languages=["Python"],
+        labels=["good first issue"],
+        min_stars=0,
+        created_from=date(2026, 1, 1),
+        created_to=date(2026, 1, 10),
+    )
+
+    older, newer = query.split()
+
+    assert older.created_from == date(2026, 1, 1)
+    assert (newer.created_from - older.created_to).days == 1
+    assert newer.created_to == date(2026, 1, 10)
+    assert "created:2026-01-01..2026-01-05" in older.to_string()
+
+
+def test_split_to_cap():
+    """Test that slices are split until each is under the result cap."""
+    query = SearchQuery(
+        languages=["Python"],
+        labels=["good first issue"],
+        min_stars=0,
+        created_from=date(2026, 1, 1),
+        created_to=date(2026, 1, 8),
+    )
+
+    # 300 results per day
+    def count(q):
+        return ((q.created_to - q.created_from).days + 1) * 300
+
+    slices = split_to_cap(query, count, max_results=1000)
+
+    assert all(total <= 1000 for _, total in slices)
+    assert slices[0][0].created_from == date(2026, 1, 1)
+    assert slices[-1][0].created_to == date(2026, 1, 8)
+    assert sum(total for _, total in slices) == 8 * 300
+
+
+def test_split_to_cap_stops_at_one_day():
+    """Test that single-day slices are returned even if over the cap."""
+    query = SearchQuery(
+        languages=["Python"],
+        labels=["good first issue"],
+        min_stars=0,
+        created_from=date(2026, 1, 1),
+        created_to=date(2026, 1, 1),
+    )
+
+    assert split_to_cap(query, lambda q: 5000) == [(query, 5000)]
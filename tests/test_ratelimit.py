@@ -0,0 +1,212 @@
+"""Tests for rate limit scheduler."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from gfi.ratelimit import RateLimitExceeded, RateLimitScheduler, TokenBucket, get_scheduler
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances time."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(clock, **budgets):
+    return RateLimitScheduler(budgets=budgets, clock=clock, sleep=clock.sleep)
+
+
+def test_bucket_queues_into_next_window():
+    """Test that an exhausted bucket waits for the next window instead of failing."""
+    clock = FakeClock()
+    bucket = TokenBucket(limit=2, window=60, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(60)
+    assert bucket.reserve() == pytest.approx(60)
+    assert bucket.reserve() == pytest.approx(120)
+
+
+def test_buckets_are_separate_per_resource():
+    """Test that search exhaustion doesn't hold back core requests."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, search=(1, 60))
+
+    scheduler.acquire("search")
+    scheduler.acquire("core")
+    assert clock.sleeps == []
+
+    scheduler.acquire("search")
+    assert clock.sleeps == [pytest.approx(60)]
+
+
+def test_headers_update_budget():
+    """Test that X-RateLimit headers override the local estimate."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    response = httpx.Response(
+        200,
+        headers={
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(clock.now) + 20),
+            "X-RateLimit-Resource": "search",
+        },
+    )
+
+    scheduler.update("core", response)  # Resource header wins
+    scheduler.acquire("search")
+
+    assert clock.sleeps == [pytest.approx(20)]
+
+
+def test_send_retries_after_retry_after():
+    """Test that a 429 is retried after Retry-After seconds."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+
+    response = scheduler.send("core", lambda: next(responses))
+
+    assert response.status_code == 200
+    assert clock.sleeps == [pytest.approx(5)]
+
+
+def test_secondary_limit_403_backs_off():
+    """Test that secondary-limit 403s back off exponentially."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    responses = iter(
+        [
+            httpx.Response(403, text="You have exceeded a secondary rate limit"),
+            httpx.Response(403, text="You have exceeded a secondary rate limit"),
+            httpx.Response(200),
+        ]
+    )
+
+    response = scheduler.send("search", lambda: next(responses))
+
+    assert response.status_code == 200
+    assert clock.sleeps == [pytest.approx(60), pytest.approx(120)]
+
+
+def test_permission_403_is_not_retried():
+    """Test that ordinary 403s are returned immediately."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    calls = []
+
+    def request():
+        calls.append(1)
+        return httpx.Response(403, text="Resource not accessible by integration")
+
+    assert scheduler.send("core", request).status_code == 403
+    assert len(calls) == 1
+
+
+def test_long_wait_raises():
+    """Test that waits beyond MAX_WAIT_SECONDS raise instead of hanging."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.update(
+        "core",
+        httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(clock.now) + 3000),
+            },
+        ),
+    )
+
+    with pytest.raises(RateLimitExceeded):
+        scheduler.acquire("core")
+
+
+def test_short_max_wait_raises_without_taking_a_slot():
+    """Test that a caller's own max_wait refuses long waits without sleeping or borrowing."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, search=(1, 60))
+    scheduler.acquire("search")
+
+    with pytest.raises(RateLimitExceeded):
+        scheduler.send("search", lambda: httpx.Response(200), max_wait=5)
+
+    assert clock.sleeps == []
+    # The refused request didn't queue into the next window
+    assert scheduler.bucket("search").reserve() == pytest.approx(60)
+
+
+def test_short_max_wait_skips_long_retry_delays():
+    """Test that a transient failure isn't retried after a delay longer than max_wait."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    response = httpx.Response(503, headers={"Retry-After": "20"})
+
+    assert scheduler.send("core", lambda: response, max_wait=5).status_code == 503
+    assert clock.sleeps == []
+
+
+def test_gitlab_headers():
+    """Test that GitLab's RateLimit-* headers are read."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.update(
+        "gitlab",
+        httpx.Response(
+            200,
+            headers={
+                "RateLimit-Limit": "2000",
+                "RateLimit-Remaining": "0",
+                "RateLimit-Reset": str(int(clock.now) + 10),
+            },
+        ),
+    )
+
+    scheduler.acquire("gitlab")
+
+    assert clock.sleeps == [pytest.approx(10)]
+
+
+def test_send_async():
+    """Test that the async path retries throttled responses."""
+    scheduler = RateLimitScheduler()
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200),
+        ]
+    )
+    scheduler.MAX_WAIT_SECONDS = 5
+
+    async def request():
+        return next(responses)
+
+    async def run():
+        return await scheduler.send_async("core", request)
+
+    scheduler.bucket("core").block = lambda seconds: None  # Don't actually wait
+    assert asyncio.run(run()).status_code == 200
+
+
+def test_scheduler_shared_per_token():
+    """Test that clients with the same token share budgets."""
+    assert get_scheduler("token-a") is get_scheduler("token-a")
+    assert get_scheduler("token-a") is not get_scheduler("token-b")
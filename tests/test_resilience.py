@@ -0,0 +1,241 @@
+"""Tests for retry policy and circuit breakers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from gfi.github import GitHubClient
+from gfi.ratelimit import RateLimitScheduler, get_scheduler
+from gfi.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_breaker,
+    get_resilience_stats,
+)
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances time."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(clock, **policy):
+    return RateLimitScheduler(clock=clock, sleep=clock.sleep, retry_policy=RetryPolicy(**policy))
+
+
+def responses(*items):
+    """Request callable returning (or raising) each item in turn."""
+    sent = []
+    queue = list(items)
+
+    def request():
+        sent.append(1)
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return request, sent
+
+
+def test_backoff_is_jittered_and_capped():
+    """Test decorrelated jitter bounds: between base and 3x the previous delay."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=10.0, uniform=lambda low, high: high)
+
+    assert policy.backoff(None) == 3.0
+    assert policy.backoff(3.0) == 9.0
+    assert policy.backoff(9.0) == 10.0  # Capped
+
+    policy = RetryPolicy(base_delay=1.0, uniform=lambda low, high: low)
+    assert policy.backoff(9.0) == 1.0
+
+
+def test_backoff_honors_retry_after():
+    """Test that a server-requested delay replaces the jittered one."""
+    policy = RetryPolicy(max_delay=30.0)
+
+    assert policy.backoff(None, retry_after=7) == 7
+    assert policy.backoff(None, retry_after=600) == 30.0
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """Test that the circuit opens at the threshold and short-circuits requests."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("api.github.com", clock=clock)
+
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.check()  # Still closed
+
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert breaker.stats["short_circuits"] == 1
+    assert breaker.stats["opened"] == 1
+
+
+def test_breaker_success_resets_failure_count():
+    """Test that only consecutive failures count towards opening."""
+    breaker = CircuitBreaker("api.github.com")
+
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    breaker.check()
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_trial():
+    """Test that one request is let through after the reset period."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("api.github.com", clock=clock)
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        breaker.record_failure()
+
+    clock.now += CircuitBreaker.RESET_SECONDS
+    breaker.check()
+    assert breaker.state == "half-open"
+
+    # A failed trial reopens the circuit straight away
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    clock.now += CircuitBreaker.RESET_SECONDS
+    breaker.check()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_send_retries_transient_status():
+    """Test that a 502 is retried with backoff and the success returned."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, uniform=lambda low, high: high)
+    request, sent = responses(httpx.Response(502), httpx.Response(503), httpx.Response(200))
+
+    response = scheduler.send("core", request, host="api.github.com")
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert clock.sleeps == [pytest.approx(1.5), pytest.approx(4.5)]
+    stats = get_resilience_stats()
+    assert stats == [
+        {
+            "host": "api.github.com",
+            "state": "closed",
+            "failures": 2,
+            "retries": 2,
+            "short_circuits": 0,
+            "opened": 0,
+        }
+    ]
+
+
+def test_send_transient_status_uses_retry_after():
+    """Test that Retry-After on a 503 sets the retry delay."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    request, _ = responses(httpx.Response(503, headers={"Retry-After": "4"}), httpx.Response(200))
+
+    scheduler.send("core", request, host="api.github.com")
+
+    assert clock.sleeps == [4.0]
+
+
+def test_send_returns_last_response_when_retries_run_out():
+    """Test that a persistent 5xx is handed back for raise_for_status()."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, max_retries=2)
+    request, sent = responses(*[httpx.Response(500) for _ in range(3)])
+
+    response = scheduler.send("core", request, host="api.github.com")
+
+    assert response.status_code == 500
+    assert len(sent) == 3
+
+
+def test_send_retries_then_reraises_transport_errors():
+    """Test that timeouts are retried and re-raised once retries run out."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, max_retries=1)
+    request, sent = responses(httpx.ReadTimeout("slow"), httpx.ConnectError("down"))
+
+    with pytest.raises(httpx.ConnectError):
+        scheduler.send("core", request, host="api.github.com")
+    assert len(sent) == 2
+
+
+def test_send_does_not_retry_client_errors():
+    """Test that a 404 is returned as-is and doesn't count as a host failure."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    request, sent = responses(httpx.Response(404))
+
+    assert scheduler.send("core", request, host="api.github.com").status_code == 404
+    assert len(sent) == 1
+    assert get_breaker("api.github.com").stats["failures"] == 0
+
+
+def test_open_circuit_fails_fast_without_sending():
+    """Test that requests to a failing host raise without touching the network."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, max_retries=0)
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        scheduler.send("core", responses(httpx.Response(502))[0], host="api.github.com")
+
+    request, sent = responses(httpx.Response(200))
+    with pytest.raises(CircuitOpenError):
+        scheduler.send("core", request, host="api.github.com")
+    assert sent == []
+
+    # Other hosts are unaffected
+    assert scheduler.send("gitlab", request, host="gitlab.com").status_code == 200
+
+
+def test_send_async_retries_transient_status(monkeypatch):
+    """Test that the async path retries with jittered backoff too."""
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr("gfi.ratelimit.asyncio.sleep", fake_sleep)
+    scheduler = RateLimitScheduler(retry_policy=RetryPolicy(uniform=lambda low, high: low))
+    queue = [httpx.Response(502), httpx.Response(200)]
+
+    async def request():
+        return queue.pop(0)
+
+    response = asyncio.run(scheduler.send_async("core", request, host="api.github.com"))
+
+    assert response.status_code == 200
+    assert delays == [0.5]
+
+
+def test_client_survives_transient_502():
+    """Test that one upstream 502 no longer aborts a client call."""
+    get_scheduler("test_token").sleep = lambda seconds: None
+    statuses = [502, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"login": "octocat"})
+
+    client = GitHubClient("test_token", use_cache=False)
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert client.get_user() == {"login": "octocat"}
+    assert get_breaker("api.github.com").stats["retries"] == 1
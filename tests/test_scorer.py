@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import Mock
 from gfi.scorer import IssueScorer
 from gfi.github import Issue
 
@@ -96,3 +97,58 @@ def test_project_activity_popular_repo():
     activity = scorer._score_project_activity(issue)
 
     assert activity >= 0.8  # Should score high
+
+
+def make_issue(number, repo_owner="test", repo_name="test"):
+    """Build an issue for scoring."""
+    return Issue(
+        number=number,
+        title="Test",
+        url=f"https://api.github.com/repos/{repo_owner}/{repo_name}/issues/{number}",
+        html_url=f"https://github.com/{repo_owner}/{repo_name}/issues/{number}",
+        body="Test body",
+        state="open",
+        created_at=datetime.now() - timedelta(days=7),
+        updated_at=datetime.now() - timedelta(days=1),
+        labels=["good first issue"],
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        repo_stars=500,
+        repo_language="Python",
+        repo_description="Test repo",
+        comments=2,
+        author="testuser",
+    )
+
+
+def test_prefetch_batches_maintainer_lookups():
+    """Test that prefetch makes one bulk call and scoring reuses it."""
+    closed = [{"created_at": "2024-01-01T00:00:00Z", "closed_at": "2024-01-03T00:00:00Z"}]
+    client = Mock()
+    client.get_repos_closed_issues.return_value = {("a", "one"): closed, ("b", "two"): closed}
+
+    scorer = IssueScorer(client)
+    issues = [make_issue(1, "a", "one"), make_issue(2, "a", "one"), make_issue(3, "b", "two")]
+    scorer.prefetch(issues)
+
+    scores = [scorer._score_maintainer_responsiveness(issue) for issue in issues]
+
+    assert scores == [1.0, 1.0, 1.0]
+    client.get_repos_closed_issues.assert_called_once_with([("a", "one"), ("b", "two")], limit=10)
+    client.get_repo_issues.assert_not_called()
+
+
+def test_maintainer_lookup_falls_back_per_repo():
+    """Test that repos missing from the prefetch are fetched once each."""
+    client = Mock()
+    client.get_repos_closed_issues.return_value = {}
+    client.get_repo_issues.return_value = []
+
+    scorer = IssueScorer(client)
+    issues = [make_issue(1), make_issue(2)]
+    scorer.prefetch(issues)
+
+    for issue in issues:
+        assert scorer._score_maintainer_responsiveness(issue) == 0.5
+
+    client.get_repo_issues.assert_called_once()
@@ -0,0 +1,145 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from gfi import singleflight
+from gfi.async_github import AsyncGitHubClient
+from gfi.github import GitHubClient
+from gfi.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    """Test that threads asking for the same key while it's in flight wait for it."""
+    group = SingleFlight()
+    runs = []
+    release = threading.Event()
+
+    def work():
+        runs.append(1)
+        release.wait(1)
+        return {"id": 1}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(group.do, "repo:a/b", work) for _ in range(4)]
+        while group.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert runs == [1]
+    assert all(result is results[0] for result in results)
+    assert group.in_flight() == 0
+
+
+def test_exception_is_shared_and_key_released():
+    """Test that waiters see the leader's error and the next call runs again."""
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(group.do, "key", failing)
+        started.wait(1)
+        waiter = pool.submit(group.do, "key", failing)
+        while group.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert group.do("key", lambda: "fresh") == "fresh"
+
+
+def test_async_calls_share_one_run():
+    """Test that tasks asking for the same key await one coroutine."""
+    group = AsyncSingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "data"
+
+    async def main():
+        return await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["data"] * 5
+    assert runs == [1]
+    assert group.in_flight() == 0
+
+
+def test_async_cancelled_caller_doesnt_cancel_others():
+    """Test that cancelling the first caller leaves the shared work running."""
+    group = AsyncSingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return "data"
+
+    async def main():
+        first = asyncio.ensure_future(group.do("key", work))
+        second = asyncio.ensure_future(group.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "data"
+
+
+def test_clients_share_repo_fetch():
+    """Test that two clients fetching one uncached repo send one request."""
+    requests = []
+    release = threading.Event()
+
+    def handler(request):
+        requests.append(request.url.path)
+        release.wait(1)
+        return httpx.Response(200, json={"full_name": "octo/repo"})
+
+    clients = [GitHubClient("test_token", use_cache=False) for _ in range(2)]
+    for client in clients:
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    shared_before = singleflight._flights.shared
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(client.get_repo, "octo", "repo") for client in clients]
+        while singleflight._flights.shared == shared_before:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [{"full_name": "octo/repo"}] * 2
+    assert requests == ["/repos/octo/repo"]
+
+
+def test_async_client_shares_repo_fetch():
+    """Test that concurrent async lookups of one repo send one request."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"full_name": "octo/repo"})
+
+    async def main():
+        client = AsyncGitHubClient("test_token", use_cache=False)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await asyncio.gather(*(client.get_repo("octo", "repo") for _ in range(3)))
+        finally:
+            await client.client.aclose()
+
+    assert asyncio.run(main()) == [{"full_name": "octo/repo"}] * 3
+    assert requests == ["/repos/octo/repo"]
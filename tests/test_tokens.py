@@ -0,0 +1,95 @@
+"""Tests for token pool."""
+
+from unittest.mock import MagicMock, Mock
+
+import httpx
+import pytest
+
+from gfi.github import GitHubClient
+from gfi.ratelimit import get_scheduler
+from gfi.tokens import TokenPool
+
+
+def test_pool_from_env(monkeypatch):
+    """Test that GITHUB_TOKENS takes precedence over GITHUB_TOKEN."""
+    monkeypatch.setenv("GITHUB_TOKEN", "single")
+    monkeypatch.setenv("GITHUB_TOKENS", "tok-a, tok-b,,tok-a")
+
+    pool = TokenPool.from_env()
+
+    assert pool.tokens == ["tok-a", "tok-b"]
+
+
+def test_pool_from_env_missing(monkeypatch):
+    """Test that no tokens means no pool."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKENS", raising=False)
+
+    assert TokenPool.from_env() is None
+
+
+def test_pool_picks_token_with_most_headroom():
+    """Test that requests go to the token with the most remaining quota."""
+    pool = TokenPool(["tok-a", "tok-b"])
+    get_scheduler("tok-a").update(
+        "search",
+        httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Remaining": "3",
+                "X-RateLimit-Reset": "9999999999",
+            },
+        ),
+    )
+
+    assert pool.checkout("search") == "tok-b"
+    # Core budgets are untouched, so ties fall to the least used token
+    assert pool.checkout("core") == "tok-a"
+
+
+def test_pool_round_robins_on_ties():
+    """Test that equal headroom alternates between tokens."""
+    pool = TokenPool(["tok-a", "tok-b"])
+
+    picks = [pool.checkout("core") for _ in range(4)]
+
+    assert sorted(picks) == ["tok-a", "tok-a", "tok-b", "tok-b"]
+
+
+def test_pool_stats_mask_tokens():
+    """Test that stats report usage without leaking tokens."""
+    pool = TokenPool(["ghp_secret1234", "ghp_secret5678"])
+    pool.checkout("search")
+
+    stats = pool.get_stats()
+
+    assert [s["slot"] for s in stats] == [0, 1]
+    assert sum(s["requests"].get("search", 0) for s in stats) == 1
+    assert "secret" not in str(stats)
+    assert "1234" not in str(stats)
+
+
+def test_client_sends_pooled_token():
+    """Test that GitHubClient authorizes each request with the chosen token."""
+    mock_client = MagicMock()
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = {"login": "me"}
+    mock_client.get.return_value = response
+
+    client = GitHubClient(["tok-a", "tok-b"], use_cache=False)
+    client.client = mock_client
+
+    client.get_user()
+    client.get_user()
+
+    auth = [call[1]["headers"]["Authorization"] for call in mock_client.get.call_args_list]
+    assert sorted(auth) == ["Bearer tok-a", "Bearer tok-b"]
+    assert sum(sum(s["requests"].values()) for s in client.get_token_stats()) == 2
+
+
+def test_empty_pool_rejected():
+    """Test that a pool needs at least one token."""
+    with pytest.raises(ValueError):
+        TokenPool(["", " "])
@@ -0,0 +1,83 @@
+"""Tests for shared HTTP transports."""
+
+import httpcore
+import pytest
+
+from gfi import transport
+from gfi.github import GitHubClient
+from gfi.gitlab import GitLabClient
+from gfi.graphql import GitHubGraphQLClient
+
+
+@pytest.fixture(autouse=True)
+def fresh_transports():
+    transport.close_transports()
+    yield
+    transport.close_transports()
+
+
+def test_clients_share_transport_per_host():
+    """Test that every client for a host uses one pooled transport."""
+    rest = GitHubClient("token-a", use_cache=False)
+    other = GitHubClient("token-b", use_cache=False)
+    graphql = GitHubGraphQLClient("token-a", use_cache=False)
+    gitlab = GitLabClient(use_cache=False)
+
+    assert rest.client._transport is other.client._transport is graphql.client._transport
+    assert gitlab.client._transport is not rest.client._transport
+    # Tokens stay per client
+    assert rest.client.headers["Authorization"] != other.client.headers["Authorization"]
+
+
+def test_shared_transport_honours_proxy_env(monkeypatch):
+    """Test that shared transports go through HTTPS_PROXY like a plain httpx.Client."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setenv("NO_PROXY", "gitlab.com")
+
+    proxied = GitHubClient("token-a", use_cache=False).client._transport
+    direct = GitLabClient(use_cache=False).client._transport
+
+    assert isinstance(proxied._pool, httpcore.HTTPProxy)
+    assert proxied._pool._proxy_url.host == b"proxy.example"
+    assert not isinstance(direct._pool, httpcore.HTTPProxy)
+
+    # A different proxy gets its own pool
+    monkeypatch.delenv("HTTPS_PROXY")
+    assert GitHubClient("token-a", use_cache=False).client._transport is not proxied
+
+
+def test_closing_client_keeps_pool_open():
+    """Test that a closed client doesn't tear down connections other clients use."""
+    with GitHubClient("token-a", use_cache=False) as client:
+        shared = client.client._transport
+
+    assert client.client.is_closed
+    assert GitHubClient("token-a", use_cache=False).client._transport is shared
+
+
+def test_close_transports_starts_fresh_pool(monkeypatch):
+    """Test that pool settings apply to transports created after close_transports()."""
+    shutdowns = []
+    first = transport.get_transport("https://api.github.com/user")
+    monkeypatch.setattr(first, "shutdown", lambda: shutdowns.append(first))
+
+    transport.configure_pool(max_connections=5)
+    transport.close_transports()
+    second = transport.get_transport("https://api.github.com/user")
+
+    assert shutdowns == [first]
+    assert second is not first
+    assert transport.pool_limits().max_connections == 5
+    transport.configure_pool(max_connections=20)
+
+
+def test_http2_requires_h2(monkeypatch):
+    """Test that HTTP/2 is only negotiated when h2 is installed."""
+    monkeypatch.setattr(transport, "HTTP2_AVAILABLE", False)
+    assert not transport.http2_enabled()
+
+    monkeypatch.setattr(transport, "HTTP2_AVAILABLE", True)
+    transport.configure_pool(http2=False)
+    assert not transport.http2_enabled()
+    transport.configure_pool(http2=True)
+    assert transport.http2_enabled()
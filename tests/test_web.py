@@ -0,0 +1,71 @@
+"""Tests for the web interface."""
+
+import time
+
+import httpx
+import pytest
+
+from gfi.github import GITHUB_API_URL, GitHubClient, UserProfile
+from gfi.ratelimit import RateLimitExceeded, get_scheduler
+from gfi.resilience import get_breaker
+from web import app as web_app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "fake_token")
+    monkeypatch.setattr(web_app, "_token_pool", None)
+    return web_app.app.test_client()
+
+
+def test_find_returns_503_while_circuit_is_open(client):
+    """Test that an open circuit breaker is reported as upstream trouble, not a missing user."""
+    breaker = get_breaker(httpx.URL(GITHUB_API_URL).host)
+    for _ in range(breaker.FAILURE_THRESHOLD):
+        breaker.record_failure()
+
+    response = client.post("/api/find", json={"username": "dev"})
+
+    assert response.status_code == 503
+    assert "trouble" in response.get_json()["error"]
+
+
+def test_find_returns_503_when_search_budget_is_exhausted(client, monkeypatch):
+    """Test that an exhausted rate limit isn't swallowed by the search loop."""
+    profile = UserProfile(
+        username="dev", languages=["Python"], topics=[], starred_count=1, contributed_count=0
+    )
+    monkeypatch.setattr(web_app.ProfileAnalyzer, "build_profile", lambda self, username: profile)
+
+    def search_issues(self, query, per_page=30):
+        raise RateLimitExceeded("search", 1200)
+
+    monkeypatch.setattr(GitHubClient, "search_issues", search_issues)
+
+    response = client.post("/api/find", json={"username": "dev"})
+
+    assert response.status_code == 503
+
+
+def test_find_answers_503_instead_of_waiting_for_budget(client, monkeypatch):
+    """Test that a web request doesn't sleep out an exhausted budget."""
+    profile = UserProfile(
+        username="dev", languages=["Python"], topics=[], starred_count=1, contributed_count=0
+    )
+    monkeypatch.setattr(web_app.ProfileAnalyzer, "build_profile", lambda self, username: profile)
+    scheduler = get_scheduler("fake_token")
+    scheduler.bucket("search").update(0, time.time() + 60, 30)
+    monkeypatch.setattr(scheduler, "sleep", lambda seconds: pytest.fail(f"slept {seconds}s"))
+
+    response = client.post("/api/find", json={"username": "dev"})
+
+    assert response.status_code == 503
+
+
+def test_stats_report_token_slots_not_token_material(client):
+    """Test that the unauthenticated stats endpoint doesn't expose token suffixes."""
+    response = client.get("/api/stats")
+
+    assert response.status_code == 200
+    assert [t["slot"] for t in response.get_json()["tokens"]] == [0]
+    assert "oken" not in str(response.get_json()["tokens"])
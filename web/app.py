@@ -11,10 +11,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from gfi.github import GitHubClient
 from gfi.analyzer import ProfileAnalyzer
 from gfi.scorer import IssueScorer
-import os
+from gfi.tokens import TokenPool
+from gfi.cache import get_tier_stats
+from gfi.ratelimit import RateLimitExceeded
+from gfi.resilience import CircuitOpenError, get_resilience_stats
 
 app = Flask(__name__)
 
+# Longest a request waits for rate limit budget before answering 503; well
+# under gunicorn's 30s worker timeout
+MAX_WAIT_SECONDS = 5
+
+_token_pool = None
+
+
+def get_token_pool():
+    """Get the process-wide token pool (GITHUB_TOKENS or GITHUB_TOKEN)."""
+    global _token_pool
+    if _token_pool is None:
+        _token_pool = TokenPool.from_env()
+    return _token_pool
+
 
 @app.route('/')
 def index():
@@ -33,19 +50,21 @@ def find_issues():
     if not username:
         return jsonify({'error': 'Username required'}), 400
 
-    # Use demo token for instant mode (read-only, rate-limited)
+    # Use demo tokens for instant mode (read-only, rate-limited)
     # Users should still run CLI with their own token for full features
-    token = os.getenv('GITHUB_TOKEN')
-    if not token:
+    token_pool = get_token_pool()
+    if not token_pool:
         return jsonify({'error': 'Service temporarily unavailable'}), 503
 
+    client = GitHubClient(token_pool, max_wait=MAX_WAIT_SECONDS)
     try:
-        client = GitHubClient(token)
         analyzer = ProfileAnalyzer(client)
 
         # Build quick profile
         try:
             profile = analyzer.build_profile(username)
+        except (CircuitOpenError, RateLimitExceeded):
+            raise  # Upstream trouble, not a missing user
         except Exception as e:
             return jsonify({'error': f'Username "{username}" not found or profile is private'}), 404
 
@@ -81,47 +100,39 @@ def find_issues():
                 query = f'is:issue label:"{label}" language:{lang} state:open'
 
                 try:
-                    response = client.client.get(
-                        "https://api.github.com/search/issues",
-                        params={
-                            'q': query,
-                            'sort': 'created',
-                            'order': 'desc',
-                            'per_page': 20
-                        }
-                    )
-
-                    if response.status_code == 200:
-                        items = response.json().get('items', [])
-
-                        for item in items:
-                            # Convert to Issue object
-                            from gfi.github import Issue
-                            try:
-                                issue = Issue(
-                                    number=item['number'],
-                                    title=item['title'],
-                                    url=item['url'],
-                                    html_url=item['html_url'],
-                                    body=item.get('body'),
-                                    state=item['state'],
-                                    created_at=datetime.fromisoformat(item['created_at'].rstrip("Z")),
-                                    updated_at=datetime.fromisoformat(item['updated_at'].rstrip("Z")),
-                                    labels=[l['name'] for l in item.get('labels', [])],
-                                    repo_owner=item['repository_url'].split('/')[-2],
-                                    repo_name=item['repository_url'].split('/')[-1],
-                                    repo_stars=0,  # Will score anyway
-                                    repo_language=lang,
-                                    repo_description=None,
-                                    comments=item.get('comments', 0),
-                                    author=item.get('user', {}).get('login', 'unknown')
-                                )
-                                all_issues.append(issue)
-                            except Exception as e:
-                                # Silently skip malformed issues
-                                pass
-                    # API errors are logged by outer exception handler
-
+                    # Goes through the shared rate limit scheduler, so concurrent
+                    # visitors queue briefly for search budget (503 past MAX_WAIT_SECONDS)
+                    items = client.search_issues(query, per_page=20).get('items', [])
+
+                    for item in items:
+                        # Convert to Issue object
+                        from gfi.github import Issue
+                        try:
+                            issue = Issue(
+                                number=item['number'],
+                                title=item['title'],
+                                url=item['url'],
+                                html_url=item['html_url'],
+                                body=item.get('body'),
+                                state=item['state'],
+                                created_at=datetime.fromisoformat(item['created_at'].rstrip("Z")),
+                                updated_at=datetime.fromisoformat(item['updated_at'].rstrip("Z")),
+                                labels=[label['name'] for label in item.get('labels', [])],
+                                repo_owner=item['repository_url'].split('/')[-2],
+                                repo_name=item['repository_url'].split('/')[-1],
+                                repo_stars=0,  # Will score anyway
+                                repo_language=lang,
+                                repo_description=None,
+                                comments=item.get('comments', 0),
+                                author=item.get('user', {}).get('login', 'unknown')
+                            )
+                            all_issues.append(issue)
+                        except Exception:
+                            # Silently skip malformed issues
+                            pass
+
+                except (CircuitOpenError, RateLimitExceeded):
+                    raise
                 except Exception as e:
                     # Silently skip failed searches
                     continue
@@ -144,6 +155,7 @@ def find_issues():
         # Vary threshold slightly by user for diversity
         threshold = 0.25 + (user_hash % 10) * 0.01  # 0.25-0.34
 
+        scorer.prefetch(unique_issues[:40])
         for issue in unique_issues[:40]:
             score = scorer.score_issue(issue)
 
@@ -168,10 +180,31 @@ def find_issues():
             'issues': scored_issues[:result_count],
         })
 
+    except CircuitOpenError as e:
+        # GitHub keeps failing - answer fast instead of queueing more requests
+        print(f"Error: {e}")  # Server logs
+        message = 'GitHub is having trouble right now. Please try again in a minute.'
+        return jsonify({'error': message}), 503
+    except RateLimitExceeded as e:
+        # Search budget is used up for longer than a visitor should wait
+        print(f"Error: {e}")  # Server logs
+        message = 'Too many searches right now. Please try again in a few minutes.'
+        return jsonify({'error': message}), 503
     except Exception as e:
         # Log the error but don't expose internal details
         print(f"Error: {e}")  # Server logs
         return jsonify({'error': 'Failed to fetch issues. Please try again later.'}), 500
+    finally:
+        # Connections stay pooled for the next request
+        client.close()
+
+
+@app.route('/api/stats')
+def stats():
+    """Per-slot API usage and remaining quota, upstream health per host, and cache tier hits."""
+    token_pool = get_token_pool()
+    tokens = token_pool.get_stats() if token_pool else []
+    return jsonify({'tokens': tokens, 'hosts': get_resilience_stats(), 'cache': get_tier_stats()})
 
 
 if __name__ == '__main__':